@@ -0,0 +1,5 @@
+"""async def 엔드포인트 (settings.async_endpoints=True일 때 사용)
+
+경로와 응답은 app/api의 동기 라우터와 같다. 인증(auth) 라우터는 비밀번호
+해싱이 CPU 작업이라 이벤트 루프를 막지 않도록 동기 라우터를 그대로 쓴다.
+"""
@@ -0,0 +1,135 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.core.async_dependencies import (
+    ArticleServiceRunner,
+    get_article_service_async,
+    get_current_user_async,
+    get_current_user_optional_async,
+)
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.user_model import User
+from app.dtos.request import ArticleCreateRequest, ArticleUpdateRequest
+from app.dtos.response import ArticleResponseWrapper, SingleArticleResponseWrapper
+
+router = APIRouter(tags=["articles"])
+
+
+@router.get("/articles", status_code=200, response_model=ArticleResponseWrapper)
+async def get_articles(
+    author: str = None,
+    tag: str = None,
+    favorited: str = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
+    current_user: User | None = Depends(get_current_user_optional_async),
+    run: ArticleServiceRunner = Depends(get_article_service_async),
+):
+    current_user_id = current_user.id if current_user else None
+    return await run(
+        lambda service: service.get_articles(
+            author=author,
+            tag=tag,
+            favorited=favorited,
+            current_user_id=current_user_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    )
+
+
+@router.get("/articles/feed", status_code=200, response_model=ArticleResponseWrapper)
+async def get_feed(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user_async),
+    run: ArticleServiceRunner = Depends(get_article_service_async),
+):
+    return await run(
+        lambda service: service.get_feed(
+            current_user_id=current_user.id, limit=limit, offset=offset, cursor=cursor
+        )
+    )
+
+
+@router.post("/articles", status_code=201, response_model=SingleArticleResponseWrapper)
+async def create_article(
+    request: ArticleCreateRequest,
+    current_user: User = Depends(get_current_user_async),
+    run: ArticleServiceRunner = Depends(get_article_service_async),
+):
+    article_dto = await run(
+        lambda service: service.create_article(
+            title=request.article.title,
+            description=request.article.description,
+            body=request.article.body,
+            author=current_user,
+            tag_list=request.article.tagList,
+        )
+    )
+    return {"article": article_dto}
+
+
+@router.get("/articles/{slug}", status_code=200, response_model=SingleArticleResponseWrapper)
+async def get_article(
+    slug: str,
+    current_user: User | None = Depends(get_current_user_optional_async),
+    run: ArticleServiceRunner = Depends(get_article_service_async),
+):
+    current_user_id = current_user.id if current_user else None
+    article_dto = await run(
+        lambda service: service.get_article_by_slug(slug, current_user_id=current_user_id)
+    )
+    return {"article": article_dto}
+
+
+@router.put("/articles/{slug}", status_code=200, response_model=SingleArticleResponseWrapper)
+async def update_article(
+    slug: str,
+    request: ArticleUpdateRequest,
+    current_user: User = Depends(get_current_user_async),
+    run: ArticleServiceRunner = Depends(get_article_service_async),
+):
+    article_dto = await run(
+        lambda service: service.update_article(
+            slug=slug,
+            user=current_user,
+            title=request.article.title,
+            description=request.article.description,
+            body=request.article.body,
+        )
+    )
+    return {"article": article_dto}
+
+
+@router.delete("/articles/{slug}", status_code=204)
+async def delete_article(
+    slug: str,
+    current_user: User = Depends(get_current_user_async),
+    run: ArticleServiceRunner = Depends(get_article_service_async),
+):
+    await run(lambda service: service.delete_article(slug=slug, user=current_user))
+
+
+@router.post("/articles/{slug}/favorite", status_code=200, response_model=SingleArticleResponseWrapper)
+async def favorite_article(
+    slug: str,
+    current_user: User = Depends(get_current_user_async),
+    run: ArticleServiceRunner = Depends(get_article_service_async),
+):
+    article_dto = await run(lambda service: service.favorite_article(slug=slug, user=current_user))
+    return {"article": article_dto}
+
+
+@router.delete("/articles/{slug}/favorite", status_code=200, response_model=SingleArticleResponseWrapper)
+async def unfavorite_article(
+    slug: str,
+    current_user: User = Depends(get_current_user_async),
+    run: ArticleServiceRunner = Depends(get_article_service_async),
+):
+    article_dto = await run(
+        lambda service: service.unfavorite_article(slug=slug, user=current_user)
+    )
+    return {"article": article_dto}
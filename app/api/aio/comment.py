@@ -0,0 +1,59 @@
+"""Comment API - 댓글 관련 엔드포인트 (async)"""
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.async_dependencies import (
+    CommentServiceRunner,
+    get_comment_service_async,
+    get_current_user_async,
+    get_current_user_optional_async,
+)
+from app.core.pagination import MAX_PAGE_SIZE
+from app.models.user_model import User
+from app.dtos.request import CommentCreateRequest
+from app.dtos.response import CommentResponseWrapper, SingleCommentResponseWrapper
+
+router = APIRouter(tags=["comments"])
+
+
+@router.post("/articles/{slug}/comments", status_code=200, response_model=SingleCommentResponseWrapper)
+async def create_comment(
+    slug: str,
+    request: CommentCreateRequest,
+    current_user: User = Depends(get_current_user_async),
+    run: CommentServiceRunner = Depends(get_comment_service_async),
+):
+    comment_dto = await run(
+        lambda service: service.create_comment(
+            slug=slug, body=request.comment.body, user=current_user
+        )
+    )
+    return {"comment": comment_dto}
+
+
+@router.get("/articles/{slug}/comments", status_code=200, response_model=CommentResponseWrapper)
+async def get_comments(
+    slug: str,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    current_user: User | None = Depends(get_current_user_optional_async),
+    run: CommentServiceRunner = Depends(get_comment_service_async),
+):
+    current_user_id = current_user.id if current_user else None
+    return await run(
+        lambda service: service.get_comments(
+            slug=slug, current_user_id=current_user_id, limit=limit, cursor=cursor
+        )
+    )
+
+
+@router.delete("/articles/{slug}/comments/{comment_id}", status_code=204)
+async def delete_comment(
+    slug: str,
+    comment_id: int,
+    current_user: User = Depends(get_current_user_async),
+    run: CommentServiceRunner = Depends(get_comment_service_async),
+):
+    await run(
+        lambda service: service.delete_comment(slug=slug, comment_id=comment_id, user=current_user)
+    )
@@ -0,0 +1,98 @@
+"""Profile API - 프로필 관련 엔드포인트 (async)"""
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.async_dependencies import (
+    ProfileServiceRunner,
+    get_current_user_async,
+    get_current_user_optional_async,
+    get_profile_service_async,
+)
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.user_model import User
+from app.dtos.response import ProfileListResponseWrapper, ProfileResponseWrapper
+
+router = APIRouter(tags=["profiles"])
+
+
+@router.get("/profiles", status_code=200, response_model=ProfileListResponseWrapper)
+async def get_profiles(
+    usernames: str,
+    current_user: User | None = Depends(get_current_user_optional_async),
+    run: ProfileServiceRunner = Depends(get_profile_service_async),
+):
+    current_user_id = current_user.id if current_user else None
+    return await run(
+        lambda service: service.get_profiles(
+            usernames.split(","), current_user_id=current_user_id
+        )
+    )
+
+
+@router.get("/profiles/{username}", status_code=200, response_model=ProfileResponseWrapper)
+async def get_profile(
+    username: str,
+    current_user: User | None = Depends(get_current_user_optional_async),
+    run: ProfileServiceRunner = Depends(get_profile_service_async),
+):
+    current_user_id = current_user.id if current_user else None
+    profile = await run(
+        lambda service: service.get_profile(username, current_user_id=current_user_id)
+    )
+    return {"profile": profile}
+
+
+@router.get(
+    "/profiles/{username}/followers", status_code=200, response_model=ProfileListResponseWrapper
+)
+async def get_followers(
+    username: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    current_user: User | None = Depends(get_current_user_optional_async),
+    run: ProfileServiceRunner = Depends(get_profile_service_async),
+):
+    current_user_id = current_user.id if current_user else None
+    return await run(
+        lambda service: service.get_followers(
+            username, current_user_id=current_user_id, limit=limit, cursor=cursor
+        )
+    )
+
+
+@router.get(
+    "/profiles/{username}/following", status_code=200, response_model=ProfileListResponseWrapper
+)
+async def get_following(
+    username: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    current_user: User | None = Depends(get_current_user_optional_async),
+    run: ProfileServiceRunner = Depends(get_profile_service_async),
+):
+    current_user_id = current_user.id if current_user else None
+    return await run(
+        lambda service: service.get_following(
+            username, current_user_id=current_user_id, limit=limit, cursor=cursor
+        )
+    )
+
+
+@router.post("/profiles/{username}/follow", status_code=200, response_model=ProfileResponseWrapper)
+async def follow_user(
+    username: str,
+    current_user: User = Depends(get_current_user_async),
+    run: ProfileServiceRunner = Depends(get_profile_service_async),
+):
+    profile = await run(lambda service: service.follow_user(current_user, username))
+    return {"profile": profile}
+
+
+@router.delete("/profiles/{username}/follow", status_code=200, response_model=ProfileResponseWrapper)
+async def unfollow_user(
+    username: str,
+    current_user: User = Depends(get_current_user_async),
+    run: ProfileServiceRunner = Depends(get_profile_service_async),
+):
+    profile = await run(lambda service: service.unfollow_user(current_user, username))
+    return {"profile": profile}
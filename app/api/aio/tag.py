@@ -0,0 +1,25 @@
+"""Tag API Router (async)"""
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+
+from app.core.async_dependencies import TagServiceRunner, get_tag_service_async
+from app.core.etag import etag_of, is_not_modified, not_modified
+from app.core.pagination import MAX_PAGE_SIZE
+
+router = APIRouter(tags=["tags"])
+
+
+@router.get("/tags", status_code=200)
+async def get_tags(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    if_none_match: str | None = Header(None),
+    run: TagServiceRunner = Depends(get_tag_service_async),
+):
+    """Get tags ordered by popularity"""
+    body = {"tags": await run(lambda service: service.get_all_tags(limit))}
+    etag = etag_of(body)
+    if is_not_modified(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return body
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from app.core.dependencies import get_article_service, get_current_user, get_current_user_optional
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.replica import get_read_article_service
 from app.models.user_model import User
 from app.dtos.request import ArticleCreateRequest, ArticleUpdateRequest
 from app.dtos.response import ArticleResponseWrapper, SingleArticleResponseWrapper
@@ -14,11 +16,35 @@ def get_articles(
     author: str = None,
     tag: str = None,
     favorited: str = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
     current_user: User | None = Depends(get_current_user_optional),
-    service: ArticleService = Depends(get_article_service),
+    service: ArticleService = Depends(get_read_article_service),
 ):
     current_user_id = current_user.id if current_user else None
-    return service.get_articles(author=author, tag=tag, favorited=favorited, current_user_id=current_user_id)
+    return service.get_articles(
+        author=author,
+        tag=tag,
+        favorited=favorited,
+        current_user_id=current_user_id,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
+
+
+@router.get("/articles/feed", status_code=200, response_model=ArticleResponseWrapper)
+def get_feed(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user),
+    service: ArticleService = Depends(get_article_service),
+):
+    return service.get_feed(
+        current_user_id=current_user.id, limit=limit, offset=offset, cursor=cursor
+    )
 
 
 @router.post("/articles", status_code=201, response_model=SingleArticleResponseWrapper)
@@ -41,7 +67,7 @@ def create_article(
 def get_article(
     slug: str,
     current_user: User | None = Depends(get_current_user_optional),
-    service: ArticleService = Depends(get_article_service),
+    service: ArticleService = Depends(get_read_article_service),
 ):
     current_user_id = current_user.id if current_user else None
     article_dto = service.get_article_by_slug(slug, current_user_id=current_user_id)
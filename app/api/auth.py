@@ -1,6 +1,12 @@
-from fastapi import APIRouter, Depends
-
-from app.core.dependencies import get_current_user, get_user_service
+from fastapi import APIRouter, Depends, Request
+
+from app.core.dependencies import (
+    get_current_token,
+    get_current_user,
+    get_login_throttle,
+    get_user_service,
+)
+from app.core.rate_limit import LoginThrottle
 from app.models.user_model import User
 from app.dtos.request import UserRegisterRequest, UserLoginRequest, UserUpdateRequest
 from app.dtos.response import UserResponseWrapper
@@ -16,7 +22,16 @@ def register(request: UserRegisterRequest, service: UserService = Depends(get_us
 
 
 @router.post("/users/login", status_code=200, response_model=UserResponseWrapper)
-def login(request: UserLoginRequest, service: UserService = Depends(get_user_service)):
+def login(
+    request: UserLoginRequest,
+    http_request: Request,
+    throttle: LoginThrottle | None = Depends(get_login_throttle),
+    service: UserService = Depends(get_user_service),
+):
+    # Argon2 검증 전에 이메일/IP별 시도 횟수를 먼저 확인
+    if throttle is not None:
+        client_ip = http_request.client.host if http_request.client else None
+        throttle.check(request.user.email, client_ip)
     user_response = service.login_user(request.user.email, request.user.password)
     return {"user": user_response}
 
@@ -24,9 +39,10 @@ def login(request: UserLoginRequest, service: UserService = Depends(get_user_ser
 @router.get("/user", status_code=200, response_model=UserResponseWrapper)
 def get_current_user_info(
     current_user: User = Depends(get_current_user),
+    token: str = Depends(get_current_token),
     service: UserService = Depends(get_user_service),
 ):
-    user_response = service.get_user_profile(current_user)
+    user_response = service.get_user_profile(current_user, token)
     return {"user": user_response}
 
 
@@ -34,7 +50,8 @@ def get_current_user_info(
 def update_user(
     request: UserUpdateRequest,
     current_user: User = Depends(get_current_user),
+    token: str = Depends(get_current_token),
     service: UserService = Depends(get_user_service),
 ):
-    user_response = service.update_user(current_user, request.user)
+    user_response = service.update_user(current_user, request.user, token)
     return {"user": user_response}
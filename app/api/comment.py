@@ -1,8 +1,10 @@
 """Comment API - 댓글 관련 엔드포인트"""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
-from app.core.dependencies import get_comment_service, get_current_user
+from app.core.dependencies import get_comment_service, get_current_user, get_current_user_optional
+from app.core.pagination import MAX_PAGE_SIZE
+from app.core.replica import get_read_comment_service
 from app.models.user_model import User
 from app.dtos.request import CommentCreateRequest
 from app.dtos.response import CommentResponseWrapper, SingleCommentResponseWrapper
@@ -23,9 +25,17 @@ def create_comment(
 
 
 @router.get("/articles/{slug}/comments", status_code=200, response_model=CommentResponseWrapper)
-def get_comments(slug: str, service: CommentService = Depends(get_comment_service)):
-    comments = service.get_comments(slug=slug)
-    return {"comments": comments}
+def get_comments(
+    slug: str,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    current_user: User | None = Depends(get_current_user_optional),
+    service: CommentService = Depends(get_read_comment_service),
+):
+    current_user_id = current_user.id if current_user else None
+    return service.get_comments(
+        slug=slug, current_user_id=current_user_id, limit=limit, cursor=cursor
+    )
 
 
 @router.delete("/articles/{slug}/comments/{comment_id}", status_code=204)
@@ -1,26 +1,70 @@
 """Profile API - 프로필 관련 엔드포인트"""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from app.core.dependencies import get_current_user, get_current_user_optional, get_profile_service
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.replica import get_read_profile_service
 from app.models.user_model import User
-from app.dtos.response import ProfileResponseWrapper
+from app.dtos.response import ProfileListResponseWrapper, ProfileResponseWrapper
 from app.services.profile_service import ProfileService
 
 router = APIRouter(tags=["profiles"])
 
 
+@router.get("/profiles", status_code=200, response_model=ProfileListResponseWrapper)
+def get_profiles(
+    usernames: str,
+    current_user: User | None = Depends(get_current_user_optional),
+    service: ProfileService = Depends(get_read_profile_service),
+):
+    current_user_id = current_user.id if current_user else None
+    return service.get_profiles(usernames.split(","), current_user_id=current_user_id)
+
+
 @router.get("/profiles/{username}", status_code=200, response_model=ProfileResponseWrapper)
 def get_profile(
     username: str,
     current_user: User | None = Depends(get_current_user_optional),
-    service: ProfileService = Depends(get_profile_service),
+    service: ProfileService = Depends(get_read_profile_service),
 ):
     current_user_id = current_user.id if current_user else None
     profile = service.get_profile(username, current_user_id=current_user_id)
     return {"profile": profile}
 
 
+@router.get(
+    "/profiles/{username}/followers", status_code=200, response_model=ProfileListResponseWrapper
+)
+def get_followers(
+    username: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    current_user: User | None = Depends(get_current_user_optional),
+    service: ProfileService = Depends(get_read_profile_service),
+):
+    current_user_id = current_user.id if current_user else None
+    return service.get_followers(
+        username, current_user_id=current_user_id, limit=limit, cursor=cursor
+    )
+
+
+@router.get(
+    "/profiles/{username}/following", status_code=200, response_model=ProfileListResponseWrapper
+)
+def get_following(
+    username: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    current_user: User | None = Depends(get_current_user_optional),
+    service: ProfileService = Depends(get_read_profile_service),
+):
+    current_user_id = current_user.id if current_user else None
+    return service.get_following(
+        username, current_user_id=current_user_id, limit=limit, cursor=cursor
+    )
+
+
 @router.post("/profiles/{username}/follow", status_code=200, response_model=ProfileResponseWrapper)
 def follow_user(
     username: str,
@@ -1,15 +1,26 @@
 """Tag API Router"""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
 
-from app.core.dependencies import get_tag_service
+from app.core.etag import etag_of, is_not_modified, not_modified
+from app.core.pagination import MAX_PAGE_SIZE
+from app.core.replica import get_read_tag_service
 from app.services.tag_service import TagService
 
 router = APIRouter(tags=["tags"])
 
 
 @router.get("/tags", status_code=200)
-def get_tags(service: TagService = Depends(get_tag_service)):
-    """Get all tags"""
-    tags = service.get_all_tags()
-    return {"tags": tags}
+def get_tags(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    if_none_match: str | None = Header(None),
+    service: TagService = Depends(get_read_tag_service),
+):
+    """Get tags ordered by popularity"""
+    body = {"tags": service.get_all_tags(limit)}
+    etag = etag_of(body)
+    if is_not_modified(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return body
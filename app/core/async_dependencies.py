@@ -0,0 +1,113 @@
+"""비동기 엔드포인트용 의존성
+
+저장소/서비스는 동기 구현 하나만 유지하고, `AsyncSession.run_sync`로 실행한다.
+run_sync 안의 DB 호출은 aiosqlite 드라이버에서 await 되므로 요청이 스레드풀
+스레드를 점유하지 않는다.
+"""
+
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from fastapi import Depends, Header
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import Settings, get_settings
+from app.core.database import get_async_session
+from app.core.dependencies import (
+    build_article_service,
+    build_comment_service,
+    build_profile_service,
+    build_tag_service,
+    token_from_authorization,
+    verify_user_token,
+)
+from app.core.exceptions import UnauthorizedException, UserNotFoundException
+from app.core.identity_cache import identity_cache
+from app.models.user_model import User
+from app.repositories.user_repository import UserRepository
+from app.services.article_service import ArticleService
+from app.services.comment_service import CommentService
+from app.services.profile_service import ProfileService
+from app.services.tag_service import TagService
+
+ServiceT = TypeVar("ServiceT")
+ResultT = TypeVar("ResultT")
+
+
+class AsyncServiceRunner(Generic[ServiceT]):
+    """동기 서비스를 AsyncSession 위에서 실행하는 어댑터
+
+    `await runner(lambda service: service.get_articles(...))`
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        settings: Settings,
+        build: Callable[[Session, Settings], ServiceT],
+    ):
+        self._session = session
+        self._settings = settings
+        self._build = build
+
+    async def __call__(self, call: Callable[[ServiceT], ResultT]) -> ResultT:
+        return await self._session.run_sync(
+            lambda session: call(self._build(session, self._settings))
+        )
+
+
+def _runner(build: Callable[[Session, Settings], ServiceT]):
+    def dependency(
+        session: AsyncSession = Depends(get_async_session),
+        settings: Settings = Depends(get_settings),
+    ) -> AsyncServiceRunner[ServiceT]:
+        return AsyncServiceRunner(session, settings, build)
+
+    return dependency
+
+
+# Service
+get_article_service_async = _runner(build_article_service)
+get_comment_service_async = _runner(build_comment_service)
+get_profile_service_async = _runner(build_profile_service)
+get_tag_service_async = _runner(build_tag_service)
+
+ArticleServiceRunner = AsyncServiceRunner[ArticleService]
+CommentServiceRunner = AsyncServiceRunner[CommentService]
+ProfileServiceRunner = AsyncServiceRunner[ProfileService]
+TagServiceRunner = AsyncServiceRunner[TagService]
+
+
+# Auth
+async def get_current_user_async(
+    authorization: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+) -> User:
+    token = token_from_authorization(authorization)
+    user = identity_cache.get(token)
+    if user is not None:
+        return user
+
+    payload = verify_user_token(token)
+    user = await session.run_sync(
+        lambda sync_session: UserRepository(sync_session).get_by_id(payload["user_id"])
+    )
+    if user is None:
+        raise UserNotFoundException()
+
+    identity_cache.put(token, user, payload["exp"])
+    return user
+
+
+async def get_current_user_optional_async(
+    authorization: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+) -> User | None:
+    if authorization is None:
+        return None
+
+    try:
+        return await get_current_user_async(authorization, session)
+    except UnauthorizedException:
+        return None
@@ -0,0 +1,99 @@
+"""프로세스 내 캐시
+
+DB에서 읽은 값을 담는 캐시는 엔진(DB)별로 따로 둔다. 테스트처럼 한 프로세스에서
+여러 DB를 쓰더라도 다른 DB의 id가 섞이지 않고, 엔진이 사라지면 캐시도 함께 사라진다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+T = TypeVar("T")
+
+
+class LRUCache(Generic[K, V]):
+    """최대 `maxsize`개를 유지하고 가장 오래 쓰지 않은 항목부터 버리는 캐시"""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put_many(self, items: Iterable[tuple[K, V]]) -> None:
+        with self._lock:
+            for key, value in items:
+                self._data[key] = value
+                self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache(Generic[K, V]):
+    """항목마다 `ttl`초 동안만 유효한 캐시"""
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self._ttl = ttl
+        self._clock = clock
+        self._data: dict[K, tuple[float, V]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                return None
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = (self._clock() + self._ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class PerEngine(Generic[T]):
+    """엔진마다 하나씩 만들어지는 캐시 보관소"""
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._caches: WeakKeyDictionary[Engine, T] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, bind: Engine) -> T:
+        with self._lock:
+            cache = self._caches.get(bind)
+            if cache is None:
+                cache = self._caches[bind] = self._factory()
+            return cache
+
+    def values(self) -> list[T]:
+        """지금 살아 있는 엔진들의 캐시 (primary 쓰기로 복제본 캐시까지 비울 때)"""
+        with self._lock:
+            return list(self._caches.values())
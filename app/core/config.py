@@ -0,0 +1,73 @@
+"""애플리케이션 설정
+
+환경변수(또는 .env)로 덮어쓸 수 있으며, `get_settings()`로 조회한다.
+테스트에서는 `app.dependency_overrides[get_settings]`로 교체할 수 있다.
+"""
+
+from functools import lru_cache
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # Database - 커넥션 풀
+    database_url: str = "sqlite:///./test.db"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # 초
+    db_pool_pre_ping: bool = True
+
+    # Database - 읽기 복제본 (없으면 모든 읽기를 primary에서)
+    replica_database_url: str | None = None
+    read_your_writes_seconds: float = 5.0  # 쓰기 후 이 시간 동안 해당 유저는 primary에서 읽음
+
+    # Database - SQLite PRAGMA (새 커넥션마다 적용)
+    sqlite_journal_mode: str = "WAL"  # 읽기가 쓰기를 기다리지 않도록
+    sqlite_synchronous: str = "NORMAL"  # WAL에서는 NORMAL로도 커밋 내구성 유지
+    sqlite_mmap_size: int = 256 * 1024 * 1024  # 바이트
+    sqlite_cache_size: int = -64 * 1024  # 음수는 KiB 단위 (64MiB)
+    sqlite_busy_timeout: int = 5000  # 밀리초
+
+    # Password - Argon2 해싱 (전용 프로세스 풀)
+    password_hash_workers: int = 2  # 0이면 요청 스레드에서 직접 계산
+    password_hash_max_pending: int = 16  # 실행/대기 중인 해싱 작업 상한, 넘으면 503
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 64 * 1024  # KiB
+    argon2_parallelism: int = 4
+    argon2_calibrate_ms: float | None = None  # 지정하면 시작 시 해시 1회가 이 시간이 되도록 time_cost 조정
+
+    # Auth - 토큰별 인증 유저 캐시 (항목 수명은 TTL과 토큰 만료 중 이른 쪽)
+    identity_cache_size: int = 10_000
+    identity_cache_ttl: float = 60.0  # 초
+
+    # Auth - 로그인 시도 제한 (토큰 버킷: burst개까지 연속, 이후 분당 per_minute개)
+    login_rate_limit_enabled: bool = True
+    login_email_burst: int = 5
+    login_email_per_minute: float = 5.0
+    login_ip_burst: int = 20
+    login_ip_per_minute: float = 30.0
+    login_rate_limit_max_keys: int = 100_000  # 넘으면 가장 오래 쓰지 않은 버킷부터 버린다
+
+    # API - async def 엔드포인트 사용 여부 (AsyncSession + aiosqlite)
+    async_endpoints: bool = False
+
+    # Article - 목록 조회 로더 (batch: 관계별 배치 쿼리, single_query: 집계 단일 쿼리)
+    article_loader: Literal["batch", "single_query"] = "batch"
+
+    # Follow - 프로세스 내 팔로우 그래프 (워커가 하나일 때만 켤 것)
+    follow_graph_enabled: bool = False
+
+    # Feed - 팔로워 타임라인 (fan-out-on-write)
+    feed_timeline_enabled: bool = False
+    feed_fanout_threshold: int = 1000  # 팔로워 수가 이보다 많으면 읽기 시점에 병합
+    # 새로 팔로우할 때 타임라인에 채워 넣을 최근 글 수
+    # (언팔로우로 임계값 이하가 된 작성자는 이 한도 없이 글 전체를 채운다)
+    feed_backfill_limit: int = 100
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
@@ -1,23 +1,186 @@
+from sqlalchemy import URL, Engine, event, inspect, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import Settings, get_settings
 
 # Import models to ensure they are registered
 from app.models.article_model import Article  # noqa: F401
+from app.models.comment_model import Comment  # noqa: F401
 from app.models.favorite_model import Favorite  # noqa: F401
 from app.models.follow_model import Follow  # noqa: F401
 from app.models.tag_model import ArticleTag, Tag  # noqa: F401
+from app.models.timeline_model import TimelineEntry  # noqa: F401
 from app.models.user_model import User  # noqa: F401
 
-DATABASE_URL = "sqlite:///./test.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+def build_engine(settings: Settings) -> Engine:
+    """설정값으로 엔진 생성 - 풀 옵션과 SQLite PRAGMA 적용"""
+    url = make_url(settings.database_url)
+    engine = create_engine(url, **_engine_kwargs(url, settings))
+    if url.get_backend_name() == "sqlite":
+        _register_sqlite_pragmas(engine, settings)
+    return engine
+
+
+def build_async_engine(settings: Settings) -> AsyncEngine:
+    """같은 DB를 가리키는 비동기 엔진 생성
+
+    SQLite는 aiosqlite 드라이버로 바꾸고, 그 외 백엔드는 `database_url`에
+    비동기 드라이버(`postgresql+asyncpg` 등)를 직접 지정해야 한다.
+    """
+    url = _to_async_url(make_url(settings.database_url))
+    engine = create_async_engine(url, **_engine_kwargs(url, settings))
+    if url.get_backend_name() == "sqlite":
+        _register_sqlite_pragmas(engine.sync_engine, settings)
+    return engine
+
+
+def _engine_kwargs(url: URL, settings: Settings) -> dict:
+    is_sqlite = url.get_backend_name() == "sqlite"
+    is_memory = is_sqlite and url.database in (None, "", ":memory:")
+
+    engine_kwargs = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if not is_memory:
+        engine_kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    if is_sqlite:
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    return engine_kwargs
+
+
+def _to_async_url(url: URL) -> URL:
+    if url.get_backend_name() == "sqlite" and url.get_driver_name() == "pysqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    return url
+
+
+def _register_sqlite_pragmas(engine: Engine, settings: Settings) -> None:
+    pragmas = {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "mmap_size": settings.sqlite_mmap_size,
+        "cache_size": settings.sqlite_cache_size,
+        "busy_timeout": settings.sqlite_busy_timeout,
+    }
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def build_replica_engine(settings: Settings) -> Engine | None:
+    if settings.replica_database_url is None:
+        return None
+    return build_engine(settings.model_copy(update={"database_url": settings.replica_database_url}))
+
+
+engine = build_engine(get_settings())
+async_engine = build_async_engine(get_settings())
+replica_engine = build_replica_engine(get_settings())
+
+
+def create_db_and_tables(bind: Engine = engine):
+    """Create database tables
 
+    기존 DB에는 새로 추가된 컬럼과 인덱스를 채워 넣고, 비정규화 카운터 컬럼이
+    새로 생겼거나 중복 행을 지웠다면 원본 테이블 기준으로 카운터를 다시 계산한다.
+    """
+    SQLModel.metadata.create_all(bind)
+    added_columns = _add_missing_columns(bind)
+    removed_duplicates = _remove_duplicate_follows(bind)  # 유니크 인덱스를 만들기 전에
+    _create_missing_indexes(bind)
+    _drop_superseded_indexes(bind)
+    if added_columns or removed_duplicates:
+        from app.jobs.repair_counters import repair_counters
 
-def create_db_and_tables():
-    """Create database tables"""
-    SQLModel.metadata.create_all(engine)
+        with Session(bind) as session:
+            repair_counters(session)
 
 
 def get_session():
-    """Get database session"""
-    with Session(engine) as session:
+    """Get database session
+
+    커밋은 UnitOfWork가 요청당 한 번 하며, 커밋 뒤 응답을 만들 때 다시 SELECT하지
+    않도록 만료시키지 않는다.
+    """
+    with Session(engine, expire_on_commit=False) as session:
         yield session
+
+
+def get_replica_engine() -> Engine | None:
+    """읽기 복제본 엔진 (설정되지 않았으면 None)"""
+    return replica_engine
+
+
+async def get_async_session():
+    """Get async database session
+
+    커밋 후 속성 접근이 지연 로딩(I/O)을 일으키지 않도록 만료시키지 않는다.
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def _add_missing_columns(bind: Engine) -> list[str]:
+    """모델에는 있지만 기존 테이블에는 없는 컬럼을 ALTER TABLE로 추가"""
+    inspector = inspect(bind)
+    added = []
+    with bind.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=bind.dialect)
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                if column.server_default is not None:
+                    ddl += f" NOT NULL DEFAULT {column.server_default.arg}"
+                conn.execute(text(ddl))
+                added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def _remove_duplicate_follows(bind: Engine) -> int:
+    """유니크 인덱스 이전에 쌓인 중복 팔로우 행을 가장 먼저 생긴 것만 남기고 삭제
+
+    유니크 인덱스가 이미 있으면 중복이 있을 수 없으므로 매 시작마다 전체를 훑지 않는다.
+    """
+    existing = {index["name"] for index in inspect(bind).get_indexes("follows")}
+    if "ux_follows_follower_followee" in existing:
+        return 0
+    with bind.begin() as conn:
+        return conn.execute(
+            text(
+                "DELETE FROM follows WHERE id NOT IN "
+                "(SELECT MIN(id) FROM follows GROUP BY follower_id, followee_id)"
+            )
+        ).rowcount
+
+
+# 더 넓은(유니크) 인덱스로 대체되어 필요 없어진 인덱스
+_SUPERSEDED_INDEXES = {"follows": ["ix_follows_follower_followee", "ix_follows_followee"]}
+
+
+def _drop_superseded_indexes(bind: Engine) -> None:
+    inspector = inspect(bind)
+    with bind.begin() as conn:
+        for table, index_names in _SUPERSEDED_INDEXES.items():
+            existing = {index["name"] for index in inspector.get_indexes(table)}
+            for name in index_names:
+                if name in existing:
+                    conn.execute(text(f"DROP INDEX {name}"))
+
+
+def _create_missing_indexes(bind: Engine) -> None:
+    """create_all은 이미 있는 테이블의 인덱스를 만들지 않으므로 따로 생성"""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
@@ -1,6 +1,7 @@
-from fastapi import Depends, Header
+from fastapi import Depends, Header, Request
 from sqlmodel import Session
 
+from app.core.config import Settings, get_settings
 from app.core.database import get_session
 from app.core.exceptions import (
     AuthorizationHeaderMissingException,
@@ -8,21 +9,27 @@ from app.core.exceptions import (
     UnauthorizedException,
     UserNotFoundException,
 )
+from app.core.identity_cache import identity_cache
+from app.core.rate_limit import LoginThrottle
 from app.core.security import verify_token
 from app.models.user_model import User
-from app.repositories.article_repository import ArticleRepository
+from app.repositories.article_repository import ArticleRepository, SingleQueryArticleRepository
 from app.repositories.comment_repository import CommentRepository
 from app.repositories.favorite_repository import FavoriteRepository
-from app.repositories.follow_repository import FollowRepository
+from app.repositories.follow_repository import FollowRepository, GraphFollowRepository
 from app.repositories.interfaces import (
     ArticleRepositoryInterface,
     CommentRepositoryInterface,
     FavoriteRepositoryInterface,
     FollowRepositoryInterface,
     TagRepositoryInterface,
+    TimelineRepositoryInterface,
+    UnitOfWorkInterface,
     UserRepositoryInterface,
 )
 from app.repositories.tag_repository import TagRepository
+from app.repositories.timeline_repository import TimelineRepository
+from app.repositories.unit_of_work import UnitOfWork
 from app.repositories.user_repository import UserRepository
 from app.services.article_service import ArticleService
 from app.services.comment_service import CommentService
@@ -31,13 +38,34 @@ from app.services.tag_service import TagService
 from app.services.user_service import UserService
 
 
+# Unit of Work (요청 안에서는 캐시되어 서비스들이 같은 트랜잭션을 공유)
+def get_unit_of_work(session: Session = Depends(get_session)) -> UnitOfWorkInterface:
+    return UnitOfWork(session)
+
+
 # Repository
 def get_user_repository(session: Session = Depends(get_session)) -> UserRepositoryInterface:
     return UserRepository(session)
 
 
-def get_article_repository(session: Session = Depends(get_session)) -> ArticleRepositoryInterface:
-    return ArticleRepository(session)
+def get_follow_repository(
+    session: Session = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+) -> FollowRepositoryInterface:
+    # 그래프는 primary 커밋만 반영하므로 복제본 세션에는 쓰지 않는다
+    if settings.follow_graph_enabled and not session.info.get("replica"):
+        return GraphFollowRepository(session)
+    return FollowRepository(session)
+
+
+def get_article_repository(
+    session: Session = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+    follow_repo: FollowRepositoryInterface = Depends(get_follow_repository),
+) -> ArticleRepositoryInterface:
+    if settings.article_loader == "single_query":
+        return SingleQueryArticleRepository(session, follow_repo)
+    return ArticleRepository(session, follow_repo)
 
 
 def get_tag_repository(session: Session = Depends(get_session)) -> TagRepositoryInterface:
@@ -48,43 +76,60 @@ def get_favorite_repository(session: Session = Depends(get_session)) -> Favorite
     return FavoriteRepository(session)
 
 
-def get_comment_repository(session: Session = Depends(get_session)) -> CommentRepositoryInterface:
-    return CommentRepository(session)
+def get_comment_repository(
+    session: Session = Depends(get_session),
+    follow_repo: FollowRepositoryInterface = Depends(get_follow_repository),
+) -> CommentRepositoryInterface:
+    return CommentRepository(session, follow_repo)
 
 
-def get_follow_repository(session: Session = Depends(get_session)) -> FollowRepositoryInterface:
-    return FollowRepository(session)
+def get_timeline_repository(
+    session: Session = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+) -> TimelineRepositoryInterface | None:
+    if not settings.feed_timeline_enabled:
+        return None
+    return TimelineRepository(
+        session,
+        fanout_threshold=settings.feed_fanout_threshold,
+        backfill_limit=settings.feed_backfill_limit,
+    )
 
 
 # Service
 def get_user_service(
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work),
     user_repo: UserRepositoryInterface = Depends(get_user_repository),
 ) -> UserService:
-    return UserService(user_repo)
+    return UserService(uow, user_repo)
 
 
 def get_article_service(
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work),
     article_repo: ArticleRepositoryInterface = Depends(get_article_repository),
     user_repo: UserRepositoryInterface = Depends(get_user_repository),
     tag_repo: TagRepositoryInterface = Depends(get_tag_repository),
     favorite_repo: FavoriteRepositoryInterface = Depends(get_favorite_repository),
+    timeline_repo: TimelineRepositoryInterface | None = Depends(get_timeline_repository),
 ) -> ArticleService:
-    return ArticleService(article_repo, user_repo, tag_repo, favorite_repo)
+    return ArticleService(uow, article_repo, user_repo, tag_repo, favorite_repo, timeline_repo)
 
 
 def get_comment_service(
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work),
     comment_repo: CommentRepositoryInterface = Depends(get_comment_repository),
     article_repo: ArticleRepositoryInterface = Depends(get_article_repository),
-    user_repo: UserRepositoryInterface = Depends(get_user_repository),
 ) -> CommentService:
-    return CommentService(comment_repo, article_repo, user_repo)
+    return CommentService(uow, comment_repo, article_repo)
 
 
 def get_profile_service(
+    uow: UnitOfWorkInterface = Depends(get_unit_of_work),
     user_repo: UserRepositoryInterface = Depends(get_user_repository),
     follow_repo: FollowRepositoryInterface = Depends(get_follow_repository),
+    timeline_repo: TimelineRepositoryInterface | None = Depends(get_timeline_repository),
 ) -> ProfileService:
-    return ProfileService(user_repo, follow_repo)
+    return ProfileService(uow, user_repo, follow_repo, timeline_repo)
 
 
 def get_tag_service(
@@ -93,28 +138,60 @@ def get_tag_service(
     return TagService(tag_repo)
 
 
+# Session 하나로 서비스 조립 (Depends 없이 - 비동기 경로의 run_sync 안에서 사용)
+def build_article_service(session: Session, settings: Settings) -> ArticleService:
+    return get_article_service(
+        get_unit_of_work(session),
+        get_article_repository(session, settings, get_follow_repository(session, settings)),
+        get_user_repository(session),
+        get_tag_repository(session),
+        get_favorite_repository(session),
+        get_timeline_repository(session, settings),
+    )
+
+
+def build_comment_service(session: Session, settings: Settings) -> CommentService:
+    follow_repo = get_follow_repository(session, settings)
+    return get_comment_service(
+        get_unit_of_work(session),
+        get_comment_repository(session, follow_repo),
+        get_article_repository(session, settings, follow_repo),
+    )
+
+
+def build_profile_service(session: Session, settings: Settings) -> ProfileService:
+    return get_profile_service(
+        get_unit_of_work(session),
+        get_user_repository(session),
+        get_follow_repository(session, settings),
+        get_timeline_repository(session, settings),
+    )
+
+
+def build_tag_service(session: Session, settings: Settings) -> TagService:
+    return get_tag_service(get_tag_repository(session))
+
+
 # Auth
+def get_login_throttle(request: Request) -> LoginThrottle | None:
+    return request.app.state.login_throttle
+
+
 def get_current_user(
     authorization: str | None = Header(None),
     user_repo: UserRepositoryInterface = Depends(get_user_repository),
 ) -> User:
-    if authorization is None:
-        raise AuthorizationHeaderMissingException()
-
-    token = authorization.replace("Token ", "")
+    token = token_from_authorization(authorization)
+    user = identity_cache.get(token)
+    if user is not None:
+        return user
 
-    try:
-        payload = verify_token(token)
-        user_id = payload.get("user_id")
-        if user_id is None:
-            raise InvalidTokenException("Invalid token payload")
-    except ValueError as e:
-        raise InvalidTokenException(str(e)) from e
-
-    user = user_repo.get_by_id(user_id)
+    payload = verify_user_token(token)
+    user = user_repo.get_by_id(payload["user_id"])
     if user is None:
         raise UserNotFoundException()
 
+    identity_cache.put(token, user, payload["exp"])
     return user
 
 
@@ -129,3 +206,31 @@ def get_current_user_optional(
         return get_current_user(authorization, user_repo)
     except UnauthorizedException:
         return None
+
+
+def get_current_token(authorization: str | None = Header(None)) -> str:
+    return token_from_authorization(authorization)
+
+
+def token_from_authorization(authorization: str | None) -> str:
+    if authorization is None:
+        raise AuthorizationHeaderMissingException()
+
+    return authorization.replace("Token ", "")
+
+
+def verify_user_token(token: str) -> dict:
+    """토큰을 검증하고 payload를 반환 (user_id가 없으면 401)"""
+    try:
+        payload = verify_token(token)
+        if payload.get("user_id") is None:
+            raise InvalidTokenException("Invalid token payload")
+    except ValueError as e:
+        raise InvalidTokenException(str(e)) from e
+
+    return payload
+
+
+def user_id_from_authorization(authorization: str | None) -> int:
+    """Authorization 헤더의 토큰을 검증하고 유저 id를 꺼낸다"""
+    return verify_user_token(token_from_authorization(authorization))["user_id"]
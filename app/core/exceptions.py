@@ -122,3 +122,47 @@ class InvalidPasswordException(ValidationException):
 class CannotFollowYourselfException(ValidationException):
     def __init__(self):
         super().__init__("Cannot follow yourself")
+
+
+class InvalidCursorException(ValidationException):
+    def __init__(self):
+        super().__init__("Invalid cursor")
+
+
+class TooManyUsernamesException(ValidationException):
+    def __init__(self, limit: int):
+        super().__init__(f"At most {limit} usernames can be requested at once")
+
+
+# ============================================================================
+# 429 Too Many Requests
+# ============================================================================
+
+
+class TooManyRequestsException(AppException):
+    """요청 한도 초과 (429) - `retry_after`초 뒤에 다시 시도할 수 있다"""
+
+    def __init__(self, detail: str, retry_after: float):
+        super().__init__(detail)
+        self.retry_after = retry_after
+
+
+class TooManyLoginAttemptsException(TooManyRequestsException):
+    def __init__(self, retry_after: float):
+        super().__init__("Too many login attempts, try again later", retry_after)
+
+
+# ============================================================================
+# 503 Service Unavailable
+# ============================================================================
+
+
+class ServiceUnavailableException(AppException):
+    """일시적으로 요청을 처리할 수 없음 (503)"""
+
+    pass
+
+
+class PasswordHashingBusyException(ServiceUnavailableException):
+    def __init__(self):
+        super().__init__("Too many password requests, try again later")
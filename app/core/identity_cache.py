@@ -0,0 +1,88 @@
+"""인증된 유저 캐시
+
+같은 토큰으로 연달아 들어오는 요청마다 JWT 검증과 유저 조회를 반복하지 않도록
+토큰 digest -> 유저 스냅샷(컬럼 값)을 캐시한다. 항목은 TTL과 토큰 만료(exp) 중
+이른 시각에 만료되고, 유저 정보가 바뀌면 해당 유저의 항목을 모두 버린다.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from app.core.config import get_settings
+from app.models.user_model import User
+
+
+class IdentityCache:
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.time):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        # digest -> (만료 시각, user_id, 스냅샷)
+        self._entries: OrderedDict[str, tuple[float, int, dict[str, Any]]] = OrderedDict()
+        self._digests_by_user: dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> User | None:
+        """캐시된 유저를 새 User 객체로 반환 (세션에 붙지 않은 상태)"""
+        digest = _digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._remove(digest)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            snapshot = entry[2]
+        return User(**snapshot)
+
+    def put(self, token: str, user: User, token_exp: float) -> None:
+        expires_at = min(self._clock() + self._ttl, token_exp)
+        digest = _digest(token)
+        with self._lock:
+            self._remove(digest)
+            self._entries[digest] = (expires_at, user.id, user.model_dump())
+            self._digests_by_user.setdefault(user.id, set()).add(digest)
+            while len(self._entries) > self._maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for digest in self._digests_by_user.pop(user_id, set()):
+                self._entries.pop(digest, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._digests_by_user.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def _remove(self, digest: str) -> None:
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return
+        digests = self._digests_by_user.get(entry[1])
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._digests_by_user[entry[1]]
+
+
+def _digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+identity_cache = IdentityCache(
+    maxsize=get_settings().identity_cache_size, ttl=get_settings().identity_cache_ttl
+)
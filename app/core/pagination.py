@@ -0,0 +1,46 @@
+"""키셋(커서) 페이지네이션 유틸리티
+
+커서는 마지막으로 반환된 행의 `(created_at, id)`(또는 `id`만)를 base64로 감싼 불투명
+문자열이다.
+클라이언트는 응답의 커서를 그대로 다음 요청에 넘기기만 하면 된다.
+"""
+
+import base64
+from datetime import datetime
+
+from app.core.exceptions import InvalidCursorException
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+Cursor = tuple[datetime, int]
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        created_at, row_id = _b64decode(cursor).rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except ValueError as e:
+        raise InvalidCursorException() from e
+
+
+def encode_id_cursor(row_id: int) -> str:
+    """id만으로 정렬되는 목록(follows 등)용 커서"""
+    return base64.urlsafe_b64encode(str(row_id).encode()).decode().rstrip("=")
+
+
+def decode_id_cursor(cursor: str) -> int:
+    try:
+        return int(_b64decode(cursor))
+    except ValueError as e:
+        raise InvalidCursorException() from e
+
+
+def _b64decode(cursor: str) -> str:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return base64.urlsafe_b64decode(padded.encode()).decode()
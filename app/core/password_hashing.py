@@ -0,0 +1,153 @@
+"""Argon2 비밀번호 해싱 풀
+
+Argon2는 의도적으로 느린 CPU/메모리 작업이라 요청 스레드에서 돌리면 로그인/가입
+폭주 시 스레드풀이 묶여 다른 요청까지 멈춘다. 전용 프로세스 풀에서 계산하고,
+대기 중인 작업 수를 제한해 한도를 넘으면 기다리지 않고 503으로 거절한다.
+"""
+
+import atexit
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from argon2 import PasswordHasher, Type, extract_parameters
+from argon2.exceptions import VerifyMismatchError
+
+from app.core.config import Settings
+from app.core.exceptions import PasswordHashingBusyException
+
+MAX_CALIBRATED_TIME_COST = 10
+
+
+class Argon2Params(NamedTuple):
+    time_cost: int
+    memory_cost: int  # KiB
+    parallelism: int
+
+
+# 프로세스(워커 포함)별 PasswordHasher 캐시
+_hashers: dict[Argon2Params, PasswordHasher] = {}
+
+
+def _hasher_for(params: Argon2Params) -> PasswordHasher:
+    hasher = _hashers.get(params)
+    if hasher is None:
+        hasher = _hashers[params] = PasswordHasher(*params)
+    return hasher
+
+
+def _hash(params: Argon2Params, password: str) -> str:
+    return _hasher_for(params).hash(password)
+
+
+def _verify(params: Argon2Params, hashed_password: str, password: str) -> bool:
+    try:
+        return _hasher_for(params).verify(hashed_password, password)
+    except VerifyMismatchError:
+        return False
+
+
+class PasswordHashPool:
+    """해싱/검증을 프로세스 풀에서 실행 (`workers=0`이면 호출한 스레드에서 실행)"""
+
+    def __init__(self, params: Argon2Params, workers: int, max_pending: int):
+        self.params = params
+        self._executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, self.params, password)
+
+    def verify(self, hashed_password: str, password: str) -> bool:
+        # 해시 문자열에 파라미터가 들어 있으므로 어떤 params의 hasher로도 검증된다
+        return self._run(_verify, self.params, hashed_password, password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """현재 파라미터보다 약한 해시인지 (문자열만 보므로 풀을 거치지 않는다)
+
+        보정한 time_cost는 부팅/워커마다 달라질 수 있으므로, 다르기만 한 해시까지 다시
+        해싱하면 로그인마다 해시가 오간다. 비용(time/memory/parallelism) 중 하나라도
+        현재보다 낮을 때만 다시 해싱한다.
+        """
+        stored = extract_parameters(hashed_password)
+        return (
+            stored.type != Type.ID
+            or stored.time_cost < self.params.time_cost
+            or stored.memory_cost < self.params.memory_cost
+            or stored.parallelism < self.params.parallelism
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusyException()
+        try:
+            if self._executor is None:
+                return fn(*args)
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+
+def calibrate(params: Argon2Params, target_ms: float) -> Argon2Params:
+    """해시 한 번이 target_ms 이상 걸릴 때까지 time_cost를 올린다"""
+    for time_cost in range(1, MAX_CALIBRATED_TIME_COST + 1):
+        candidate = params._replace(time_cost=time_cost)
+        started = time.perf_counter()
+        _hash(candidate, "calibration-password")
+        if (time.perf_counter() - started) * 1000 >= target_ms:
+            return candidate
+    return params._replace(time_cost=MAX_CALIBRATED_TIME_COST)
+
+
+_pool: PasswordHashPool | None = None
+_pool_key: tuple | None = None
+_pool_lock = threading.Lock()
+
+
+def configure(settings: Settings) -> PasswordHashPool:
+    """설정으로 해싱 풀을 만든다 (같은 설정이면 기존 풀을 그대로 쓴다)"""
+    global _pool, _pool_key
+    key = (
+        settings.password_hash_workers,
+        settings.password_hash_max_pending,
+        settings.argon2_time_cost,
+        settings.argon2_memory_cost,
+        settings.argon2_parallelism,
+        settings.argon2_calibrate_ms,
+    )
+    with _pool_lock:
+        if _pool is not None and _pool_key == key:
+            return _pool
+
+        params = Argon2Params(
+            settings.argon2_time_cost, settings.argon2_memory_cost, settings.argon2_parallelism
+        )
+        if settings.argon2_calibrate_ms is not None:
+            params = calibrate(params, settings.argon2_calibrate_ms)
+
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = PasswordHashPool(
+            params, settings.password_hash_workers, settings.password_hash_max_pending
+        )
+        _pool_key = key
+        return _pool
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    if _pool is None:
+        from app.core.config import get_settings
+
+        return configure(get_settings())
+    return _pool
+
+
+@atexit.register
+def _shutdown_pool() -> None:
+    if _pool is not None:
+        _pool.shutdown()
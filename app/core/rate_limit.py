@@ -0,0 +1,90 @@
+"""로그인 시도 제한
+
+로그인 실패 한 번마다 Argon2 검증이 돌기 때문에, 비밀번호 대입 공격이 들어오면
+CPU가 해싱에 묶인다. 이메일별/클라이언트 IP별 토큰 버킷으로 `verify_password`
+전에 시도를 거절한다. 버킷은 기본적으로 프로세스 메모리에 두며, 워커가 여러 개면
+`RateLimitBackend`를 구현한 공유 저장소(Redis 등)로 바꿔 끼운다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple, Protocol
+
+from app.core.config import Settings
+from app.core.exceptions import TooManyLoginAttemptsException
+
+
+class TokenBucketRule(NamedTuple):
+    capacity: float  # 연속으로 허용하는 시도 수
+    refill_per_second: float
+
+
+class RateLimitBackend(Protocol):
+    def consume(self, key: str, rule: TokenBucketRule) -> float:
+        """토큰 1개를 쓰면 0, 모자라면 다시 시도할 수 있을 때까지 남은 초를 반환"""
+        ...
+
+
+class InMemoryRateLimitBackend:
+    """프로세스 메모리 토큰 버킷 - 최대 `max_keys`개, 오래 쓰지 않은 버킷부터 버린다"""
+
+    def __init__(self, max_keys: int, clock: Callable[[], float] = time.monotonic):
+        self._max_keys = max_keys
+        self._clock = clock
+        # key -> (남은 토큰, 마지막 갱신 시각)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, rule: TokenBucketRule) -> float:
+        now = self._clock()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (rule.capacity, now))
+            tokens = min(rule.capacity, tokens + (now - updated_at) * rule.refill_per_second)
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / rule.refill_per_second
+
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+            return retry_after
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class LoginThrottle:
+    def __init__(
+        self, backend: RateLimitBackend, email_rule: TokenBucketRule, ip_rule: TokenBucketRule
+    ):
+        self._backend = backend
+        self._email_rule = email_rule
+        self._ip_rule = ip_rule
+
+    def check(self, email: str, client_ip: str | None) -> None:
+        """IP -> 이메일 순으로 시도 1회를 차감하고, 한도를 넘으면 429"""
+        if client_ip is not None:
+            retry_after = self._backend.consume(f"login:ip:{client_ip}", self._ip_rule)
+            if retry_after > 0:
+                raise TooManyLoginAttemptsException(retry_after)
+
+        retry_after = self._backend.consume(f"login:email:{email.lower()}", self._email_rule)
+        if retry_after > 0:
+            raise TooManyLoginAttemptsException(retry_after)
+
+
+def build_login_throttle(
+    settings: Settings, backend: RateLimitBackend | None = None
+) -> LoginThrottle | None:
+    """설정으로 로그인 제한기를 만든다 (`login_rate_limit_enabled=False`면 None)"""
+    if not settings.login_rate_limit_enabled:
+        return None
+    email_rule = TokenBucketRule(settings.login_email_burst, settings.login_email_per_minute / 60)
+    ip_rule = TokenBucketRule(settings.login_ip_burst, settings.login_ip_per_minute / 60)
+    return LoginThrottle(
+        backend or InMemoryRateLimitBackend(settings.login_rate_limit_max_keys), email_rule, ip_rule
+    )
@@ -0,0 +1,125 @@
+"""읽기 복제본(replica) 라우팅
+
+GET 라우트의 저장소는 `get_read_session`으로 복제본을 읽고, 쓰기는 항상 primary로
+간다. 복제 지연 때문에 방금 쓴 내용이 안 보이는 일을 막기 위해, 쓰기에 성공한
+유저는 `read_your_writes_seconds` 동안 primary에서 읽도록 고정한다.
+"""
+
+import threading
+import time
+
+from fastapi import Depends, Header, Request
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app.core.config import Settings, get_settings
+from app.core.database import get_replica_engine, get_session
+from app.core.dependencies import (
+    build_article_service,
+    build_comment_service,
+    build_profile_service,
+    build_tag_service,
+    user_id_from_authorization,
+)
+from app.core.exceptions import UnauthorizedException
+from app.services.article_service import ArticleService
+from app.services.comment_service import CommentService
+from app.services.profile_service import ProfileService
+from app.services.tag_service import TagService
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesTracker:
+    """유저별 primary 고정 만료 시각 (프로세스 메모리)"""
+
+    def __init__(self, window_seconds: float, clock=time.monotonic):
+        self._window = window_seconds
+        self._clock = clock
+        self._pinned_until: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def pin(self, user_id: int) -> None:
+        now = self._clock()
+        with self._lock:
+            self._pinned_until[user_id] = now + self._window
+            self._prune(now)
+
+    def is_pinned(self, user_id: int | None) -> bool:
+        if user_id is None:
+            return False
+        with self._lock:
+            return self._pinned_until.get(user_id, 0.0) > self._clock()
+
+    def _prune(self, now: float) -> None:
+        expired = [user_id for user_id, until in self._pinned_until.items() if until <= now]
+        for user_id in expired:
+            del self._pinned_until[user_id]
+
+
+async def pin_writers_to_primary(request: Request, call_next):
+    """쓰기 요청이 성공하면 요청한 유저를 primary에 고정하는 미들웨어"""
+    response = await call_next(request)
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        user_id = _user_id_or_none(request.headers.get("authorization"))
+        if user_id is not None:
+            request.app.state.read_your_writes.pin(user_id)
+    return response
+
+
+def get_read_session(
+    request: Request,
+    authorization: str | None = Header(None),
+    primary: Session = Depends(get_session),
+    replica_engine: Engine | None = Depends(get_replica_engine),
+):
+    """읽기 전용 세션 - 복제본이 없거나 유저가 고정 중이면 primary 세션을 그대로 쓴다"""
+    tracker: ReadYourWritesTracker | None = getattr(request.app.state, "read_your_writes", None)
+    if (
+        replica_engine is None
+        or tracker is None
+        or tracker.is_pinned(_user_id_or_none(authorization))
+    ):
+        yield primary
+        return
+
+    with Session(replica_engine, expire_on_commit=False, info={"replica": True}) as session:
+        yield session
+
+
+# Read Service (GET 라우트용)
+def get_read_article_service(
+    session: Session = Depends(get_read_session),
+    settings: Settings = Depends(get_settings),
+) -> ArticleService:
+    return build_article_service(session, settings)
+
+
+def get_read_comment_service(
+    session: Session = Depends(get_read_session),
+    settings: Settings = Depends(get_settings),
+) -> CommentService:
+    return build_comment_service(session, settings)
+
+
+def get_read_profile_service(
+    session: Session = Depends(get_read_session),
+    settings: Settings = Depends(get_settings),
+) -> ProfileService:
+    return build_profile_service(session, settings)
+
+
+def get_read_tag_service(
+    session: Session = Depends(get_read_session),
+    settings: Settings = Depends(get_settings),
+) -> TagService:
+    return build_tag_service(session, settings)
+
+
+def _user_id_or_none(authorization: str | None) -> int | None:
+    if authorization is None:
+        return None
+    try:
+        return user_id_from_authorization(authorization)
+    except UnauthorizedException:
+        return None
@@ -1,27 +1,68 @@
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 
 import jwt
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+
+from app.core.cache import LRUCache
+from app.core.password_hashing import get_password_hash_pool
 
 # JWT 설정 (실제 프로덕션에서는 환경변수로 관리)
 SECRET_KEY = "your-secret-key-change-this-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
+# 남은 수명이 이보다 길면 새로 서명하지 않고 기존 토큰을 돌려준다
+TOKEN_REUSE_MIN_REMAINING_MINUTES = ACCESS_TOKEN_EXPIRE_MINUTES // 2
+ISSUED_TOKEN_CACHE_SIZE = 10_000
 
-# Argon2 설정
-ph = PasswordHasher()
+# (user_id, username) -> (마지막으로 발급한 토큰, exp)
+_issued_tokens: LRUCache[tuple[int, str], tuple[str, int]] = LRUCache(ISSUED_TOKEN_CACHE_SIZE)
 
 
 def create_access_token(user_id: int, username: str) -> str:
-    expire = datetime.now() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    return _encode_access_token(user_id, username)[0]
+
+
+def _encode_access_token(user_id: int, username: str) -> tuple[str, int]:
+    """새 토큰과 exp(epoch 초) 반환"""
+    expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode = {
         "user_id": user_id,
         "username": username,
         "exp": expire,
     }
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    return encoded_jwt, int(expire.timestamp())
+
+
+def issue_access_token(user_id: int, username: str, presented_token: str | None = None) -> str:
+    """응답에 실을 토큰 - 수명이 충분히 남은 토큰이 있으면 다시 서명하지 않는다
+
+    최근 발급한 토큰 캐시를 먼저 보고, 없으면 요청에 쓴 `presented_token`의 claim을 본다
+    (이미 인증을 통과한 토큰이므로 서명은 다시 검증하지 않는다).
+    """
+    min_exp = time.time() + TOKEN_REUSE_MIN_REMAINING_MINUTES * 60
+    key = (user_id, username)
+    issued = _issued_tokens.get(key)
+    if issued is not None and issued[1] > min_exp:
+        return issued[0]
+
+    if presented_token is not None:
+        claims = jwt.decode(presented_token, options={"verify_signature": False})
+        if (
+            claims.get("user_id") == user_id
+            and claims.get("username") == username
+            and claims.get("exp", 0) > min_exp
+        ):
+            _issued_tokens.put_many([(key, (presented_token, claims["exp"]))])
+            return presented_token
+
+    token, exp = _encode_access_token(user_id, username)
+    _issued_tokens.put_many([(key, (token, exp))])
+    return token
+
+
+def clear_issued_tokens() -> None:
+    _issued_tokens.clear()
 
 
 def verify_token(token: str) -> dict:
@@ -35,13 +76,14 @@ def verify_token(token: str) -> dict:
 
 
 def hash_password(password: str) -> str:
-    return ph.hash(password)
+    return get_password_hash_pool().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    try:
-        ph.verify(hashed_password, plain_password)
-        return True
-    except VerifyMismatchError:
-        return False
+    return get_password_hash_pool().verify(hashed_password, plain_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """현재 Argon2 파라미터보다 약하게 만들어진 해시인지"""
+    return get_password_hash_pool().needs_rehash(hashed_password)
 
@@ -51,6 +51,8 @@ class ProfileResponse(BaseModel):
     bio: str | None = None
     image: str | None = None
     following: bool = False
+    followersCount: int = 0
+    followingCount: int = 0
 
     @classmethod
     def from_user(cls, user: User, following: bool = False) -> "ProfileResponse":
@@ -59,6 +61,8 @@ class ProfileResponse(BaseModel):
             bio=user.bio,
             image=user.image,
             following=following,
+            followersCount=user.followers_count,
+            followingCount=user.following_count,
         )
 
 
@@ -75,6 +79,7 @@ class ArticleResponse(BaseModel):
     createdAt: str  # ISO format with Z
     updatedAt: str  # ISO format with Z
     favoritesCount: int
+    commentsCount: int
     favorited: bool
     author: AuthorResponse
 
@@ -85,8 +90,10 @@ class ArticleResponse(BaseModel):
         author = article_data["author"]
         tag_list = article_data.get("tag_list", [])
         favorites_count = article_data.get("favorites_count", 0)
+        comments_count = article_data.get("comments_count", 0)
         favorited = article_data.get("favorited", False)
-        
+        following = article_data.get("following", False)
+
         return cls(
             slug=article.slug,
             title=article.title,
@@ -96,8 +103,9 @@ class ArticleResponse(BaseModel):
             createdAt=article.created_at.isoformat() + "Z",
             updatedAt=article.updated_at.isoformat() + "Z",
             favoritesCount=favorites_count,
+            commentsCount=comments_count,
             favorited=favorited,
-            author=AuthorResponse.from_user(author),
+            author=AuthorResponse.from_user(author, following),
         )
 
 
@@ -126,9 +134,16 @@ class ProfileResponseWrapper(BaseModel):
     profile: ProfileResponse
 
 
+class ProfileListResponseWrapper(BaseModel):
+    """Profile API 응답: /profiles/{username}/followers, /following"""
+    profiles: list[ProfileResponse]
+    nextCursor: str | None = None
+
+
 class CommentResponseWrapper(BaseModel):
     """Comment API 응답: GET /articles/{slug}/comments"""
     comments: list[CommentResponse]
+    nextCursor: str | None = None
 
 
 class SingleCommentResponseWrapper(BaseModel):
@@ -140,6 +155,7 @@ class ArticleResponseWrapper(BaseModel):
     """Article API 응답: GET /articles"""
     articles: list[ArticleResponse]
     articlesCount: int
+    nextCursor: str | None = None
 
 
 class SingleArticleResponseWrapper(BaseModel):
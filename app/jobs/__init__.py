@@ -0,0 +1 @@
+"""Maintenance Jobs - 운영용 일괄 작업"""
@@ -0,0 +1,37 @@
+"""피드 타임라인 재구성 작업
+
+follows와 articles를 기준으로 `timeline` 테이블을 비우고 다시 채운다.
+기존 DB에서 `FEED_TIMELINE_ENABLED`를 처음 켜기 전이나, 껐다 다시 켤 때
+(꺼진 동안의 팔로우/언팔로우/글 작성은 타임라인에 반영되지 않는다) 실행한다.
+
+실행:
+    python -m app.jobs.rebuild_timelines
+"""
+
+from sqlmodel import Session
+
+from app.core.config import Settings
+from app.repositories.timeline_repository import TimelineRepository
+
+
+def rebuild_timelines(session: Session, settings: Settings) -> int:
+    """다시 채운 타임라인 행 수를 반환 (하나의 트랜잭션으로 커밋)"""
+    rebuilt = TimelineRepository(
+        session,
+        fanout_threshold=settings.feed_fanout_threshold,
+        backfill_limit=settings.feed_backfill_limit,
+    ).rebuild()
+    session.commit()
+    return rebuilt
+
+
+def main() -> None:
+    from app.core.config import get_settings
+    from app.core.database import engine
+
+    with Session(engine) as session:
+        print(f"timeline: {rebuild_timelines(session, get_settings())} rows rebuilt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""비정규화 카운터 복구 작업
+
+원본 테이블(favorite 등)을 기준으로 카운터 컬럼을 다시 계산한다.
+배포 직후나 수동 데이터 수정 후에 실행한다.
+
+실행:
+    python -m app.jobs.repair_counters
+"""
+
+from sqlmodel import Session
+
+from app.repositories.comment_repository import CommentRepository
+from app.repositories.favorite_repository import FavoriteRepository
+from app.repositories.follow_repository import FollowRepository
+from app.repositories.tag_repository import TagRepository
+
+
+def repair_counters(session: Session) -> dict[str, int]:
+    """카운터별로 보정한 행 수를 반환 (하나의 트랜잭션으로 커밋)"""
+    follows = FollowRepository(session).recount_follows()
+    repaired = {
+        "articles.favorites_count": FavoriteRepository(session).recount_favorites(),
+        "articles.comments_count": CommentRepository(session).recount_comments(),
+        "tag.usage_count": TagRepository(session).recount_usage(),
+        "users.followers_count": follows["followers_count"],
+        "users.following_count": follows["following_count"],
+    }
+    session.commit()
+    return repaired
+
+
+def main() -> None:
+    from app.core.database import engine
+
+    with Session(engine) as session:
+        for counter, repaired in repair_counters(session).items():
+            print(f"{counter}: {repaired} rows repaired")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""읽기 복제본 동기화 작업 (SQLite 로컬 환경용)
+
+primary DB 파일 전체를 SQLite 온라인 백업 API로 복제본 파일에 복사한다.
+실제 운영 DB에서는 DB 자체의 복제 기능을 쓰고, 이 작업은 로컬/테스트에서
+복제 지연을 흉내 내는 용도다.
+
+실행:
+    python -m app.jobs.sync_replica
+"""
+
+from sqlalchemy import Engine
+
+
+def sync_replica(primary: Engine, replica: Engine) -> None:
+    source = primary.raw_connection()
+    target = replica.raw_connection()
+    try:
+        source.driver_connection.backup(target.driver_connection)
+    finally:
+        target.close()
+        source.close()
+
+
+def main() -> None:
+    from app.core.database import engine, replica_engine
+
+    if replica_engine is None:
+        raise SystemExit("REPLICA_DATABASE_URL is not set")
+    sync_replica(engine, replica_engine)
+    print(f"replica synced: {engine.url} -> {replica_engine.url}")
+
+
+if __name__ == "__main__":
+    main()
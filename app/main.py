@@ -1,61 +1,123 @@
+import math
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from app.api import article, auth, comment, profile, tag
-from app.core.database import create_db_and_tables
+from app.api.aio import article as aio_article
+from app.api.aio import comment as aio_comment
+from app.api.aio import profile as aio_profile
+from app.api.aio import tag as aio_tag
+from app.core.config import Settings, get_settings
+from app.core.database import async_engine, create_db_and_tables, engine
+from app.core.identity_cache import identity_cache
+from app.core.password_hashing import configure as configure_password_hashing
+from app.core.rate_limit import RateLimitBackend, build_login_throttle
+from app.core.replica import ReadYourWritesTracker, pin_writers_to_primary
 from app.core.exceptions import (
     NotFoundException,
     UnauthorizedException,
     ForbiddenException,
+    ServiceUnavailableException,
+    TooManyRequestsException,
     ValidationException,
 )
+from app.repositories.follow_graph import warm_follow_graph
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     create_db_and_tables()
+    configure_password_hashing(app.state.settings)
+    if app.state.settings.follow_graph_enabled:
+        # 고른 라우터가 세션을 여는 엔진의 그래프를 읽어 둔다
+        warm_follow_graph(
+            async_engine.sync_engine if app.state.settings.async_endpoints else engine
+        )
     yield
     # Shutdown (cleanup if needed)
 
 
-app = FastAPI(title="RealWorld API", version="0.1.0", lifespan=lifespan)
-
-
 # ============================================================================
 # 전역 예외 핸들러
 # ============================================================================
 
 
-@app.exception_handler(NotFoundException)
 async def not_found_exception_handler(request: Request, exc: NotFoundException):
     return JSONResponse(status_code=404, content={"detail": exc.detail})
 
 
-@app.exception_handler(UnauthorizedException)
 async def unauthorized_exception_handler(request: Request, exc: UnauthorizedException):
     return JSONResponse(status_code=401, content={"detail": exc.detail})
 
 
-@app.exception_handler(ForbiddenException)
 async def forbidden_exception_handler(request: Request, exc: ForbiddenException):
     return JSONResponse(status_code=403, content={"detail": exc.detail})
 
 
-@app.exception_handler(ValidationException)
 async def validation_exception_handler(request: Request, exc: ValidationException):
     return JSONResponse(status_code=422, content={"detail": exc.detail})
 
 
-app.include_router(auth.router)
-app.include_router(profile.router)
-app.include_router(article.router)
-app.include_router(comment.router)
-app.include_router(tag.router)
+async def too_many_requests_exception_handler(request: Request, exc: TooManyRequestsException):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": exc.detail},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+
+async def service_unavailable_exception_handler(
+    request: Request, exc: ServiceUnavailableException
+):
+    return JSONResponse(status_code=503, content={"detail": exc.detail})
+
+
+def create_app(
+    settings: Settings | None = None, rate_limit_backend: RateLimitBackend | None = None
+) -> FastAPI:
+    """앱 생성 - `settings.async_endpoints`에 따라 동기/비동기 라우터를 고른다
+
+    `rate_limit_backend`를 주면 로그인 제한 버킷을 프로세스 메모리 대신 그 저장소에 둔다.
+    """
+    settings = settings or get_settings()
+    app = FastAPI(title="RealWorld API", version="0.1.0", lifespan=lifespan)
+    app.state.settings = settings
+    app.state.login_throttle = build_login_throttle(settings, rate_limit_backend)
+
+    app.add_exception_handler(NotFoundException, not_found_exception_handler)
+    app.add_exception_handler(UnauthorizedException, unauthorized_exception_handler)
+    app.add_exception_handler(ForbiddenException, forbidden_exception_handler)
+    app.add_exception_handler(ValidationException, validation_exception_handler)
+    app.add_exception_handler(TooManyRequestsException, too_many_requests_exception_handler)
+    app.add_exception_handler(ServiceUnavailableException, service_unavailable_exception_handler)
+
+    if settings.replica_database_url:
+        app.state.read_your_writes = ReadYourWritesTracker(settings.read_your_writes_seconds)
+        app.middleware("http")(pin_writers_to_primary)
+
+    if settings.async_endpoints:
+        routers = [aio_profile.router, aio_article.router, aio_comment.router, aio_tag.router]
+    else:
+        routers = [profile.router, article.router, comment.router, tag.router]
+    app.include_router(auth.router)
+    for router in routers:
+        app.include_router(router)
+
+    app.get("/")(health_check)
+    app.get("/metrics")(metrics)
+    return app
 
 
-@app.get("/")
 def health_check():
     return {"status": "ok"}
+
+
+def metrics():
+    """프로세스 내 캐시 적중 통계 (모니터링용)"""
+    return {"identityCache": identity_cache.stats()}
+
+
+app = create_app()
@@ -1,4 +1,4 @@
-from sqlmodel import Field, SQLModel
+from sqlmodel import Field, Index, SQLModel
 
 from app.models.base import TimestampModel
 
@@ -6,6 +6,10 @@ from app.models.base import TimestampModel
 class Article(TimestampModel, table=True):
 
     __tablename__ = "articles"
+    __table_args__ = (
+        Index("ix_articles_created_id", "created_at", "id"),
+        Index("ix_articles_author_created", "author_id", "created_at", "id"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     slug: str = Field(unique=True, index=True)
@@ -13,5 +17,9 @@ class Article(TimestampModel, table=True):
     description: str
     body: str
     author_id: int = Field(foreign_key="users.id")
+    # 비정규화 카운터 - FavoriteRepository가 좋아요 변경과 같은 트랜잭션에서 갱신
+    favorites_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # 비정규화 카운터 - CommentRepository가 댓글 작성/삭제와 같은 트랜잭션에서 갱신
+    comments_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
 
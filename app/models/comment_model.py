@@ -1,10 +1,14 @@
-from sqlmodel import Field, SQLModel
+from sqlmodel import Field, Index
 
 from app.models.base import TimestampModel
 
 
 class Comment(TimestampModel, table=True):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 글별 댓글을 작성순으로 페이지 단위로 읽는다 (article_id 단독 조회도 커버)
+        Index("ix_comments_article_created", "article_id", "created_at", "id"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     body: str
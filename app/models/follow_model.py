@@ -1,8 +1,15 @@
-from sqlmodel import Field, SQLModel
+from sqlmodel import Field, Index, SQLModel
 
 
 class Follow(SQLModel, table=True):
     __tablename__ = "follows"
+    __table_args__ = (
+        # 같은 쌍은 한 번만 (팔로우 INSERT ... ON CONFLICT DO NOTHING의 충돌 대상)
+        Index("ux_follows_follower_followee", "follower_id", "followee_id", unique=True),
+        # 팔로워/팔로잉 목록 키셋 페이지네이션 (follows.id 역순)
+        Index("ix_follows_followee_id", "followee_id", "id"),
+        Index("ix_follows_follower_id", "follower_id", "id"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     follower_id: int = Field(foreign_key="users.id")
@@ -1,11 +1,17 @@
-from sqlmodel import Field, SQLModel
+from sqlmodel import Field, Index, SQLModel
 
 
 class Tag(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     name: str = Field(unique=True, index=True)
+    # 비정규화 카운터 - 이 태그가 붙은 게시글 수 (TagRepository가 같은 트랜잭션에서 갱신)
+    usage_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
 
 class ArticleTag(SQLModel, table=True):
     article_id: int = Field(foreign_key="articles.id", primary_key=True)
-    tag_id: int = Field(foreign_key="tag.id", primary_key=True)
+    tag_id: int = Field(foreign_key="tag.id", primary_key=True, index=True)
+
+
+# 인기 태그 조회 (usage_count DESC, name ASC) 정렬을 인덱스 순서 그대로 읽는다
+Index("ix_tag_usage_name", Tag.usage_count.desc(), Tag.name)
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlmodel import Field, Index, SQLModel
+
+
+class TimelineEntry(SQLModel, table=True):
+    """유저별 피드 타임라인 (fan-out-on-write로 미리 채워지는 게시글 목록)"""
+
+    __tablename__ = "timeline"
+    __table_args__ = (
+        Index("ix_timeline_user_created", "user_id", "created_at", "article_id"),
+        # 글을 삭제할 때 모든 팔로워 타임라인에서 그 글을 지운다
+        Index("ix_timeline_article_id", "article_id"),
+    )
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    article_id: int = Field(foreign_key="articles.id", primary_key=True)
+    author_id: int = Field(foreign_key="users.id")
+    created_at: datetime  # 게시글 작성 시각 (피드 정렬 키)
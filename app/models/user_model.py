@@ -10,3 +10,6 @@ class User(SQLModel, table=True):
     hashed_password: str
     bio: str | None = None
     image: str | None = None
+    # 비정규화 카운터 - FollowRepository가 팔로우 변경과 같은 트랜잭션에서 갱신
+    followers_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    following_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
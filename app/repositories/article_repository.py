@@ -1,11 +1,17 @@
+import json
 from typing import Any, TypedDict
 
-from sqlmodel import Session, select, func
+from sqlmodel import Session, and_, exists, false, func, or_, select
+from sqlmodel.sql.expression import SelectOfScalar
 
+from app.core.pagination import Cursor
 from app.models.article_model import Article
 from app.models.favorite_model import Favorite
+from app.models.follow_model import Follow
 from app.models.tag_model import Tag, ArticleTag
 from app.models.user_model import User
+from app.repositories.follow_repository import FollowRepository
+from app.repositories.interfaces import FollowRepositoryInterface
 
 
 class ArticleWithRelations(TypedDict):
@@ -13,12 +19,15 @@ class ArticleWithRelations(TypedDict):
     author: User | None
     tag_list: list[str]
     favorites_count: int
+    comments_count: int
     favorited: bool
+    following: bool
 
 
 class ArticleRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, follow_repo: FollowRepositoryInterface | None = None):
         self._session = session
+        self._follow_repo = follow_repo or FollowRepository(session)
 
     def get_by_slug(self, slug: str) -> Article | None:
         statement = select(Article).where(Article.slug == slug)
@@ -41,8 +50,7 @@ class ArticleRepository:
             slug=slug, title=title, description=description, body=body, author_id=author_id
         )
         self._session.add(article)
-        self._session.commit()
-        self._session.refresh(article)
+        self._session.flush()
         return article
 
     def update(self, article: Article, **kwargs: Any) -> Article:
@@ -50,22 +58,42 @@ class ArticleRepository:
             if value is not None:
                 setattr(article, key, value)
         self._session.add(article)
-        self._session.commit()
-        self._session.refresh(article)
+        self._session.flush()
         return article
 
     def delete(self, article: Article) -> None:
         self._session.delete(article)
-        self._session.commit()
+        self._session.flush()
 
     def get_all_with_relations(
         self,
-        author_id: int | None = None,
+        author: str | None = None,
+        tag: str | None = None,
+        favorited: str | None = None,
         article_ids: list[int] | None = None,
+        followed_by: int | None = None,
         current_user_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> list[ArticleWithRelations]:
-        """모든 관계 데이터를 포함하여 게시글 조회 (배치)"""
-        articles = self._fetch_articles(author_id, article_ids)
+        """모든 관계 데이터를 포함하여 게시글 조회 (배치)
+
+        필터링, 최신순 `(created_at, id)` 정렬, 페이지 자르기는 모두 하나의 SQL에서
+        수행하고, 관계 데이터는 실제로 반환되는 페이지의 게시글에 대해서만 조회한다.
+        `followed_by`를 주면 해당 유저가 팔로우한 작성자의 글만 조회한다 (피드).
+        """
+        statement = self._apply_filters(
+            select(Article),
+            author=author,
+            tag=tag,
+            favorited=favorited,
+            article_ids=article_ids,
+            followed_by=followed_by,
+        )
+        articles = list(
+            self._session.exec(self._paginate(statement, limit, offset, cursor)).all()
+        )
         if not articles:
             return []
 
@@ -74,29 +102,98 @@ class ArticleRepository:
 
         authors = self._fetch_authors_batch(author_id_set)
         tags = self._fetch_tags_batch(article_id_set)
-        favorite_counts = self._fetch_favorite_counts_batch(article_id_set)
         favorited_map = self._fetch_favorited_batch(article_id_set, current_user_id)
+        followed_author_ids = (
+            self._follow_repo.get_followee_ids(current_user_id, author_id_set)
+            if current_user_id
+            else set()
+        )
 
         return [
             ArticleWithRelations(
                 article=article,
                 author=authors.get(article.author_id),
                 tag_list=tags.get(article.id, []),
-                favorites_count=favorite_counts.get(article.id, 0),
+                favorites_count=article.favorites_count,
+                comments_count=article.comments_count,
                 favorited=favorited_map.get(article.id, False),
+                following=article.author_id in followed_author_ids,
             )
             for article in articles
         ]
 
-    def _fetch_articles(
-        self, author_id: int | None, article_ids: list[int] | None
-    ) -> list[Article]:
-        statement = select(Article)
-        if author_id is not None:
-            statement = statement.where(Article.author_id == author_id)
+    def count_all(
+        self,
+        author: str | None = None,
+        tag: str | None = None,
+        favorited: str | None = None,
+        article_ids: list[int] | None = None,
+        followed_by: int | None = None,
+    ) -> int:
+        """필터 조건에 맞는 전체 게시글 수 (페이지와 무관)"""
+        statement = self._apply_filters(
+            select(func.count()).select_from(Article),
+            author=author,
+            tag=tag,
+            favorited=favorited,
+            article_ids=article_ids,
+            followed_by=followed_by,
+        )
+        return self._session.exec(statement).one()
+
+    @staticmethod
+    def _apply_filters(
+        statement: SelectOfScalar,
+        author: str | None = None,
+        tag: str | None = None,
+        favorited: str | None = None,
+        article_ids: list[int] | None = None,
+        followed_by: int | None = None,
+    ) -> SelectOfScalar:
+        """필터를 조인/EXISTS 서브쿼리로 합성 (id 목록을 파이썬으로 가져오지 않는다)"""
+        if author:
+            statement = statement.where(Article.author_id == _user_id_of(author))
+        if tag:
+            tagged = (
+                select(ArticleTag.article_id)
+                .join(Tag, ArticleTag.tag_id == Tag.id)
+                .where(ArticleTag.article_id == Article.id, Tag.name == tag)
+            )
+            statement = statement.where(exists(tagged))
+        if favorited:
+            favorite = select(Favorite.article_id).where(
+                Favorite.user_id == _user_id_of(favorited),
+                Favorite.article_id == Article.id,
+            )
+            statement = statement.where(exists(favorite))
         if article_ids is not None:
             statement = statement.where(Article.id.in_(article_ids))
-        return list(self._session.exec(statement).all())
+        if followed_by is not None:
+            followee_ids = select(Follow.followee_id).where(Follow.follower_id == followed_by)
+            statement = statement.where(Article.author_id.in_(followee_ids))
+        return statement
+
+    @staticmethod
+    def _paginate(
+        statement: SelectOfScalar,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: Cursor | None = None,
+    ) -> SelectOfScalar:
+        if cursor is not None:
+            created_at, article_id = cursor
+            statement = statement.where(
+                or_(
+                    Article.created_at < created_at,
+                    and_(Article.created_at == created_at, Article.id < article_id),
+                )
+            )
+        statement = statement.order_by(Article.created_at.desc(), Article.id.desc())
+        if offset:
+            statement = statement.offset(offset)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
 
     def _fetch_authors_batch(self, author_ids: set[int]) -> dict[int, User]:
         statement = select(User).where(User.id.in_(author_ids))
@@ -113,17 +210,6 @@ class ArticleRepository:
             result.setdefault(article_id, []).append(tag_name)
         return result
 
-    def _fetch_favorite_counts_batch(self, article_ids: set[int]) -> dict[int, int]:
-        statement = (
-            select(Favorite.article_id, func.count(Favorite.article_id))
-            .where(Favorite.article_id.in_(article_ids))
-            .group_by(Favorite.article_id)
-        )
-        return {
-            article_id: count
-            for article_id, count in self._session.exec(statement).all()
-        }
-
     def _fetch_favorited_batch(
         self, article_ids: set[int], user_id: int | None
     ) -> dict[int, bool]:
@@ -140,3 +226,80 @@ class ArticleRepository:
             article_id: article_id in favorited_ids
             for article_id in article_ids
         }
+
+
+class SingleQueryArticleRepository(ArticleRepository):
+    """관계 데이터를 한 번의 SQL로 조회하는 게시글 저장소
+
+    작성자는 조인으로, 태그는 `json_group_array` 집계로, 좋아요 여부는 상관 EXISTS로
+    가져온다. 좋아요/댓글 수는 articles의 카운터 컬럼을 그대로 쓴다.
+    목록/단건 응답마다 DB 왕복이 1회로 줄어든다. 팔로우 여부는 배치 로더와 같이 follow
+    저장소에 묻는다 (팔로우 그래프를 켜면 DB 조회 없이, 아니면 로그인 시 IN 쿼리 1회).
+    (SQLite JSON1 함수 사용)
+    """
+
+    def get_all_with_relations(
+        self,
+        author: str | None = None,
+        tag: str | None = None,
+        favorited: str | None = None,
+        article_ids: list[int] | None = None,
+        followed_by: int | None = None,
+        current_user_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: Cursor | None = None,
+    ) -> list[ArticleWithRelations]:
+        tag_list = (
+            select(func.json_group_array(Tag.name))
+            .select_from(ArticleTag)
+            .join(Tag, ArticleTag.tag_id == Tag.id)
+            .where(ArticleTag.article_id == Article.id)
+            .scalar_subquery()
+        )
+        favorited_by_user = (
+            exists().where(Favorite.article_id == Article.id, Favorite.user_id == current_user_id)
+            if current_user_id
+            else false()
+        )
+        # 페이지를 먼저 잘라낸 뒤 조인해야 서브쿼리가 페이지 행에 대해서만 실행된다
+        page = self._apply_filters(
+            select(Article.id),
+            author=author,
+            tag=tag,
+            favorited=favorited,
+            article_ids=article_ids,
+            followed_by=followed_by,
+        )
+        page = self._paginate(page, limit, offset, cursor).subquery()
+        statement = (
+            select(Article, User, tag_list, favorited_by_user)
+            .join(page, page.c.id == Article.id)
+            .outerjoin(User, User.id == Article.author_id)
+            .order_by(Article.created_at.desc(), Article.id.desc())
+        )
+        rows = self._session.exec(statement).all()
+        followed_author_ids = (
+            self._follow_repo.get_followee_ids(
+                current_user_id, {article.author_id for article, *_ in rows}
+            )
+            if current_user_id
+            else set()
+        )
+
+        return [
+            ArticleWithRelations(
+                article=article,
+                author=author_user,
+                tag_list=json.loads(tags) if tags else [],
+                favorites_count=article.favorites_count,
+                comments_count=article.comments_count,
+                favorited=bool(is_favorited),
+                following=article.author_id in followed_author_ids,
+            )
+            for article, author_user, tags, is_favorited in rows
+        ]
+
+
+def _user_id_of(username: str):
+    return select(User.id).where(User.username == username).scalar_subquery()
@@ -1,13 +1,27 @@
-from sqlmodel import Session, select
+from typing import TypedDict
 
+from sqlmodel import Session, and_, func, or_, select, update
+
+from app.core.pagination import Cursor
+from app.models.article_model import Article
 from app.models.comment_model import Comment
+from app.models.user_model import User
+from app.repositories.follow_repository import FollowRepository
+from app.repositories.interfaces import FollowRepositoryInterface
+
+
+class CommentWithRelations(TypedDict):
+    comment: Comment
+    author: User
+    following: bool
 
 
 class CommentRepository:
     """댓글 데이터 저장소"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, follow_repo: FollowRepositoryInterface | None = None):
         self._session = session
+        self._follow_repo = follow_repo or FollowRepository(session)
 
     def get_by_id(self, comment_id: int) -> Comment | None:
         statement = select(Comment).where(Comment.id == comment_id)
@@ -17,13 +31,84 @@ class CommentRepository:
         statement = select(Comment).where(Comment.article_id == article_id)
         return list(self._session.exec(statement).all())
 
+    def get_with_relations(
+        self,
+        article_id: int,
+        current_user_id: int | None = None,
+        limit: int | None = None,
+        cursor: Cursor | None = None,
+    ) -> list[CommentWithRelations]:
+        """댓글과 작성자, 작성자 팔로우 여부를 댓글 수와 무관하게 2번의 쿼리로 조회
+
+        작성순 `(created_at, id)`으로 정렬하고 커서 다음부터 `limit`개를 반환한다.
+        작성자는 조인으로 함께 가져오며, 작성자가 삭제된 댓글은 제외된다.
+        """
+        statement = (
+            select(Comment, User)
+            .join(User, User.id == Comment.author_id)
+            .where(Comment.article_id == article_id)
+        )
+        if cursor is not None:
+            created_at, comment_id = cursor
+            statement = statement.where(
+                or_(
+                    Comment.created_at > created_at,
+                    and_(Comment.created_at == created_at, Comment.id > comment_id),
+                )
+            )
+        statement = statement.order_by(Comment.created_at, Comment.id).limit(limit)
+        rows = self._session.exec(statement).all()
+        if not rows:
+            return []
+
+        followed_author_ids = (
+            self._follow_repo.get_followee_ids(current_user_id, {author.id for _, author in rows})
+            if current_user_id
+            else set()
+        )
+        return [
+            CommentWithRelations(
+                comment=comment, author=author, following=author.id in followed_author_ids
+            )
+            for comment, author in rows
+        ]
+
     def create(self, body: str, author_id: int, article_id: int) -> Comment:
         comment = Comment(body=body, author_id=author_id, article_id=article_id)
         self._session.add(comment)
-        self._session.commit()
-        self._session.refresh(comment)
+        self._session.flush()
+        self._adjust_comments_count(article_id, 1)
         return comment
 
     def delete(self, comment: Comment) -> None:
         self._session.delete(comment)
-        self._session.commit()
+        self._session.flush()
+        self._adjust_comments_count(comment.article_id, -1)
+
+    def recount_comments(self) -> int:
+        """comments 테이블 기준으로 articles.comments_count를 다시 계산한다
+
+        어긋난 게시글만 갱신하며, 갱신한 게시글 수를 반환한다.
+        """
+        actual_count = (
+            select(func.count())
+            .select_from(Comment)
+            .where(Comment.article_id == Article.id)
+            .scalar_subquery()
+        )
+        statement = (
+            update(Article)
+            .where(Article.comments_count != actual_count)
+            .values(comments_count=actual_count)
+            .execution_options(synchronize_session=False)
+        )
+        return self._session.exec(statement).rowcount
+
+    def _adjust_comments_count(self, article_id: int, delta: int) -> None:
+        """댓글 행 변경과 같은 트랜잭션에서 카운터를 원자적으로 증감"""
+        statement = (
+            update(Article)
+            .where(Article.id == article_id)
+            .values(comments_count=Article.comments_count + delta)
+        )
+        self._session.exec(statement)
@@ -1,31 +1,33 @@
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, func, select, update
 
+from app.models.article_model import Article
 from app.models.favorite_model import Favorite
+from app.repositories.upsert import insert_or_ignore
 
 
 class FavoriteRepository:
     def __init__(self, session: Session):
         self._session = session
 
-    def create(self, user_id: int, article_id: int) -> Favorite:
-        favorite = Favorite(user_id=user_id, article_id=article_id)
-        self._session.add(favorite)
-        self._session.commit()
-        self._session.refresh(favorite)
-        return favorite
+    def create(self, user_id: int, article_id: int) -> bool:
+        """좋아요 추가 (이미 있으면 아무것도 하지 않음) - 새로 추가됐으면 True"""
+        statement = insert_or_ignore(self._session, Favorite, ["user_id", "article_id"]).values(
+            user_id=user_id, article_id=article_id
+        )
+        created = self._session.exec(statement).rowcount == 1
+        if created:
+            self._adjust_favorites_count(article_id, 1)
+        return created
 
-    def delete(self, user_id: int, article_id: int) -> None:
-        statement = select(Favorite).where(
+    def delete(self, user_id: int, article_id: int) -> bool:
+        """좋아요 취소 (한 번의 DELETE) - 실제로 지웠으면 True"""
+        statement = delete(Favorite).where(
             Favorite.user_id == user_id, Favorite.article_id == article_id
         )
-        favorite = self._session.exec(statement).first()
-        if favorite:
-            self._session.delete(favorite)
-            self._session.commit()
-
-    def get_article_ids_by_user(self, user_id: int) -> list[int]:
-        statement = select(Favorite.article_id).where(Favorite.user_id == user_id)
-        return list(self._session.exec(statement).all())
+        deleted = self._session.exec(statement).rowcount == 1
+        if deleted:
+            self._adjust_favorites_count(article_id, -1)
+        return deleted
 
     def is_favorited(self, user_id: int, article_id: int) -> bool:
         statement = select(Favorite).where(
@@ -34,5 +36,33 @@ class FavoriteRepository:
         return self._session.exec(statement).first() is not None
 
     def count_by_article(self, article_id: int) -> int:
-        statement = select(Favorite).where(Favorite.article_id == article_id)
-        return len(list(self._session.exec(statement).all()))
+        statement = select(Article.favorites_count).where(Article.id == article_id)
+        return self._session.exec(statement).first() or 0
+
+    def recount_favorites(self) -> int:
+        """favorite 테이블 기준으로 articles.favorites_count를 다시 계산한다
+
+        어긋난 게시글만 갱신하며, 갱신한 게시글 수를 반환한다.
+        """
+        actual_count = (
+            select(func.count())
+            .select_from(Favorite)
+            .where(Favorite.article_id == Article.id)
+            .scalar_subquery()
+        )
+        statement = (
+            update(Article)
+            .where(Article.favorites_count != actual_count)
+            .values(favorites_count=actual_count)
+            .execution_options(synchronize_session=False)
+        )
+        return self._session.exec(statement).rowcount
+
+    def _adjust_favorites_count(self, article_id: int, delta: int) -> None:
+        """좋아요 행 변경과 같은 트랜잭션에서 카운터를 원자적으로 증감"""
+        statement = (
+            update(Article)
+            .where(Article.id == article_id)
+            .values(favorites_count=Article.favorites_count + delta)
+        )
+        self._session.exec(statement)
@@ -0,0 +1,123 @@
+"""프로세스 내 팔로우 그래프
+
+`follows` 테이블을 유저별 int 집합(팔로우하는 유저)으로 메모리에 올려
+팔로우 여부와 일괄 팔로우 확인을 DB 조회 없이 O(1)로 답한다 (팔로워/팔로잉 수는
+`users`의 카운터 컬럼).
+엔진(DB)마다 하나씩 두고 처음 쓸 때(또는 앱 시작 시) 통째로 읽어 온 뒤, 커밋된
+follow/unfollow만 반영한다. 다른 프로세스의 쓰기는 보이지 않으므로 워커가 하나일
+때만 켜고, 의심되면 `check_follow_graph`로 DB와 비교해 다시 읽는다.
+"""
+
+import threading
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from sqlalchemy import Engine
+from sqlmodel import Session, select
+
+from app.core.cache import PerEngine
+from app.models.follow_model import Follow
+
+
+class FollowGraphDiff(NamedTuple):
+    missing: int  # DB에는 있는데 그래프에 없는 간선 수
+    extra: int  # 그래프에는 있는데 DB에 없는 간선 수
+
+
+class FollowGraph:
+    def __init__(self):
+        self._followees: dict[int, set[int]] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def load(self, edges: Iterable[tuple[int, int]]) -> None:
+        """(follower_id, followee_id) 목록으로 그래프를 새로 만든다"""
+        followees: dict[int, set[int]] = {}
+        for follower_id, followee_id in edges:
+            followees.setdefault(follower_id, set()).add(followee_id)
+        with self._lock:
+            self._followees = followees
+            self.loaded = True
+
+    def add(self, follower_id: int, followee_id: int) -> None:
+        with self._lock:
+            self._followees.setdefault(follower_id, set()).add(followee_id)
+
+    def remove(self, follower_id: int, followee_id: int) -> None:
+        with self._lock:
+            _discard(self._followees, follower_id, followee_id)
+
+    def is_following(self, follower_id: int, followee_id: int) -> bool:
+        return followee_id in self._followees.get(follower_id, ())
+
+    def followee_ids(self, follower_id: int, candidate_ids: set[int]) -> set[int]:
+        return candidate_ids & self._followees.get(follower_id, set())
+
+    def diff(self, edges: Iterable[tuple[int, int]]) -> FollowGraphDiff:
+        expected = set(edges)
+        with self._lock:
+            actual = {
+                (follower_id, followee_id)
+                for follower_id, followee_ids in self._followees.items()
+                for followee_id in followee_ids
+            }
+        return FollowGraphDiff(missing=len(expected - actual), extra=len(actual - expected))
+
+
+def _discard(index: dict[int, set[int]], key: int, value: int) -> None:
+    values = index.get(key)
+    if values is not None:
+        values.discard(value)
+        if not values:
+            del index[key]
+
+
+_graphs: PerEngine[FollowGraph] = PerEngine(FollowGraph)
+_warm_lock = threading.Lock()
+
+
+def get_follow_graph(session: Session) -> FollowGraph:
+    """세션 엔진의 그래프 (아직 읽지 않았으면 커밋된 follows 테이블을 읽어 채운다)"""
+    return warm_follow_graph(session.get_bind())
+
+
+def warm_follow_graph(bind: Engine) -> FollowGraph:
+    """엔진의 그래프를 읽어 둔다 (앱 시작 시 또는 첫 조회 때)
+
+    호출한 세션의 트랜잭션이 아니라 별도 세션으로 읽어 커밋된 간선만 담는다.
+    """
+    graph = _graphs.get(bind)
+    if not graph.loaded:
+        with _warm_lock:
+            if not graph.loaded:
+                graph.load(_committed_edges(bind))
+    return graph
+
+
+def apply_committed(session: Session, change: Callable[[FollowGraph], None]) -> None:
+    """커밋된 follow/unfollow를 이미 읽어 둔 그래프에만 반영
+
+    쓰기 경로에서는 그래프를 읽지 않는다. 아직 읽지 않았으면 다음 조회 때 이 커밋까지
+    포함해 읽으므로 건너뛴다. 읽는 도중의 커밋이 빠지지 않도록 같은 잠금 안에서 확인한다.
+    """
+    graph = _graphs.get(session.get_bind())
+    with _warm_lock:
+        if graph.loaded:
+            change(graph)
+
+
+def check_follow_graph(session: Session, repair: bool = True) -> FollowGraphDiff:
+    """그래프를 DB와 비교하고, 어긋났으면(repair=True) DB에서 다시 읽는다"""
+    bind = session.get_bind()
+    graph = warm_follow_graph(bind)
+    with _warm_lock:
+        edges = _committed_edges(bind)
+        diff = graph.diff(edges)
+        if repair and (diff.missing or diff.extra):
+            graph.load(edges)
+    return diff
+
+
+def _committed_edges(bind: Engine) -> list[tuple[int, int]]:
+    with Session(bind) as session:
+        return list(session.exec(select(Follow.follower_id, Follow.followee_id)).all())
@@ -1,29 +1,46 @@
-from sqlmodel import Session, select
+from collections.abc import Callable
+
+from sqlmodel import Session, delete, func, select, update
 
 from app.models.follow_model import Follow
+from app.models.user_model import User
+from app.repositories.follow_graph import FollowGraph, apply_committed, get_follow_graph
+from app.repositories.unit_of_work import on_commit
+from app.repositories.upsert import insert_or_ignore
 
 
 class FollowRepository:
     def __init__(self, session: Session):
         self._session = session
 
-    def create(self, follower_id: int, followee_id: int) -> Follow:
-        follow = Follow(follower_id=follower_id, followee_id=followee_id)
-        self._session.add(follow)
-        self._session.commit()
-        self._session.refresh(follow)
-        return follow
+    def create(self, follower_id: int, followee_id: int) -> bool:
+        """팔로우 추가 (이미 있으면 아무것도 하지 않음) - 새로 추가됐으면 True"""
+        statement = insert_or_ignore(self._session, Follow, ["follower_id", "followee_id"]).values(
+            follower_id=follower_id, followee_id=followee_id
+        )
+        created = self._session.exec(statement).rowcount == 1
+        if created:
+            self._adjust_follow_counts(follower_id, followee_id, 1)
+        return created
 
     def delete(self, follower_id: int, followee_id: int) -> bool:
-        statement = select(Follow).where(
+        """팔로우 삭제 (한 번의 DELETE) - 실제로 지웠으면 True"""
+        statement = delete(Follow).where(
             Follow.follower_id == follower_id, Follow.followee_id == followee_id
         )
-        follow = self._session.exec(statement).first()
-        if follow:
-            self._session.delete(follow)
-            self._session.commit()
-            return True
-        return False
+        deleted = self._session.exec(statement).rowcount == 1
+        if deleted:
+            self._adjust_follow_counts(follower_id, followee_id, -1)
+        return deleted
+
+    def get_followee_ids(self, follower_id: int, candidate_ids: set[int]) -> set[int]:
+        """candidate_ids 중 follower가 팔로우하는 유저 id (한 번의 IN 쿼리)"""
+        if not candidate_ids:
+            return set()
+        statement = select(Follow.followee_id).where(
+            Follow.follower_id == follower_id, Follow.followee_id.in_(candidate_ids)
+        )
+        return set(self._session.exec(statement).all())
 
     def is_following(self, follower_id: int, followee_id: int) -> bool:
         statement = select(Follow).where(
@@ -31,3 +48,87 @@ class FollowRepository:
         )
         follow = self._session.exec(statement).first()
         return follow is not None
+
+    def get_followers(
+        self, user_id: int, limit: int | None = None, cursor: int | None = None
+    ) -> list[tuple[User, int]]:
+        """user_id를 팔로우하는 유저를 최근 팔로우 순으로 (유저, follows.id) 목록 반환"""
+        return self._page(Follow.follower_id, Follow.followee_id == user_id, limit, cursor)
+
+    def get_following(
+        self, user_id: int, limit: int | None = None, cursor: int | None = None
+    ) -> list[tuple[User, int]]:
+        """user_id가 팔로우하는 유저를 최근 팔로우 순으로 (유저, follows.id) 목록 반환"""
+        return self._page(Follow.followee_id, Follow.follower_id == user_id, limit, cursor)
+
+    def recount_follows(self) -> dict[str, int]:
+        """follows 테이블 기준으로 users의 팔로워/팔로잉 수를 다시 계산한다
+
+        카운터별로 어긋나서 갱신한 유저 수를 반환한다.
+        """
+        repaired = {}
+        for counter, column in (
+            ("followers_count", Follow.followee_id),
+            ("following_count", Follow.follower_id),
+        ):
+            actual_count = (
+                select(func.count()).select_from(Follow).where(column == User.id).scalar_subquery()
+            )
+            statement = (
+                update(User)
+                .where(getattr(User, counter) != actual_count)
+                .values({counter: actual_count})
+                .execution_options(synchronize_session=False)
+            )
+            repaired[counter] = self._session.exec(statement).rowcount
+        return repaired
+
+    def _page(self, user_column, condition, limit: int | None, cursor: int | None):
+        """follows.id 역순 키셋 페이지 (커서는 마지막으로 받은 follows.id)"""
+        statement = select(User, Follow.id).join(Follow, user_column == User.id).where(condition)
+        if cursor is not None:
+            statement = statement.where(Follow.id < cursor)
+        statement = statement.order_by(Follow.id.desc()).limit(limit)
+        return [(user, follow_id) for user, follow_id in self._session.exec(statement).all()]
+
+    def _adjust_follow_counts(self, follower_id: int, followee_id: int, delta: int) -> None:
+        """팔로우 행 변경과 같은 트랜잭션에서 양쪽 카운터를 원자적으로 증감"""
+        self._session.exec(
+            update(User)
+            .where(User.id == followee_id)
+            .values(followers_count=User.followers_count + delta)
+        )
+        self._session.exec(
+            update(User)
+            .where(User.id == follower_id)
+            .values(following_count=User.following_count + delta)
+        )
+
+
+class GraphFollowRepository(FollowRepository):
+    """조회는 프로세스 내 팔로우 그래프로 답하고, 쓰기는 커밋 후 그래프에 반영
+
+    그래프에는 커밋된 상태만 있으므로 같은 트랜잭션에서 방금 쓴 팔로우는 보이지 않는다.
+    """
+
+    def create(self, follower_id: int, followee_id: int) -> bool:
+        created = super().create(follower_id, followee_id)
+        if created:
+            self._after_commit(lambda graph: graph.add(follower_id, followee_id))
+        return created
+
+    def delete(self, follower_id: int, followee_id: int) -> bool:
+        deleted = super().delete(follower_id, followee_id)
+        if deleted:
+            self._after_commit(lambda graph: graph.remove(follower_id, followee_id))
+        return deleted
+
+    def get_followee_ids(self, follower_id: int, candidate_ids: set[int]) -> set[int]:
+        return get_follow_graph(self._session).followee_ids(follower_id, candidate_ids)
+
+    def is_following(self, follower_id: int, followee_id: int) -> bool:
+        return get_follow_graph(self._session).is_following(follower_id, followee_id)
+
+    def _after_commit(self, change: Callable[[FollowGraph], None]) -> None:
+        # 쓰기 중에는 그래프를 읽지 않는다 (롤백되면 콜백도 버려진다)
+        on_commit(self._session, lambda: apply_committed(self._session, change))
@@ -1,17 +1,25 @@
 from typing import Any, Protocol, TYPE_CHECKING
 
+from app.core.pagination import Cursor
 from app.models.article_model import Article
 from app.models.comment_model import Comment
 from app.models.user_model import User
 
 if TYPE_CHECKING:
     from app.repositories.article_repository import ArticleWithRelations
+    from app.repositories.comment_repository import CommentWithRelations
+
+
+class UnitOfWorkInterface(Protocol):
+    def __enter__(self) -> "UnitOfWorkInterface": ...
+    def __exit__(self, exc_type, exc, tb) -> None: ...
 
 
 class UserRepositoryInterface(Protocol):
     def get_by_id(self, user_id: int) -> User | None: ...
     def get_by_email(self, email: str) -> User | None: ...
     def get_by_username(self, username: str) -> User | None: ...
+    def get_by_usernames(self, usernames: list[str]) -> list[User]: ...
     def create(self, email: str, username: str, password: str) -> User: ...
     def update(self, user: User) -> User: ...
 
@@ -23,10 +31,24 @@ class ArticleRepositoryInterface(Protocol):
     ) -> list[Article]: ...
     def get_all_with_relations(
         self,
-        author_id: int | None = None,
+        author: str | None = None,
+        tag: str | None = None,
+        favorited: str | None = None,
         article_ids: list[int] | None = None,
+        followed_by: int | None = None,
         current_user_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> "list[ArticleWithRelations]": ...
+    def count_all(
+        self,
+        author: str | None = None,
+        tag: str | None = None,
+        favorited: str | None = None,
+        article_ids: list[int] | None = None,
+        followed_by: int | None = None,
+    ) -> int: ...
     def create(
         self, slug: str, title: str, description: str, body: str, author_id: int
     ) -> Article: ...
@@ -36,15 +58,14 @@ class ArticleRepositoryInterface(Protocol):
 
 class TagRepositoryInterface(Protocol):
     def add_tags_to_article(self, article_id: int, tag_names: list[str]) -> None: ...
+    def remove_tags_from_article(self, article_id: int) -> None: ...
     def get_tags_for_article(self, article_id: int) -> list[str]: ...
-    def get_article_ids_by_tag(self, tag_name: str) -> list[int]: ...
-    def get_all_tags(self) -> list[str]: ...
+    def get_all_tags(self, limit: int | None = None) -> list[str]: ...
 
 
 class FavoriteRepositoryInterface(Protocol):
-    def create(self, user_id: int, article_id: int) -> None: ...
-    def delete(self, user_id: int, article_id: int) -> None: ...
-    def get_article_ids_by_user(self, user_id: int) -> list[int]: ...
+    def create(self, user_id: int, article_id: int) -> bool: ...
+    def delete(self, user_id: int, article_id: int) -> bool: ...
     def is_favorited(self, user_id: int, article_id: int) -> bool: ...
     def count_by_article(self, article_id: int) -> int: ...
 
@@ -52,11 +73,42 @@ class FavoriteRepositoryInterface(Protocol):
 class CommentRepositoryInterface(Protocol):
     def get_by_id(self, comment_id: int) -> Comment | None: ...
     def get_by_article_id(self, article_id: int) -> list[Comment]: ...
+    def get_with_relations(
+        self,
+        article_id: int,
+        current_user_id: int | None = None,
+        limit: int | None = None,
+        cursor: Cursor | None = None,
+    ) -> "list[CommentWithRelations]": ...
     def create(self, body: str, author_id: int, article_id: int) -> Comment: ...
     def delete(self, comment: Comment) -> None: ...
 
 
 class FollowRepositoryInterface(Protocol):
-    def create(self, follower_id: int, followee_id: int) -> None: ...
+    def create(self, follower_id: int, followee_id: int) -> bool: ...
     def delete(self, follower_id: int, followee_id: int) -> bool: ...
     def is_following(self, follower_id: int, followee_id: int) -> bool: ...
+    def get_followee_ids(self, follower_id: int, candidate_ids: set[int]) -> set[int]: ...
+    def get_followers(
+        self, user_id: int, limit: int | None = None, cursor: int | None = None
+    ) -> list[tuple[User, int]]: ...
+    def get_following(
+        self, user_id: int, limit: int | None = None, cursor: int | None = None
+    ) -> list[tuple[User, int]]: ...
+
+
+class TimelineRepositoryInterface(Protocol):
+    def fan_out(self, article: Article) -> int: ...
+    def backfill(self, user_id: int, author_id: int) -> None: ...
+    def backfill_followers(self, author_id: int) -> int: ...
+    def rebuild(self) -> int: ...
+    def remove_author(self, user_id: int, author_id: int) -> None: ...
+    def remove_article(self, article_id: int) -> None: ...
+    def get_feed_article_ids(
+        self,
+        user_id: int,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: Cursor | None = None,
+    ) -> list[int]: ...
+    def count_feed(self, user_id: int) -> int: ...
@@ -1,6 +1,19 @@
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, func, insert, select, update
 
+from app.core.cache import LRUCache, PerEngine, TTLCache
 from app.models.tag_model import ArticleTag, Tag
+from app.repositories.unit_of_work import on_commit
+from app.repositories.upsert import insert_or_ignore
+
+TAG_ID_CACHE_SIZE = 1024
+POPULAR_TAGS_TTL = 60.0  # 초
+
+# 태그 이름 -> id (태그는 삭제되지 않으므로 커밋된 매핑은 계속 유효하다)
+_tag_id_caches: PerEngine[LRUCache[str, int]] = PerEngine(lambda: LRUCache(TAG_ID_CACHE_SIZE))
+# limit -> 인기순 태그 목록 (태그 사용량이 바뀌는 커밋마다 비운다)
+_popular_tags_caches: PerEngine[TTLCache[int | None, list[str]]] = PerEngine(
+    lambda: TTLCache(POPULAR_TAGS_TTL)
+)
 
 
 class TagRepository:
@@ -8,11 +21,26 @@ class TagRepository:
         self._session = session
 
     def add_tags_to_article(self, article_id: int, tag_names: list[str]) -> None:
-        for tag_name in tag_names:
-            tag = self._get_or_create(tag_name)
-            article_tag = ArticleTag(article_id=article_id, tag_id=tag.id)
-            self._session.add(article_tag)
-        self._session.commit()
+        """태그 id를 한꺼번에 확보한 뒤 article_tag 행을 한 번의 INSERT로 추가"""
+        names = list(dict.fromkeys(tag_names))
+        if not names:
+            return
+        tag_ids = self._resolve_tag_ids(names)
+        rows = [{"article_id": article_id, "tag_id": tag_ids[name]} for name in names]
+        self._session.exec(insert(ArticleTag).values(rows))
+        self._adjust_usage_count(list(tag_ids.values()), 1)
+
+    def remove_tags_from_article(self, article_id: int) -> None:
+        """게시글 삭제 시 article_tag 행을 지우고 태그 사용량을 줄인다"""
+        tag_ids = list(
+            self._session.exec(
+                select(ArticleTag.tag_id).where(ArticleTag.article_id == article_id)
+            ).all()
+        )
+        if not tag_ids:
+            return
+        self._session.exec(delete(ArticleTag).where(ArticleTag.article_id == article_id))
+        self._adjust_usage_count(tag_ids, -1)
 
     def get_tags_for_article(self, article_id: int) -> list[str]:
         statement = (
@@ -22,24 +50,91 @@ class TagRepository:
         )
         return list(self._session.exec(statement).all())
 
-    def get_article_ids_by_tag(self, tag_name: str) -> list[int]:
+    def get_all_tags(self, limit: int | None = None) -> list[str]:
+        """사용 중인 태그를 많이 쓰인 순으로 반환 (TTL 캐시)"""
+        cache = _popular_tags_caches.get(self._session.get_bind())
+        tags = cache.get(limit)
+        if tags is None:
+            statement = (
+                select(Tag.name)
+                .where(Tag.usage_count > 0)
+                .order_by(Tag.usage_count.desc(), Tag.name)
+                .limit(limit)
+            )
+            tags = list(self._session.exec(statement).all())
+            cache.put(limit, tags)
+        return tags
+
+    def recount_usage(self) -> int:
+        """article_tag 기준으로 tag.usage_count를 다시 계산한다 (갱신한 태그 수 반환)"""
+        actual_count = (
+            select(func.count())
+            .select_from(ArticleTag)
+            .where(ArticleTag.tag_id == Tag.id)
+            .scalar_subquery()
+        )
         statement = (
-            select(ArticleTag.article_id)
-            .join(Tag, ArticleTag.tag_id == Tag.id)
-            .where(Tag.name == tag_name)
+            update(Tag)
+            .where(Tag.usage_count != actual_count)
+            .values(usage_count=actual_count)
+            .execution_options(synchronize_session=False)
         )
-        return list(self._session.exec(statement).all())
+        repaired = self._session.exec(statement).rowcount
+        self._invalidate_popular_tags()
+        return repaired
+
+    def _resolve_tag_ids(self, names: list[str]) -> dict[str, int]:
+        """캐시 -> IN 조회 -> INSERT ... ON CONFLICT DO NOTHING 순으로 태그 id를 채운다"""
+        cache = _tag_id_caches.get(self._session.get_bind())
+        tag_ids = {name: tag_id for name in names if (tag_id := cache.get(name)) is not None}
+
+        missing = [name for name in names if name not in tag_ids]
+        if missing:
+            found = self._session.exec(
+                select(Tag.name, Tag.id).where(Tag.name.in_(missing))
+            ).all()
+            tag_ids.update(found)
+
+            missing = [name for name in missing if name not in tag_ids]
+            if missing:
+                tag_ids.update(self._insert_tags(missing))
+
+            resolved = [(name, tag_ids[name]) for name in names]
+            on_commit(self._session, lambda: cache.put_many(resolved))
+        return tag_ids
+
+    def _adjust_usage_count(self, tag_ids: list[int], delta: int) -> None:
+        statement = (
+            update(Tag)
+            .where(Tag.id.in_(tag_ids))
+            .values(usage_count=Tag.usage_count + delta)
+            .execution_options(synchronize_session=False)
+        )
+        self._session.exec(statement)
+        self._invalidate_popular_tags()
+
+    def _invalidate_popular_tags(self) -> None:
+        # 복제본에서 읽은 목록도 같은 쓰기로 낡으므로 엔진별 캐시를 모두 비운다
+        # (복제가 따라오기 전에 다시 채워진 목록은 최대 TTL 동안 낡을 수 있다)
+        on_commit(self._session, _clear_popular_tags)
+
+    def _insert_tags(self, names: list[str]) -> dict[str, int]:
+        statement = (
+            insert_or_ignore(self._session, Tag, ["name"])
+            .values([{"name": name} for name in names])
+            .returning(Tag.name, Tag.id)
+        )
+        inserted = dict(self._session.exec(statement).all())
+
+        # 동시에 다른 요청이 먼저 넣은 태그는 RETURNING에 나오지 않으므로 다시 조회
+        conflicted = [name for name in names if name not in inserted]
+        if conflicted:
+            inserted.update(
+                self._session.exec(select(Tag.name, Tag.id).where(Tag.name.in_(conflicted))).all()
+            )
+        return inserted
 
-    def get_all_tags(self) -> list[str]:
-        statement = select(Tag.name)
-        return list(self._session.exec(statement).all())
 
-    def _get_or_create(self, tag_name: str) -> Tag:
-        statement = select(Tag).where(Tag.name == tag_name)
-        tag = self._session.exec(statement).first()
-        if not tag:
-            tag = Tag(name=tag_name)
-            self._session.add(tag)
-            self._session.commit()
-            self._session.refresh(tag)
-        return tag
+def _clear_popular_tags() -> None:
+    for cache in _popular_tags_caches.values():
+        cache.clear()
@@ -0,0 +1,185 @@
+from sqlalchemy import bindparam
+from sqlmodel import Session, and_, delete, func, insert, literal, or_, select, union
+
+from app.core.pagination import Cursor
+from app.models.article_model import Article
+from app.models.follow_model import Follow
+from app.models.timeline_model import TimelineEntry
+from app.models.user_model import User
+from app.repositories.upsert import insert_or_ignore
+
+
+class TimelineRepository:
+    """팔로워별 피드 타임라인 저장소 (하이브리드 fan-out)
+
+    팔로워 수가 `fanout_threshold` 이하인 작성자의 글은 작성 시점에 팔로워들의
+    타임라인에 미리 기록하고(fan-out-on-write), 그보다 많은 작성자의 글은
+    피드 조회 시점에 follows 조인으로 병합한다(fan-out-on-read).
+    작성자가 언팔로우로 임계값 이하로 내려오면 pull로만 보이던 글을 남은 팔로워의
+    타임라인에 채운다(`backfill_followers`).
+    """
+
+    def __init__(self, session: Session, fanout_threshold: int, backfill_limit: int):
+        self._session = session
+        self._fanout_threshold = fanout_threshold
+        self._backfill_limit = backfill_limit
+
+    def fan_out(self, article: Article) -> int:
+        """새 글을 작성자의 팔로워 타임라인에 기록한다. 기록한 팔로워 수를 반환"""
+        if self._is_over_threshold(article.author_id):
+            return 0
+
+        followers = (
+            select(
+                Follow.follower_id,
+                literal(article.id),
+                literal(article.author_id),
+                literal(article.created_at),
+            )
+            .where(Follow.followee_id == article.author_id)
+            .distinct()
+        )
+        statement = insert(TimelineEntry).from_select(
+            ["user_id", "article_id", "author_id", "created_at"], followers
+        )
+        return self._session.exec(statement).rowcount
+
+    def backfill(self, user_id: int, author_id: int) -> None:
+        """새로 팔로우한 작성자의 최근 글을 타임라인에 채워 넣는다"""
+        if self._is_over_threshold(author_id):
+            return
+
+        recent_articles = (
+            select(literal(user_id), Article.id, Article.author_id, Article.created_at)
+            .where(Article.author_id == author_id)
+            .order_by(Article.created_at.desc(), Article.id.desc())
+            .limit(self._backfill_limit)
+        )
+        self._insert_entries(recent_articles)
+
+    def backfill_followers(self, author_id: int) -> int:
+        """방금 임계값 이하로 내려온 작성자(pull -> push)의 글을 남은 팔로워 타임라인에 채운다
+
+        언팔로우로 팔로워가 한 명 줄어든 직후에 호출한다. 임계값을 넘는 동안 쓴 글은
+        타임라인에 없으므로, 채우지 않으면 작성자가 임계값을 넘지 않게 되는 순간 피드에서
+        사라진다. 그 기간이 얼마나 길었는지 모르므로 `backfill_limit`로 자르지 않고 글 전체를
+        채운다(`rebuild`와 같은 상태, 팔로워는 임계값 이하). 채운 행 수를 반환한다.
+        """
+        if self._followers_count(author_id) != self._fanout_threshold:
+            return 0
+
+        entries = (
+            select(Follow.follower_id, Article.id, Article.author_id, Article.created_at)
+            .join(Article, Article.author_id == Follow.followee_id)
+            .where(Follow.followee_id == author_id)
+        )
+        return self._insert_entries(entries)
+
+    def rebuild(self) -> int:
+        """follows와 articles를 기준으로 타임라인 전체를 다시 만든다 (다시 채운 행 수 반환)
+
+        기능을 기존 DB에서 처음 켜거나, 껐다 켜는 동안 어긋난 타임라인을 복구할 때 쓴다.
+        임계값 이하 작성자의 글은 팔로워마다 모두 기록하고, 대형 작성자의 글은 조회 시
+        병합되므로 기록하지 않는다.
+        """
+        self._session.exec(delete(TimelineEntry))
+        entries = (
+            select(Follow.follower_id, Article.id, Article.author_id, Article.created_at)
+            .join(Article, Article.author_id == Follow.followee_id)
+            .join(User, User.id == Follow.followee_id)
+            .where(User.followers_count <= self._fanout_threshold)
+        )
+        return self._insert_entries(entries)
+
+    def remove_author(self, user_id: int, author_id: int) -> None:
+        """언팔로우한 작성자의 글을 타임라인에서 제거한다"""
+        statement = delete(TimelineEntry).where(
+            TimelineEntry.user_id == user_id, TimelineEntry.author_id == author_id
+        )
+        self._session.exec(statement)
+
+    def remove_article(self, article_id: int) -> None:
+        statement = delete(TimelineEntry).where(TimelineEntry.article_id == article_id)
+        self._session.exec(statement)
+
+    def get_feed_article_ids(
+        self,
+        user_id: int,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: Cursor | None = None,
+    ) -> list[int]:
+        """타임라인과 대형 작성자의 글을 병합해 최신순 게시글 id 페이지를 반환"""
+        feed = _FEED.c
+        statement = select(feed.article_id)
+        if cursor is not None:
+            created_at, article_id = cursor
+            statement = statement.where(
+                or_(
+                    feed.created_at < created_at,
+                    and_(feed.created_at == created_at, feed.article_id < article_id),
+                )
+            )
+        statement = statement.order_by(feed.created_at.desc(), feed.article_id.desc())
+        if offset:
+            statement = statement.offset(offset)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return list(self._session.exec(statement, params=self._feed_params(user_id)).all())
+
+    def count_feed(self, user_id: int) -> int:
+        statement = select(func.count()).select_from(_FEED)
+        return self._session.exec(statement, params=self._feed_params(user_id)).one()
+
+    def _feed_params(self, user_id: int) -> dict[str, int]:
+        return {"feed_user_id": user_id, "fanout_threshold": self._fanout_threshold}
+
+    def _is_over_threshold(self, author_id: int) -> bool:
+        return self._followers_count(author_id) > self._fanout_threshold
+
+    def _followers_count(self, author_id: int) -> int:
+        statement = select(User.followers_count).where(User.id == author_id)
+        return self._session.exec(statement).first() or 0
+
+    def _insert_entries(self, entries) -> int:
+        """(user_id, article_id, author_id, created_at) SELECT를 타임라인에 넣는다
+
+        이미 있는 항목(임계값을 오가며 남은 글, 기능을 껐다 켠 동안의 글)은 건너뛴다.
+        SQLite는 `INSERT ... SELECT ... ON CONFLICT`의 SELECT에 WHERE가 있어야 하므로
+        호출하는 쪽이 조건을 붙인다.
+        """
+        statement = insert_or_ignore(self._session, TimelineEntry, ["user_id", "article_id"])
+        statement = statement.from_select(
+            ["user_id", "article_id", "author_id", "created_at"], entries
+        )
+        return self._session.exec(statement).rowcount
+
+
+def _build_feed_subquery():
+    """타임라인(push)과 대형 작성자의 글(pull)을 합친 피드 서브쿼리
+
+    요청마다 구문을 다시 만드는 비용을 피하기 위해 모듈 로드 시 한 번만 만들고,
+    유저 id와 임계값은 바인드 파라미터로 넘긴다.
+    """
+    user_id = bindparam("feed_user_id")
+    threshold = bindparam("fanout_threshold")
+
+    pushed = select(
+        TimelineEntry.article_id.label("article_id"),
+        TimelineEntry.created_at.label("created_at"),
+    ).where(TimelineEntry.user_id == user_id)
+
+    # 팔로워 수는 users.followers_count 비정규화 카운터로 판단
+    large_authors = (
+        select(Follow.followee_id)
+        .join(User, User.id == Follow.followee_id)
+        .where(Follow.follower_id == user_id, User.followers_count > threshold)
+    )
+    pulled = select(
+        Article.id.label("article_id"), Article.created_at.label("created_at")
+    ).where(Article.author_id.in_(large_authors))
+
+    return union(pushed, pulled).subquery("feed")
+
+
+_FEED = _build_feed_subquery()
@@ -0,0 +1,52 @@
+from collections.abc import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import Session
+
+_AFTER_COMMIT = "after_commit_callbacks"
+
+
+class UnitOfWork:
+    """요청 단위 트랜잭션
+
+    저장소는 flush만 하고, 서비스가 쓰기 작업을 `with uow:`로 감싼다.
+    가장 바깥 블록이 끝날 때 한 번만 커밋하고, 예외가 나면 전체를 롤백한다.
+    같은 요청 안의 서비스들은 같은 UnitOfWork를 공유하므로 블록이 중첩될 수 있다.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+        self._depth = 0
+
+    def __enter__(self) -> "UnitOfWork":
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        if exc_type is None:
+            self._session.commit()
+        else:
+            self._session.rollback()
+
+
+def on_commit(session: Session, callback: Callable[[], None]) -> None:
+    """현재 트랜잭션이 커밋된 뒤에 실행할 콜백 등록 (롤백되면 버린다)
+
+    프로세스 캐시처럼 DB 밖의 상태는 커밋이 확정된 뒤에만 갱신해야 한다.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+@event.listens_for(SASession, "after_commit")
+def _run_after_commit(session: SASession) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT, []):
+        callback()
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_after_commit(session: SASession) -> None:
+    session.info.pop(_AFTER_COMMIT, None)
@@ -0,0 +1,17 @@
+"""충돌 무시 INSERT (`INSERT ... ON CONFLICT DO NOTHING`)
+
+확인 후 삽입(SELECT -> INSERT)은 왕복이 두 번이고 동시 요청에서 중복/무결성 오류가
+난다. 유니크 키 충돌을 DB가 건너뛰게 하고, 실제로 들어갔는지는 rowcount/RETURNING으로
+판단한다.
+"""
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session
+
+_DIALECT_INSERT = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def insert_or_ignore(session: Session, model, index_elements: list[str]):
+    """`index_elements` 유니크 키가 충돌하는 행은 건너뛰는 INSERT 구문 (`.values()`를 이어 쓴다)"""
+    insert = _DIALECT_INSERT[session.get_bind().dialect.name]
+    return insert(model).on_conflict_do_nothing(index_elements=index_elements)
@@ -1,6 +1,11 @@
 from sqlmodel import Session, select
 
+from app.core.identity_cache import identity_cache
 from app.models.user_model import User
+from app.repositories.unit_of_work import on_commit
+
+# 유저가 직접 수정하는 컬럼 (카운터 등은 다른 저장소가 관리)
+_EDITABLE_FIELDS = ("email", "username", "hashed_password", "bio", "image")
 
 
 class UserRepository:
@@ -19,15 +24,31 @@ class UserRepository:
         statement = select(User).where(User.username == username)
         return self._session.exec(statement).first()
 
+    def get_by_usernames(self, usernames: list[str]) -> list[User]:
+        """여러 유저를 한 번의 IN 쿼리로 조회 (순서는 보장하지 않는다)"""
+        if not usernames:
+            return []
+        statement = select(User).where(User.username.in_(usernames))
+        return list(self._session.exec(statement).all())
+
     def create(self, email: str, username: str, password: str) -> User:
         user = User(email=email, username=username, hashed_password=password)
         self._session.add(user)
-        self._session.commit()
-        self._session.refresh(user)
+        self._session.flush()
         return user
 
     def update(self, user: User) -> User:
-        self._session.add(user)
-        self._session.commit()
-        self._session.refresh(user)
+        """변경 내용을 반영
+
+        인증 캐시에서 온 분리된 User는 카운터 값이 오래됐을 수 있으므로, 세션의 행을
+        읽어 수정 가능한 컬럼만 옮겨 적는다.
+        """
+        if user not in self._session:
+            detached = user
+            user = self._session.get(User, detached.id)
+            for field in _EDITABLE_FIELDS:
+                setattr(user, field, getattr(detached, field))
+        self._session.flush()
+        user_id = user.id
+        on_commit(self._session, lambda: identity_cache.invalidate_user(user_id))
         return user
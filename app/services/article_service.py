@@ -1,12 +1,15 @@
 import re
 
 from app.core.error_handlers import get_article_or_404, check_author_permission
+from app.core.pagination import DEFAULT_PAGE_SIZE, Cursor, decode_cursor, encode_cursor
 from app.models.user_model import User
 from app.repositories.article_repository import ArticleWithRelations
 from app.repositories.interfaces import (
     ArticleRepositoryInterface,
     FavoriteRepositoryInterface,
     TagRepositoryInterface,
+    TimelineRepositoryInterface,
+    UnitOfWorkInterface,
     UserRepositoryInterface,
 )
 from app.dtos.response import ArticleResponse, ArticleResponseWrapper
@@ -16,15 +19,19 @@ class ArticleService:
 
     def __init__(
         self,
+        uow: UnitOfWorkInterface,
         article_repo: ArticleRepositoryInterface,
         user_repo: UserRepositoryInterface,
         tag_repo: TagRepositoryInterface,
         favorite_repo: FavoriteRepositoryInterface,
+        timeline_repo: TimelineRepositoryInterface | None = None,
     ):
+        self._uow = uow
         self._article_repo = article_repo
         self._user_repo = user_repo
         self._tag_repo = tag_repo
         self._favorite_repo = favorite_repo
+        self._timeline_repo = timeline_repo
 
     def create_article(
         self,
@@ -35,23 +42,29 @@ class ArticleService:
         tag_list: list[str] | None = None,
     ) -> ArticleResponse:
         slug = self._slugify(title)
-        article = self._article_repo.create(
-            slug=slug,
-            title=title,
-            description=description,
-            body=body,
-            author_id=author.id,
-        )
+        with self._uow:
+            article = self._article_repo.create(
+                slug=slug,
+                title=title,
+                description=description,
+                body=body,
+                author_id=author.id,
+            )
+
+            if tag_list:
+                self._tag_repo.add_tags_to_article(article.id, tag_list)
 
-        if tag_list:
-            self._tag_repo.add_tags_to_article(article.id, tag_list)
+            if self._timeline_repo is not None:
+                self._timeline_repo.fan_out(article)
 
         article_data = ArticleWithRelations(
             article=article,
             author=author,
             tag_list=tag_list or [],
             favorites_count=0,
+            comments_count=0,
             favorited=False,
+            following=False,
         )
         return ArticleResponse.from_article_data(article_data)
 
@@ -67,28 +80,48 @@ class ArticleService:
         tag: str | None = None,
         favorited: str | None = None,
         current_user_id: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> ArticleResponseWrapper:
-        author_id = self._get_author_id(author)
-        if author and author_id is None:
-            return ArticleResponseWrapper(articles=[], articlesCount=0)
-
-        article_ids = self._get_filtered_article_ids(tag, favorited)
-        if article_ids is not None and not article_ids:
-            return ArticleResponseWrapper(articles=[], articlesCount=0)
+        decoded_cursor = decode_cursor(cursor) if cursor else None
 
         articles_data = self._article_repo.get_all_with_relations(
-            author_id=author_id,
-            article_ids=article_ids,
+            author=author,
+            tag=tag,
+            favorited=favorited,
             current_user_id=current_user_id,
+            limit=limit,
+            offset=offset,
+            cursor=decoded_cursor,
         )
-        articles_response = [
-            ArticleResponse.from_article_data(article_data)
-            for article_data in articles_data
-        ]
-        return ArticleResponseWrapper(
-            articles=articles_response,
-            articlesCount=len(articles_response),
+        articles_count = self._article_repo.count_all(
+            author=author, tag=tag, favorited=favorited
+        )
+        return self._build_page(articles_data, articles_count, limit)
+
+    def get_feed(
+        self,
+        current_user_id: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> ArticleResponseWrapper:
+        """팔로우한 작성자들의 게시글 피드 (팔로우 수와 무관하게 한 번의 목록 쿼리)"""
+        decoded_cursor = decode_cursor(cursor) if cursor else None
+
+        if self._timeline_repo is not None:
+            return self._get_feed_from_timeline(current_user_id, limit, offset, decoded_cursor)
+
+        articles_data = self._article_repo.get_all_with_relations(
+            current_user_id=current_user_id,
+            limit=limit,
+            offset=offset,
+            cursor=decoded_cursor,
+            followed_by=current_user_id,
         )
+        articles_count = self._article_repo.count_all(followed_by=current_user_id)
+        return self._build_page(articles_data, articles_count, limit)
 
     def update_article(
         self,
@@ -98,33 +131,54 @@ class ArticleService:
         description: str | None = None,
         body: str | None = None,
     ) -> ArticleResponse | None:
-        article = get_article_or_404(self._article_repo, slug)
-        check_author_permission(article, user)
+        with self._uow:
+            article = get_article_or_404(self._article_repo, slug)
+            check_author_permission(article, user)
 
-        updated_article = self._article_repo.update(
-            article, title=title, description=description, body=body
-        )
-        return self._get_article_response(updated_article.id)
+            updated_article = self._article_repo.update(
+                article, title=title, description=description, body=body
+            )
+            return self._get_article_response(updated_article.id)
 
     def delete_article(self, slug: str, user: User) -> None:
-        article = get_article_or_404(self._article_repo, slug)
-        check_author_permission(article, user)
-        self._article_repo.delete(article)
+        with self._uow:
+            article = get_article_or_404(self._article_repo, slug)
+            check_author_permission(article, user)
+            if self._timeline_repo is not None:
+                self._timeline_repo.remove_article(article.id)
+            self._tag_repo.remove_tags_from_article(article.id)
+            self._article_repo.delete(article)
 
     def favorite_article(self, slug: str, user: User) -> ArticleResponse | None:
-        article = get_article_or_404(self._article_repo, slug)
-
-        if not self._favorite_repo.is_favorited(user_id=user.id, article_id=article.id):
+        with self._uow:
+            article = get_article_or_404(self._article_repo, slug)
+            # 이미 좋아요한 경우 DB가 INSERT를 건너뛴다 (확인 조회 없이 멱등)
             self._favorite_repo.create(user_id=user.id, article_id=article.id)
 
-        return self._get_article_response(article.id, user.id)
+            return self._get_article_response(article.id, user.id)
 
     def unfavorite_article(self, slug: str, user: User) -> ArticleResponse | None:
-        article = get_article_or_404(self._article_repo, slug)
-        self._favorite_repo.delete(user_id=user.id, article_id=article.id)
-        return self._get_article_response(article.id, user.id)
+        with self._uow:
+            article = get_article_or_404(self._article_repo, slug)
+            self._favorite_repo.delete(user_id=user.id, article_id=article.id)
+            return self._get_article_response(article.id, user.id)
 
     # Private methods
+    def _get_feed_from_timeline(
+        self, user_id: int, limit: int, offset: int, cursor: Cursor | None
+    ) -> ArticleResponseWrapper:
+        """타임라인 테이블에서 페이지의 게시글 id를 얻은 뒤 관계 데이터를 배치 조회"""
+        article_ids = self._timeline_repo.get_feed_article_ids(user_id, limit, offset, cursor)
+        articles_data = (
+            self._article_repo.get_all_with_relations(
+                article_ids=article_ids, current_user_id=user_id
+            )
+            if article_ids
+            else []
+        )
+        articles_count = self._timeline_repo.count_feed(user_id)
+        return self._build_page(articles_data, articles_count, limit)
+
     def _get_article_response(
         self, article_id: int, current_user_id: int | None = None
     ) -> ArticleResponse | None:
@@ -136,35 +190,20 @@ class ArticleService:
             return None
         return ArticleResponse.from_article_data(article_data_list[0])
 
-    def _get_author_id(self, username: str | None) -> int | None:
-        if not username:
-            return None
-        user = self._user_repo.get_by_username(username)
-        return user.id if user else None
-
-    def _get_filtered_article_ids(
-        self, tag: str | None, favorited: str | None
-    ) -> list[int] | None:
-        article_ids = None
-
-        if tag:
-            article_ids = self._tag_repo.get_article_ids_by_tag(tag)
-            if not article_ids:
-                return []
-
-        if favorited:
-            user = self._user_repo.get_by_username(favorited)
-            if not user:
-                return []
-            favorited_ids = self._favorite_repo.get_article_ids_by_user(user.id)
-            if not favorited_ids:
-                return []
-            if article_ids:
-                article_ids = list(set(article_ids) & set(favorited_ids))
-            else:
-                article_ids = favorited_ids
-
-        return article_ids
+    @staticmethod
+    def _build_page(
+        articles_data: list[ArticleWithRelations], articles_count: int, limit: int
+    ) -> ArticleResponseWrapper:
+        """페이지 응답 생성 - 페이지가 가득 찼을 때만 다음 커서를 내려준다"""
+        next_cursor = None
+        if articles_data and len(articles_data) == limit:
+            last = articles_data[-1]["article"]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return ArticleResponseWrapper(
+            articles=[ArticleResponse.from_article_data(data) for data in articles_data],
+            articlesCount=articles_count,
+            nextCursor=next_cursor,
+        )
 
     @staticmethod
     def _slugify(title: str) -> str:
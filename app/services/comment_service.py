@@ -1,62 +1,84 @@
 from app.core.error_handlers import get_article_or_404, check_comment_author_permission
 from app.core.exceptions import CommentNotFoundException
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.comment_model import Comment
 from app.models.user_model import User
 from app.repositories.interfaces import (
     ArticleRepositoryInterface,
     CommentRepositoryInterface,
-    UserRepositoryInterface,
+    UnitOfWorkInterface,
 )
-from app.dtos.response import CommentResponse, AuthorResponse
+from app.dtos.response import CommentResponse, CommentResponseWrapper, AuthorResponse
 
 
 class CommentService:
     def __init__(
         self,
+        uow: UnitOfWorkInterface,
         comment_repo: CommentRepositoryInterface,
         article_repo: ArticleRepositoryInterface,
-        user_repo: UserRepositoryInterface,
     ):
+        self._uow = uow
         self._comment_repo = comment_repo
         self._article_repo = article_repo
-        self._user_repo = user_repo
 
     def create_comment(self, slug: str, body: str, user: User) -> CommentResponse:
-        article = get_article_or_404(self._article_repo, slug)
-        comment = self._comment_repo.create(body=body, author_id=user.id, article_id=article.id)
-        return self._build_comment_response(comment, user)
+        with self._uow:
+            article = get_article_or_404(self._article_repo, slug)
+            comment = self._comment_repo.create(body=body, author_id=user.id, article_id=article.id)
+            return self._build_comment_response(comment, user)
+
+    def get_comments(
+        self,
+        slug: str,
+        current_user_id: int | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> CommentResponseWrapper:
+        """작성순 댓글 페이지 - 페이지가 가득 찼을 때만 다음 커서를 내려준다
 
-    def get_comments(self, slug: str) -> list[CommentResponse]:
+        limit이 없으면 (커서 다음의) 댓글 전체를 반환한다.
+        """
+        decoded_cursor = decode_cursor(cursor) if cursor else None
         article = get_article_or_404(self._article_repo, slug)
-        comments = self._comment_repo.get_by_article_id(article.id)
+        comments_data = self._comment_repo.get_with_relations(
+            article.id, current_user_id, limit=limit, cursor=decoded_cursor
+        )
 
-        comments_data = []
-        for comment in comments:
-            author = self._user_repo.get_by_id(comment.author_id)
-            if author is None:
-                continue  # author가 삭제된 댓글은 건너뜀
-            comments_data.append(self._build_comment_response(comment, author))
-        return comments_data
+        next_cursor = None
+        if limit is not None and comments_data and len(comments_data) == limit:
+            last = comments_data[-1]["comment"]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return CommentResponseWrapper(
+            comments=[
+                self._build_comment_response(data["comment"], data["author"], data["following"])
+                for data in comments_data
+            ],
+            nextCursor=next_cursor,
+        )
 
     def delete_comment(self, slug: str, comment_id: int, user: User) -> None:
-        article = get_article_or_404(self._article_repo, slug)
+        with self._uow:
+            article = get_article_or_404(self._article_repo, slug)
 
-        comment = self._comment_repo.get_by_id(comment_id)
-        if comment is None:
-            raise CommentNotFoundException()
+            comment = self._comment_repo.get_by_id(comment_id)
+            if comment is None:
+                raise CommentNotFoundException()
 
-        # 댓글이 해당 글에 속하는지 검증
-        if comment.article_id != article.id:
-            raise CommentNotFoundException()
+            # 댓글이 해당 글에 속하는지 검증
+            if comment.article_id != article.id:
+                raise CommentNotFoundException()
 
-        check_comment_author_permission(comment.author_id, user.id)
-        self._comment_repo.delete(comment)
-    def _build_comment_response(self, comment: Comment, author: User) -> CommentResponse:
+            check_comment_author_permission(comment.author_id, user.id)
+            self._comment_repo.delete(comment)
+    def _build_comment_response(
+        self, comment: Comment, author: User, following: bool = False
+    ) -> CommentResponse:
         return CommentResponse(
             id=comment.id,
             body=comment.body,
             createdAt=comment.created_at.isoformat() + "Z",
             updatedAt=comment.updated_at.isoformat() + "Z",
-            author=AuthorResponse.from_user(author),
+            author=AuthorResponse.from_user(author, following),
         )
 
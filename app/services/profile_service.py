@@ -1,17 +1,36 @@
-from app.core.exceptions import CannotFollowYourselfException, ProfileNotFoundException
+from app.core.exceptions import (
+    CannotFollowYourselfException,
+    ProfileNotFoundException,
+    TooManyUsernamesException,
+)
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_id_cursor,
+    encode_id_cursor,
+)
 from app.models.user_model import User
-from app.repositories.interfaces import FollowRepositoryInterface, UserRepositoryInterface
-from app.dtos.response import ProfileResponse
+from app.repositories.interfaces import (
+    FollowRepositoryInterface,
+    TimelineRepositoryInterface,
+    UnitOfWorkInterface,
+    UserRepositoryInterface,
+)
+from app.dtos.response import ProfileListResponseWrapper, ProfileResponse
 
 
 class ProfileService:
     def __init__(
         self,
+        uow: UnitOfWorkInterface,
         user_repo: UserRepositoryInterface,
         follow_repo: FollowRepositoryInterface,
+        timeline_repo: TimelineRepositoryInterface | None = None,
     ):
+        self._uow = uow
         self._user_repo = user_repo
         self._follow_repo = follow_repo
+        self._timeline_repo = timeline_repo
 
     def get_profile(self, username: str, current_user_id: int | None = None) -> ProfileResponse:
         user = self._get_user_or_404(username)
@@ -22,22 +41,97 @@ class ProfileService:
         )
         return ProfileResponse.from_user(user, following)
 
+    def get_profiles(
+        self, usernames: list[str], current_user_id: int | None = None
+    ) -> ProfileListResponseWrapper:
+        """여러 프로필을 요청 순서대로 (유저 IN 조회 1번 + 팔로우 IN 조회 1번)
+
+        앞뒤 공백과 빈 이름은 무시하고, 중복된 이름은 한 번만, 없는 유저는 빼고 반환한다.
+        """
+        usernames = list(dict.fromkeys(name.strip() for name in usernames if name.strip()))
+        if len(usernames) > MAX_PAGE_SIZE:
+            raise TooManyUsernamesException(MAX_PAGE_SIZE)
+
+        users = {user.username: user for user in self._user_repo.get_by_usernames(usernames)}
+        followed_ids = (
+            self._follow_repo.get_followee_ids(
+                current_user_id, {user.id for user in users.values()}
+            )
+            if current_user_id
+            else set()
+        )
+        return ProfileListResponseWrapper(
+            profiles=[
+                ProfileResponse.from_user(users[name], users[name].id in followed_ids)
+                for name in usernames
+                if name in users
+            ]
+        )
+
     def follow_user(self, current_user: User, username: str) -> ProfileResponse:
         followee = self._get_user_or_404(username)
 
         if current_user.id == followee.id:
             raise CannotFollowYourselfException()
 
-        if not self._follow_repo.is_following(current_user.id, followee.id):
-            self._follow_repo.create(current_user.id, followee.id)
+        with self._uow:
+            # 이미 팔로우 중이면 DB가 INSERT를 건너뛴다 (확인 조회 없이 멱등)
+            created = self._follow_repo.create(current_user.id, followee.id)
+            if created and self._timeline_repo is not None:
+                self._timeline_repo.backfill(current_user.id, followee.id)
 
         return ProfileResponse.from_user(followee, following=True)
 
     def unfollow_user(self, current_user: User, username: str) -> ProfileResponse:
         followee = self._get_user_or_404(username)
-        self._follow_repo.delete(current_user.id, followee.id)
+        with self._uow:
+            deleted = self._follow_repo.delete(current_user.id, followee.id)
+            if deleted and self._timeline_repo is not None:
+                self._timeline_repo.remove_author(current_user.id, followee.id)
+                self._timeline_repo.backfill_followers(followee.id)
         return ProfileResponse.from_user(followee, following=False)
 
+    def get_followers(
+        self,
+        username: str,
+        current_user_id: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> ProfileListResponseWrapper:
+        """username을 팔로우하는 유저 목록 (최근 팔로우 순)"""
+        user = self._get_user_or_404(username)
+        decoded_cursor = decode_id_cursor(cursor) if cursor else None
+        rows = self._follow_repo.get_followers(user.id, limit=limit, cursor=decoded_cursor)
+        return self._build_profile_page(rows, current_user_id, limit)
+
+    def get_following(
+        self,
+        username: str,
+        current_user_id: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> ProfileListResponseWrapper:
+        """username이 팔로우하는 유저 목록 (최근 팔로우 순)"""
+        user = self._get_user_or_404(username)
+        decoded_cursor = decode_id_cursor(cursor) if cursor else None
+        rows = self._follow_repo.get_following(user.id, limit=limit, cursor=decoded_cursor)
+        return self._build_profile_page(rows, current_user_id, limit)
+
+    def _build_profile_page(
+        self, rows: list[tuple[User, int]], current_user_id: int | None, limit: int
+    ) -> ProfileListResponseWrapper:
+        """페이지의 팔로우 여부는 한 번의 IN 조회, 페이지가 가득 찼을 때만 다음 커서"""
+        followed_ids = (
+            self._follow_repo.get_followee_ids(current_user_id, {user.id for user, _ in rows})
+            if current_user_id
+            else set()
+        )
+        next_cursor = encode_id_cursor(rows[-1][1]) if rows and len(rows) == limit else None
+        return ProfileListResponseWrapper(
+            profiles=[ProfileResponse.from_user(user, user.id in followed_ids) for user, _ in rows],
+            nextCursor=next_cursor,
+        )
+
     def _get_user_or_404(self, username: str) -> User:
         user = self._user_repo.get_by_username(username)
         if user is None:
@@ -5,5 +5,6 @@ class TagService:
     def __init__(self, tag_repo: TagRepositoryInterface):
         self._tag_repo = tag_repo
 
-    def get_all_tags(self) -> list[str]:
-        return self._tag_repo.get_all_tags()
+    def get_all_tags(self, limit: int | None = None) -> list[str]:
+        """인기순 태그 목록 (`limit`개까지)"""
+        return self._tag_repo.get_all_tags(limit)
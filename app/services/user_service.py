@@ -2,17 +2,24 @@ from app.core.exceptions import (
     EmailAlreadyRegisteredException,
     EmailNotFoundException,
     InvalidPasswordException,
+    PasswordHashingBusyException,
     UsernameAlreadyTakenException,
 )
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.security import (
+    hash_password,
+    issue_access_token,
+    password_needs_rehash,
+    verify_password,
+)
 from app.models.user_model import User
-from app.repositories.interfaces import UserRepositoryInterface
+from app.repositories.interfaces import UnitOfWorkInterface, UserRepositoryInterface
 from app.schemas.user_schema import UserRegister, UserUpdate
 from app.dtos.response import UserResponse
 
 
 class UserService:
-    def __init__(self, user_repo: UserRepositoryInterface):
+    def __init__(self, uow: UnitOfWorkInterface, user_repo: UserRepositoryInterface):
+        self._uow = uow
         self._repo = user_repo
 
     def register_user(self, user_data: UserRegister) -> UserResponse:
@@ -25,12 +32,13 @@ class UserService:
         # 비밀번호 해싱
         hashed_password = hash_password(user_data.password)
 
-        user = self._repo.create(
-            email=user_data.email,
-            username=user_data.username,
-            password=hashed_password,
-        )
-        return self._build_user_response(user)
+        with self._uow:
+            user = self._repo.create(
+                email=user_data.email,
+                username=user_data.username,
+                password=hashed_password,
+            )
+            return self._build_user_response(user)
 
     def login_user(self, email: str, password: str) -> UserResponse:
         user = self._repo.get_by_email(email)
@@ -41,34 +49,57 @@ class UserService:
         if not verify_password(password, user.hashed_password):
             raise InvalidPasswordException()
 
-        return self._build_user_response(user)
+        # Argon2 파라미터가 강해졌으면 평문을 아는 지금 새 파라미터로 다시 해싱
+        if password_needs_rehash(user.hashed_password):
+            user = self._rehash_password(user, password)
 
-    def get_user_profile(self, user: User) -> UserResponse:
         return self._build_user_response(user)
 
-    def update_user(self, user: User, update_data: UserUpdate) -> UserResponse:
-        if update_data.email is not None and update_data.email != user.email:
-            if self._repo.get_by_email(update_data.email):
-                raise EmailAlreadyRegisteredException()
-            user.email = update_data.email
-        if update_data.username is not None and update_data.username != user.username:
-            if self._repo.get_by_username(update_data.username):
-                raise UsernameAlreadyTakenException()
-            user.username = update_data.username
-        if update_data.password is not None:
-            # 비밀번호 해싱
-            user.hashed_password = hash_password(update_data.password)
-        if update_data.bio is not None:
-            user.bio = update_data.bio
-        if update_data.image is not None:
-            user.image = update_data.image
-
-        user = self._repo.update(user)
-        return self._build_user_response(user)
+    def _rehash_password(self, user: User, password: str) -> User:
+        """로그인 시 재해싱 (best-effort - 해싱 풀이 바쁘면 다음 로그인으로 미룬다)
+
+        비밀번호는 이미 검증됐으므로 재해싱 때문에 로그인을 503으로 실패시키지 않는다.
+        """
+        try:
+            hashed_password = hash_password(password)
+        except PasswordHashingBusyException:
+            return user
+
+        with self._uow:
+            user.hashed_password = hashed_password
+            return self._repo.update(user)
+
+    def get_user_profile(self, user: User, token: str | None = None) -> UserResponse:
+        return self._build_user_response(user, token)
+
+    def update_user(
+        self, user: User, update_data: UserUpdate, token: str | None = None
+    ) -> UserResponse:
+        with self._uow:
+            if update_data.email is not None and update_data.email != user.email:
+                if self._repo.get_by_email(update_data.email):
+                    raise EmailAlreadyRegisteredException()
+                user.email = update_data.email
+            if update_data.username is not None and update_data.username != user.username:
+                if self._repo.get_by_username(update_data.username):
+                    raise UsernameAlreadyTakenException()
+                user.username = update_data.username
+            if update_data.password is not None:
+                # 비밀번호 해싱
+                user.hashed_password = hash_password(update_data.password)
+            if update_data.bio is not None:
+                user.bio = update_data.bio
+            if update_data.image is not None:
+                user.image = update_data.image
+
+            user = self._repo.update(user)
+            return self._build_user_response(user, token)
 
     def get_by_id(self, user_id: int) -> User | None:
         return self._repo.get_by_id(user_id)
-    def _build_user_response(self, user: User) -> UserResponse:
-        token = create_access_token(user_id=user.id, username=user.username)
+
+    def _build_user_response(self, user: User, presented_token: str | None = None) -> UserResponse:
+        """요청에 쓴 토큰(또는 최근 발급한 토큰)의 수명이 충분하면 그대로 돌려준다"""
+        token = issue_access_token(user.id, user.username, presented_token)
         return UserResponse.from_user(user, token)
 
@@ -0,0 +1,96 @@
+"""게시글 목록 로더 벤치마크: 배치 로더(관계별 쿼리) vs 단일 쿼리 로더(집계)
+
+실행:
+    python -m benchmarks.bench_article_loader --articles 2000 --page 20
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+import app.core.database  # noqa: F401 - 모델 등록
+from app.models.article_model import Article
+from app.models.favorite_model import Favorite
+from app.models.tag_model import ArticleTag, Tag
+from app.models.user_model import User
+from app.repositories.article_repository import ArticleRepository, SingleQueryArticleRepository
+from app.repositories.favorite_repository import FavoriteRepository
+
+
+def _seed(session: Session, users: int, articles: int, tags: int) -> None:
+    rng = random.Random(42)
+    session.add_all(
+        User(email=f"u{i}@bench.io", username=f"u{i}", hashed_password="x") for i in range(users)
+    )
+    session.add_all(Tag(name=f"tag{i}") for i in range(tags))
+    session.commit()
+
+    session.add_all(
+        Article(
+            slug=f"article-{i}",
+            title=f"Article {i}",
+            description="bench",
+            body="bench",
+            author_id=rng.randint(1, users),
+        )
+        for i in range(articles)
+    )
+    session.commit()
+
+    for article_id in range(1, articles + 1):
+        for tag_id in rng.sample(range(1, tags + 1), 3):
+            session.add(ArticleTag(article_id=article_id, tag_id=tag_id))
+        for user_id in rng.sample(range(1, users + 1), 5):
+            session.add(Favorite(user_id=user_id, article_id=article_id))
+    session.commit()
+    FavoriteRepository(session).recount_favorites()
+    session.commit()
+
+
+def run(users: int, articles: int, tags: int, page: int, rounds: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            _seed(session, users, articles, tags)
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        print(f"users={users} articles={articles} page={page}")
+        print(f"{'loader':<14}{'case':<10}{'queries':>9}{'p50 (ms)':>11}{'p95 (ms)':>11}")
+        for name, repo_class in [("batch", ArticleRepository), ("single_query", SingleQueryArticleRepository)]:
+            for case, kwargs in [
+                ("list", {"limit": page, "current_user_id": 1}),
+                ("single", {"article_ids": [articles // 2], "current_user_id": 1}),
+            ]:
+                samples = []
+                queries = 0
+                for _ in range(rounds):
+                    with Session(engine) as session:
+                        repo = repo_class(session)
+                        statements.clear()
+                        started = time.perf_counter()
+                        repo.get_all_with_relations(**kwargs)
+                        samples.append((time.perf_counter() - started) * 1000)
+                        queries = len(statements)
+                p95 = statistics.quantiles(samples, n=20)[-1]
+                print(f"{name:<14}{case:<10}{queries:>9}{statistics.median(samples):>11.2f}{p95:>11.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--tags", type=int, default=50)
+    parser.add_argument("--page", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    run(args.users, args.articles, args.tags, args.page, args.rounds)
@@ -0,0 +1,106 @@
+"""피드 전략 벤치마크: fan-out-on-read(follows 조인) vs fan-out-on-write(타임라인)
+
+실행:
+    python -m benchmarks.bench_feed --readers 500 --authors 100 --follows 30 --articles 10
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine
+
+import app.core.database  # noqa: F401 - 모델 등록
+from app.models.follow_model import Follow
+from app.models.user_model import User
+from app.repositories.article_repository import ArticleRepository
+from app.repositories.favorite_repository import FavoriteRepository
+from app.repositories.tag_repository import TagRepository
+from app.repositories.timeline_repository import TimelineRepository
+from app.repositories.unit_of_work import UnitOfWork
+from app.repositories.user_repository import UserRepository
+from app.services.article_service import ArticleService
+
+
+def _seed_users(session: Session, readers: int, authors: int, follows: int) -> tuple[list, list]:
+    reader_users = [
+        User(email=f"r{i}@bench.io", username=f"r{i}", hashed_password="x") for i in range(readers)
+    ]
+    author_users = [
+        User(email=f"a{i}@bench.io", username=f"a{i}", hashed_password="x") for i in range(authors)
+    ]
+    session.add_all(reader_users + author_users)
+    session.commit()
+
+    rng = random.Random(42)
+    for reader in reader_users:
+        for author in rng.sample(author_users, min(follows, authors)):
+            session.add(Follow(follower_id=reader.id, followee_id=author.id))
+    session.commit()
+    return reader_users, author_users
+
+
+def _build_service(session: Session, use_timeline: bool) -> ArticleService:
+    timeline_repo = (
+        TimelineRepository(session, fanout_threshold=10**9, backfill_limit=100)
+        if use_timeline
+        else None
+    )
+    return ArticleService(
+        UnitOfWork(session),
+        ArticleRepository(session),
+        UserRepository(session),
+        TagRepository(session),
+        FavoriteRepository(session),
+        timeline_repo,
+    )
+
+
+def run(readers: int, authors: int, follows: int, articles: int, reads: int) -> None:
+    print(f"readers={readers} authors={authors} follows/reader={follows} articles/author={articles}")
+    print(f"{'strategy':<18}{'write total (s)':>16}{'read p50 (ms)':>16}{'read p95 (ms)':>16}")
+
+    for strategy, use_timeline in [("fan-out-on-read", False), ("fan-out-on-write", True)]:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+            SQLModel.metadata.create_all(engine)
+            with Session(engine) as session:
+                reader_users, author_users = _seed_users(session, readers, authors, follows)
+                service = _build_service(session, use_timeline)
+
+                started = time.perf_counter()
+                for n in range(articles):
+                    for author in author_users:
+                        service.create_article(
+                            title=f"{author.username} article {n}",
+                            description="bench",
+                            body="bench",
+                            author=author,
+                        )
+                write_seconds = time.perf_counter() - started
+
+                rng = random.Random(7)
+                samples = []
+                for _ in range(reads):
+                    reader = rng.choice(reader_users)
+                    started = time.perf_counter()
+                    service.get_feed(current_user_id=reader.id)
+                    samples.append((time.perf_counter() - started) * 1000)
+            engine.dispose()
+
+        p95 = statistics.quantiles(samples, n=20)[-1]
+        print(f"{strategy:<18}{write_seconds:>16.2f}{statistics.median(samples):>16.2f}{p95:>16.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=500)
+    parser.add_argument("--authors", type=int, default=100)
+    parser.add_argument("--follows", type=int, default=30)
+    parser.add_argument("--articles", type=int, default=10)
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+    run(args.readers, args.authors, args.follows, args.articles, args.reads)
@@ -0,0 +1,62 @@
+"""JWT 비용 벤치마크: 서명(encode) / 검증(decode) / 재사용(issue_access_token)
+
+실행:
+    python -m benchmarks.bench_jwt --iterations 20000
+"""
+
+import argparse
+import statistics
+import time
+
+import jwt
+
+from app.core.security import (
+    ALGORITHM,
+    SECRET_KEY,
+    clear_issued_tokens,
+    create_access_token,
+    issue_access_token,
+    verify_token,
+)
+
+
+def _measure(fn, iterations: int) -> list[float]:
+    """호출 1회당 마이크로초"""
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def _issue_cold(token: str) -> str:
+    """발급 캐시가 비어 있을 때 - 요청 토큰의 claim을 읽어 재사용"""
+    clear_issued_tokens()
+    return issue_access_token(1, "bench", token)
+
+
+def run(iterations: int) -> None:
+    token = create_access_token(user_id=1, username="bench")
+    clear_issued_tokens()
+    cases = [
+        ("encode", lambda: create_access_token(user_id=1, username="bench")),
+        ("decode (verify)", lambda: verify_token(token)),
+        ("decode (claims only)", lambda: jwt.decode(token, options={"verify_signature": False})),
+        ("issue (presented)", lambda: _issue_cold(token)),
+        ("issue (cached)", lambda: issue_access_token(1, "bench")),
+    ]
+
+    print(f"algorithm={ALGORITHM} key_bytes={len(SECRET_KEY)} iterations={iterations}")
+    print(f"{'operation':<22}{'p50 (us)':>12}{'p95 (us)':>12}")
+    for name, fn in cases:
+        samples = _measure(fn, iterations)
+        p95 = statistics.quantiles(samples, n=20)[-1]
+        print(f"{name:<22}{statistics.median(samples):>12.2f}{p95:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.iterations)
@@ -1,7 +1,11 @@
 """all fixtures"""
 
 # # DB and Client fixtures
-from tests.fixtures.db_client_fixtures import session_fixture, client_fixture
+from tests.fixtures.db_client_fixtures import (
+    clear_identity_cache,
+    session_fixture,
+    client_fixture,
+)
 
 # User fixtures
 from tests.fixtures.user_fixtures import (
@@ -16,6 +20,9 @@ from tests.fixtures.article_fixtures import article_api
 # Auth fixtures
 from tests.fixtures.auth_fixtures import auth_api
 
+# Query fixtures
+from tests.fixtures.query_fixtures import query_recorder
+
 
 class Status:
     """API 응답 상태"""
@@ -26,6 +33,7 @@ class Status:
     FORBIDDEN = "권한 없음"
     UNAUTHORIZED = "인증 필요"
     VALIDATION_ERROR = "유효성 오류"
+    TOO_MANY_REQUESTS = "요청 과다"
     
     _CODE_MAP = {
         200: "성공",
@@ -35,6 +43,7 @@ class Status:
         403: "권한 없음",
         404: "찾을 수 없음",
         422: "유효성 오류",
+        429: "요청 과다",
     }
     
     @classmethod
@@ -26,6 +26,9 @@ class ArticleAPI:
     def list(self, **params):
         return self._client.get("/articles", params=params, headers=self._get_headers())
 
+    def feed(self, **params):
+        return self._client.get("/articles/feed", params=params, headers=self._get_headers())
+
     # Favorite
     def favorite(self, slug):
         return self._client.post(f"/articles/{slug}/favorite", headers=self._get_headers())
@@ -38,15 +41,18 @@ class ArticleAPI:
         payload = {"comment": {"body": body}}
         return self._client.post(f"/articles/{slug}/comments", json=payload, headers=self._get_headers())
 
-    def list_comments(self, slug):
-        return self._client.get(f"/articles/{slug}/comments", headers=self._get_headers())
+    def list_comments(self, slug, **params):
+        return self._client.get(
+            f"/articles/{slug}/comments", params=params, headers=self._get_headers()
+        )
 
     def delete_comment(self, slug, comment_id):
         return self._client.delete(f"/articles/{slug}/comments/{comment_id}", headers=self._get_headers())
 
     # Tags
-    def list_tags(self):
-        return self._client.get("/tags")
+    def list_tags(self, etag=None, **params):
+        headers = {"If-None-Match": etag} if etag else None
+        return self._client.get("/tags", params=params, headers=headers)
 
 
 @pytest.fixture
@@ -67,6 +67,24 @@ class AuthAPI:
         """언팔로우"""
         return self._client.delete(f"/profiles/{username}/follow", headers=self._get_headers())
 
+    def get_profiles(self, *usernames):
+        """여러 프로필 조회"""
+        return self._client.get(
+            "/profiles", params={"usernames": ",".join(usernames)}, headers=self._get_headers()
+        )
+
+    def followers(self, username, **params):
+        """팔로워 목록 조회"""
+        return self._client.get(
+            f"/profiles/{username}/followers", params=params, headers=self._get_headers()
+        )
+
+    def following(self, username, **params):
+        """팔로잉 목록 조회"""
+        return self._client.get(
+            f"/profiles/{username}/following", params=params, headers=self._get_headers()
+        )
+
 
 @pytest.fixture
 def auth_api(client):
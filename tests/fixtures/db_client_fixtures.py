@@ -4,9 +4,22 @@ from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
 from app.core.database import get_session
+from app.core.identity_cache import identity_cache
+from app.core.rate_limit import build_login_throttle
+from app.core.security import clear_issued_tokens
 from app.main import app
 
 
+@pytest.fixture(autouse=True)
+def clear_identity_cache():
+    """인증 캐시/발급 토큰 캐시는 프로세스 전역이라 테스트(DB)마다 비운다"""
+    identity_cache.clear()
+    clear_issued_tokens()
+    yield
+    identity_cache.clear()
+    clear_issued_tokens()
+
+
 @pytest.fixture(name="session")
 def session_fixture():
     """Create a test database session"""
@@ -27,6 +40,7 @@ def client_fixture(session: Session):
         yield session
 
     app.dependency_overrides[get_session] = get_session_override
+    app.state.login_throttle = build_login_throttle(app.state.settings)  # 테스트마다 빈 버킷
     
     try:
         with TestClient(app) as client:
@@ -0,0 +1,31 @@
+import pytest
+from sqlalchemy import event
+
+
+class QueryRecorder:
+    """세션 엔진에서 실행되는 SQL을 기록하는 헬퍼"""
+
+    def __init__(self, engine):
+        self._engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+
+    def __enter__(self):
+        self.statements = []
+        event.listen(self._engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self._engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@pytest.fixture
+def query_recorder(session):
+    """테스트 DB 엔진의 쿼리 기록기 반환 (`with query_recorder:` 구간만 기록)"""
+    return QueryRecorder(session.get_bind())
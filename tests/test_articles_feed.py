@@ -0,0 +1,55 @@
+from tests.conftest import Status
+from tests.fixtures.article_fixtures import ArticleAPI
+from tests.fixtures.auth_fixtures import AuthAPI
+
+
+def _유저_등록(client, username):
+    auth = AuthAPI(client)
+    auth.register(email=f"{username}@example.com", username=username)
+    return auth
+
+
+def _글_작성(client, auth, title):
+    payload = {"article": {"title": title, "description": "Desc", "body": "Body"}}
+    ArticleAPI(client, token=auth.token).create(payload)
+
+
+def test_팔로우한_작성자의_글만_피드에_보인다(client):
+    독자 = _유저_등록(client, "reader")
+    팔로잉 = _유저_등록(client, "followed")
+    비팔로잉 = _유저_등록(client, "stranger")
+    _글_작성(client, 팔로잉, "Followed Article")
+    _글_작성(client, 비팔로잉, "Stranger Article")
+    독자.follow("followed")
+
+    결과 = ArticleAPI(client, token=독자.token).feed()
+
+    assert Status.of(결과) == Status.SUCCESS
+    data = 결과.json()
+    assert [article["title"] for article in data["articles"]] == ["Followed Article"]
+    assert data["articlesCount"] == 1
+
+
+def test_피드는_최신순으로_페이지네이션된다(client):
+    독자 = _유저_등록(client, "reader")
+    작성자1 = _유저_등록(client, "writer1")
+    작성자2 = _유저_등록(client, "writer2")
+    _글_작성(client, 작성자1, "Oldest")
+    _글_작성(client, 작성자2, "Middle")
+    _글_작성(client, 작성자1, "Newest")
+    독자.follow("writer1")
+    독자.follow("writer2")
+    feed_api = ArticleAPI(client, token=독자.token)
+
+    첫_페이지 = feed_api.feed(limit=2).json()
+    다음_페이지 = feed_api.feed(limit=2, cursor=첫_페이지["nextCursor"]).json()
+
+    assert [article["title"] for article in 첫_페이지["articles"]] == ["Newest", "Middle"]
+    assert [article["title"] for article in 다음_페이지["articles"]] == ["Oldest"]
+    assert 첫_페이지["articlesCount"] == 3
+
+
+def test_로그인하지_않으면_피드를_볼_수_없다(게스트_api):
+    결과 = 게스트_api.feed()
+
+    assert Status.of(결과) == Status.UNAUTHORIZED
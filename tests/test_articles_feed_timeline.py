@@ -0,0 +1,139 @@
+import pytest
+from sqlmodel import select
+
+from app.core.config import Settings, get_settings
+from app.jobs.rebuild_timelines import rebuild_timelines
+from app.main import app
+from app.models.timeline_model import TimelineEntry
+from tests.fixtures.article_fixtures import ArticleAPI
+from tests.fixtures.auth_fixtures import AuthAPI
+
+
+@pytest.fixture(autouse=True)
+def 타임라인_활성화(client):
+    """팔로워가 1명 이하인 작성자만 fan-out-on-write 하도록 설정"""
+    app.dependency_overrides[get_settings] = lambda: Settings(
+        feed_timeline_enabled=True, feed_fanout_threshold=1
+    )
+
+
+def _유저_등록(client, username):
+    auth = AuthAPI(client)
+    auth.register(email=f"{username}@example.com", username=username)
+    return auth
+
+
+def _글_작성(client, auth, title):
+    payload = {"article": {"title": title, "description": "Desc", "body": "Body"}}
+    return ArticleAPI(client, token=auth.token).create(payload).json()["article"]
+
+
+def _피드_제목(client, auth):
+    data = ArticleAPI(client, token=auth.token).feed().json()
+    return [article["title"] for article in data["articles"]]
+
+
+def test_글을_쓰면_팔로워의_타임라인에_기록된다(client, session):
+    독자 = _유저_등록(client, "reader")
+    작성자 = _유저_등록(client, "writer")
+    독자.follow("writer")
+
+    _글_작성(client, 작성자, "Pushed Article")
+
+    assert len(session.exec(select(TimelineEntry)).all()) == 1
+    assert _피드_제목(client, 독자) == ["Pushed Article"]
+
+
+def test_팔로워가_많은_작성자의_글은_조회_시점에_병합된다(client, session):
+    독자1 = _유저_등록(client, "reader1")
+    독자2 = _유저_등록(client, "reader2")
+    작성자 = _유저_등록(client, "celebrity")
+    독자1.follow("celebrity")
+    독자2.follow("celebrity")
+
+    _글_작성(client, 작성자, "Pulled Article")
+
+    assert session.exec(select(TimelineEntry)).all() == []
+    assert _피드_제목(client, 독자1) == ["Pulled Article"]
+    assert _피드_제목(client, 독자2) == ["Pulled Article"]
+
+
+def test_팔로우하면_기존_글이_타임라인에_채워진다(client):
+    독자 = _유저_등록(client, "reader")
+    작성자 = _유저_등록(client, "writer")
+    _글_작성(client, 작성자, "Old Article")
+
+    독자.follow("writer")
+
+    assert _피드_제목(client, 독자) == ["Old Article"]
+
+
+def test_언팔로우하면_타임라인에서_제거된다(client, session):
+    독자 = _유저_등록(client, "reader")
+    작성자 = _유저_등록(client, "writer")
+    독자.follow("writer")
+    _글_작성(client, 작성자, "Pushed Article")
+
+    독자.unfollow("writer")
+
+    assert session.exec(select(TimelineEntry)).all() == []
+    assert _피드_제목(client, 독자) == []
+
+
+def test_삭제된_글은_타임라인에서_제거된다(client, session):
+    독자 = _유저_등록(client, "reader")
+    작성자 = _유저_등록(client, "writer")
+    독자.follow("writer")
+    글 = _글_작성(client, 작성자, "Deleted Article")
+
+    ArticleAPI(client, token=작성자.token).delete(글["slug"])
+
+    assert session.exec(select(TimelineEntry)).all() == []
+
+
+def test_언팔로우로_임계값_이하가_되면_조회_시점에_병합되던_글을_남은_팔로워에게_채운다(client):
+    독자1 = _유저_등록(client, "reader1")
+    독자2 = _유저_등록(client, "reader2")
+    작성자 = _유저_등록(client, "celebrity")
+    독자1.follow("celebrity")
+    독자2.follow("celebrity")
+    _글_작성(client, 작성자, "Pulled Article")
+
+    독자2.unfollow("celebrity")
+
+    assert _피드_제목(client, 독자1) == ["Pulled Article"]
+    assert _피드_제목(client, 독자2) == []
+
+
+def test_임계값_이하로_내려오면_backfill_limit보다_오래된_글도_채운다(client):
+    app.dependency_overrides[get_settings] = lambda: Settings(
+        feed_timeline_enabled=True, feed_fanout_threshold=1, feed_backfill_limit=1
+    )
+    독자1 = _유저_등록(client, "reader1")
+    독자2 = _유저_등록(client, "reader2")
+    작성자 = _유저_등록(client, "celebrity")
+    독자1.follow("celebrity")
+    독자2.follow("celebrity")
+    _글_작성(client, 작성자, "First Pulled")
+    _글_작성(client, 작성자, "Second Pulled")
+
+    독자2.unfollow("celebrity")
+
+    assert _피드_제목(client, 독자1) == ["Second Pulled", "First Pulled"]
+
+
+def test_재구성_작업은_기능을_켜기_전의_팔로우와_글로_타임라인을_채운다(client, session):
+    app.dependency_overrides[get_settings] = lambda: Settings(feed_timeline_enabled=False)
+    독자 = _유저_등록(client, "reader")
+    작성자 = _유저_등록(client, "writer")
+    독자.follow("writer")
+    _글_작성(client, 작성자, "Old Article")
+    settings = Settings(feed_timeline_enabled=True, feed_fanout_threshold=1)
+    app.dependency_overrides[get_settings] = lambda: settings
+    재구성_전 = _피드_제목(client, 독자)
+
+    채운_행 = rebuild_timelines(session, settings)
+
+    assert 재구성_전 == []
+    assert 채운_행 == 1
+    assert _피드_제목(client, 독자) == ["Old Article"]
@@ -72,3 +72,30 @@ def test_특정_유저가_좋아요한_글만_검색할_수_있다(로그인_유
     data = 조회_결과.json()
     assert data["articles"][0]["slug"] == 글1_slug
     assert data["articlesCount"] == 1
+
+
+def test_태그와_좋아요_필터를_함께_쓰면_둘_다_만족하는_글만_보인다(로그인_유저1_api, 로그인_유저2_api):
+    태그_글 = 로그인_유저1_api.create({
+        "article": {"title": "Tagged", "description": "D", "body": "B", "tagList": ["python"]}
+    }).json()["article"]
+    다른_태그_글 = 로그인_유저1_api.create({
+        "article": {"title": "Other", "description": "D", "body": "B", "tagList": ["rust"]}
+    }).json()["article"]
+    로그인_유저2_api.favorite(태그_글["slug"])
+    로그인_유저2_api.favorite(다른_태그_글["slug"])
+
+    조회_결과 = 로그인_유저1_api.list(tag="python", favorited="user2")
+
+    data = 조회_결과.json()
+    assert [article["slug"] for article in data["articles"]] == [태그_글["slug"]]
+    assert data["articlesCount"] == 1
+
+
+def test_존재하지_않는_작성자로_검색하면_빈_목록을_반환한다(로그인_유저1_api):
+    로그인_유저1_api.create(ARTICLE_PAYLOAD)
+
+    조회_결과 = 로그인_유저1_api.list(author="nobody")
+
+    assert Status.of(조회_결과) == Status.SUCCESS
+    assert 조회_결과.json()["articles"] == []
+    assert 조회_결과.json()["articlesCount"] == 0
@@ -0,0 +1,48 @@
+from app.repositories.article_repository import ArticleRepository, SingleQueryArticleRepository
+from app.repositories.follow_repository import FollowRepository
+from app.repositories.user_repository import UserRepository
+
+
+def _글_작성(api, title, tags):
+    payload = {"article": {"title": title, "description": "D", "body": "B", "tagList": tags}}
+    return api.create(payload).json()["article"]
+
+
+def _요약(articles_data):
+    return [
+        (
+            data["article"].slug,
+            data["author"].username,
+            sorted(data["tag_list"]),
+            data["favorites_count"],
+            data["favorited"],
+            data["following"],
+        )
+        for data in articles_data
+    ]
+
+
+def test_단일_쿼리_로더는_배치_로더와_같은_결과를_반환한다(session, 로그인_유저1_api, 로그인_유저2_api):
+    글1 = _글_작성(로그인_유저1_api, "First", ["python", "fastapi"])
+    _글_작성(로그인_유저2_api, "Second", [])
+    로그인_유저2_api.favorite(글1["slug"])
+    user1 = UserRepository(session).get_by_username("user1")
+    user2 = UserRepository(session).get_by_username("user2")
+    FollowRepository(session).create(user2.id, user1.id)
+    session.commit()
+
+    batch = ArticleRepository(session).get_all_with_relations(current_user_id=user2.id)
+    single = SingleQueryArticleRepository(session).get_all_with_relations(current_user_id=user2.id)
+
+    assert _요약(single) == _요약(batch)
+    assert _요약(single)[1] == ("first", "user1", ["fastapi", "python"], 1, True, True)
+
+
+def test_단일_쿼리_로더는_한_번의_쿼리로_목록을_조회한다(session, query_recorder, 로그인_유저1_api):
+    for n in range(3):
+        _글_작성(로그인_유저1_api, f"Article {n}", ["python"])
+
+    with query_recorder:
+        SingleQueryArticleRepository(session).get_all_with_relations(limit=20)
+
+    assert query_recorder.count == 1
@@ -0,0 +1,57 @@
+from tests.conftest import Status
+
+
+def _글_작성(api, title):
+    payload = {"article": {"title": title, "description": "Desc", "body": "Body"}}
+    return api.create(payload).json()["article"]
+
+
+def test_게시글_목록은_최신순으로_정렬된다(로그인_유저1_api):
+    for title in ["First", "Second", "Third"]:
+        _글_작성(로그인_유저1_api, title)
+
+    조회_결과 = 로그인_유저1_api.list()
+
+    titles = [article["title"] for article in 조회_결과.json()["articles"]]
+    assert titles == ["Third", "Second", "First"]
+
+
+def test_limit을_주면_해당_개수만큼만_반환하고_전체_개수를_알려준다(로그인_유저1_api):
+    for title in ["First", "Second", "Third"]:
+        _글_작성(로그인_유저1_api, title)
+
+    조회_결과 = 로그인_유저1_api.list(limit=2)
+
+    assert Status.of(조회_결과) == Status.SUCCESS
+    data = 조회_결과.json()
+    assert len(data["articles"]) == 2
+    assert data["articlesCount"] == 3
+    assert data["nextCursor"] is not None
+
+
+def test_offset으로_건너뛸_수_있다(로그인_유저1_api):
+    for title in ["First", "Second", "Third"]:
+        _글_작성(로그인_유저1_api, title)
+
+    조회_결과 = 로그인_유저1_api.list(limit=2, offset=2)
+
+    titles = [article["title"] for article in 조회_결과.json()["articles"]]
+    assert titles == ["First"]
+
+
+def test_커서로_다음_페이지를_이어서_조회할_수_있다(로그인_유저1_api):
+    for title in ["First", "Second", "Third"]:
+        _글_작성(로그인_유저1_api, title)
+
+    첫_페이지 = 로그인_유저1_api.list(limit=2).json()
+    다음_페이지 = 로그인_유저1_api.list(limit=2, cursor=첫_페이지["nextCursor"]).json()
+
+    titles = [article["title"] for article in 다음_페이지["articles"]]
+    assert titles == ["First"]
+    assert 다음_페이지["nextCursor"] is None
+
+
+def test_잘못된_커서면_422를_반환한다(게스트_api):
+    조회_결과 = 게스트_api.list(cursor="not-a-cursor")
+
+    assert Status.of(조회_결과) == Status.VALIDATION_ERROR
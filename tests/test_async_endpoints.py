@@ -0,0 +1,94 @@
+import asyncio
+import inspect
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import Settings
+from app.core.database import build_async_engine, build_engine, get_async_session, get_session
+from app.main import create_app
+from tests.conftest import Status
+from tests.fixtures.article_fixtures import ArticleAPI
+from tests.fixtures.auth_fixtures import AuthAPI
+
+
+@pytest.fixture
+def async_app(tmp_path):
+    """async_endpoints=True 앱 - 동기(auth)/비동기 엔진이 같은 파일 DB를 공유"""
+    settings = Settings(database_url=f"sqlite:///{tmp_path / 'app.db'}", async_endpoints=True)
+    engine = build_engine(settings)
+    async_engine = build_async_engine(settings)
+    SQLModel.metadata.create_all(engine)
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app = create_app(settings)
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_async_session] = get_async_session_override
+    yield app
+    engine.dispose()
+
+
+@pytest.fixture
+def async_client(async_app):
+    return TestClient(async_app)
+
+
+def _로그인(client, email, username):
+    auth = AuthAPI(client)
+    auth.register(email=email, password="password123", username=username)
+    return ArticleAPI(client, token=auth.token)
+
+
+def test_설정에_따라_async_엔드포인트가_등록된다(async_app):
+    endpoints = {
+        route.path: route.endpoint
+        for route in async_app.routes
+        if getattr(route, "methods", None) and "GET" in route.methods
+    }
+
+    assert inspect.iscoroutinefunction(endpoints["/articles"])
+    assert inspect.iscoroutinefunction(endpoints["/tags"])
+    assert not inspect.iscoroutinefunction(endpoints["/user"])
+
+
+def test_async_엔드포인트로_글_작성부터_댓글까지_동작한다(async_client):
+    작성자 = _로그인(async_client, "user1@example.com", "user1")
+    독자 = _로그인(async_client, "user2@example.com", "user2")
+    payload = {"article": {"title": "Async", "description": "D", "body": "B", "tagList": ["aio"]}}
+
+    slug = 작성자.create(payload).json()["article"]["slug"]
+    좋아요_결과 = 독자.favorite(slug)
+    댓글_결과 = 독자.create_comment(slug, "nice")
+    목록 = 독자.list().json()
+
+    assert Status.of(좋아요_결과) == Status.SUCCESS
+    assert 좋아요_결과.json()["article"]["favoritesCount"] == 1
+    assert Status.of(댓글_결과) == Status.SUCCESS
+    assert [c["body"] for c in 독자.list_comments(slug).json()["comments"]] == ["nice"]
+    assert 목록["articlesCount"] == 1
+    assert 목록["articles"][0]["favorited"] is True
+    assert 독자.list_tags().json()["tags"] == ["aio"]
+
+
+def test_async_엔드포인트도_인증_실패는_401을_반환한다(async_client):
+    조회_결과 = ArticleAPI(async_client, token="invalid").feed()
+
+    assert Status.of(조회_결과) == Status.UNAUTHORIZED
+
+
+async def test_동시_요청을_이벤트_루프에서_처리한다(async_app):
+    transport = httpx.ASGITransport(app=async_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(*(client.get("/articles") for _ in range(20)))
+
+    assert all(Status.of(response) == Status.SUCCESS for response in responses)
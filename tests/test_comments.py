@@ -1,3 +1,4 @@
+from app.core.pagination import DEFAULT_PAGE_SIZE
 from tests.conftest import ARTICLE_PAYLOAD, Status
 
 
@@ -58,3 +59,68 @@ def test_다른_사람의_댓글은_삭제할_수_없다(로그인_유저1_api,
     삭제_결과 = 로그인_유저2_api.delete_comment(slug, comment_id)
 
     assert Status.of(삭제_결과) == Status.FORBIDDEN
+
+
+def test_댓글_목록_조회_쿼리_수는_댓글_수와_무관하다(로그인_유저1_api, 로그인_유저2_api, query_recorder):
+    slug = 로그인_유저1_api.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+    로그인_유저1_api.create_comment(slug, "comment 0")
+    로그인_유저2_api.list_comments(slug)  # 인증 캐시를 채워 두 측정 조건을 맞춘다
+
+    with query_recorder:
+        로그인_유저2_api.list_comments(slug)
+    댓글_1개 = query_recorder.count
+
+    for n in range(1, 10):
+        api = 로그인_유저1_api if n % 2 else 로그인_유저2_api
+        api.create_comment(slug, f"comment {n}")
+
+    with query_recorder:
+        결과 = 로그인_유저2_api.list_comments(slug)
+
+    assert len(결과.json()["comments"]) == 10
+    assert query_recorder.count == 댓글_1개
+
+
+def test_댓글은_작성순으로_limit개씩_커서로_이어서_조회한다(로그인_유저1_api):
+    slug = 로그인_유저1_api.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+    for n in range(5):
+        로그인_유저1_api.create_comment(slug, f"comment {n}")
+
+    첫_페이지 = 로그인_유저1_api.list_comments(slug, limit=3).json()
+    다음_페이지 = 로그인_유저1_api.list_comments(slug, limit=3, cursor=첫_페이지["nextCursor"]).json()
+
+    assert [c["body"] for c in 첫_페이지["comments"]] == ["comment 0", "comment 1", "comment 2"]
+    assert [c["body"] for c in 다음_페이지["comments"]] == ["comment 3", "comment 4"]
+    assert 다음_페이지["nextCursor"] is None
+
+
+def test_limit_없이_조회하면_댓글_전체를_반환한다(로그인_유저1_api):
+    slug = 로그인_유저1_api.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+    for n in range(DEFAULT_PAGE_SIZE + 1):
+        로그인_유저1_api.create_comment(slug, f"comment {n}")
+
+    결과 = 로그인_유저1_api.list_comments(slug).json()
+
+    assert len(결과["comments"]) == DEFAULT_PAGE_SIZE + 1
+    assert 결과["nextCursor"] is None
+
+
+def test_댓글_목록에_잘못된_커서면_422를_반환한다(로그인_유저1_api):
+    slug = 로그인_유저1_api.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+
+    결과 = 로그인_유저1_api.list_comments(slug, cursor="not-a-cursor")
+
+    assert Status.of(결과) == Status.VALIDATION_ERROR
+
+
+def test_글_목록에_댓글_수가_포함되고_삭제하면_줄어든다(로그인_유저1_api, 로그인_유저2_api):
+    slug = 로그인_유저1_api.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+    로그인_유저1_api.create_comment(slug, "first")
+    comment_id = 로그인_유저2_api.create_comment(slug, "second").json()["comment"]["id"]
+
+    작성_후 = 로그인_유저1_api.list().json()["articles"][0]["commentsCount"]
+    로그인_유저2_api.delete_comment(slug, comment_id)
+    삭제_후 = 로그인_유저1_api.get(slug).json()["article"]["commentsCount"]
+
+    assert 작성_후 == 2
+    assert 삭제_후 == 1
@@ -0,0 +1,38 @@
+from sqlmodel import text
+
+from app.core.config import Settings
+from app.core.database import build_engine
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_새_커넥션마다_SQLite_PRAGMA가_적용된다(tmp_path):
+    engine = build_engine(Settings(database_url=f"sqlite:///{tmp_path / 'app.db'}"))
+
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "busy_timeout") == 5000
+    assert _pragma(engine, "cache_size") == -64 * 1024
+    assert _pragma(engine, "mmap_size") == 256 * 1024 * 1024
+    engine.dispose()
+
+
+def test_설정값으로_커넥션_풀을_구성한다(tmp_path):
+    settings = Settings(
+        database_url=f"sqlite:///{tmp_path / 'app.db'}",
+        db_pool_size=3,
+        db_max_overflow=2,
+        db_pool_recycle=60,
+        sqlite_busy_timeout=1234,
+    )
+
+    engine = build_engine(settings)
+
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+    assert engine.pool._recycle == 60
+    assert _pragma(engine, "busy_timeout") == 1234
+    engine.dispose()
@@ -0,0 +1,139 @@
+import pytest
+from sqlmodel import Session, SQLModel
+
+from app.core.database import build_engine
+from app.models.user_model import User
+from app.repositories.follow_repository import GraphFollowRepository
+
+from app.core.config import Settings, get_settings
+from app.main import app
+from app.models.follow_model import Follow
+from app.repositories.follow_graph import (
+    FollowGraph,
+    FollowGraphDiff,
+    check_follow_graph,
+)
+from app.repositories.unit_of_work import UnitOfWork
+from tests.fixtures.article_fixtures import ArticleAPI
+from tests.fixtures.auth_fixtures import AuthAPI
+
+
+@pytest.fixture(autouse=True)
+def 팔로우_그래프_활성화(client):
+    app.dependency_overrides[get_settings] = lambda: Settings(follow_graph_enabled=True)
+
+
+def _유저_등록(client, username):
+    auth = AuthAPI(client)
+    auth.register(email=f"{username}@example.com", username=username)
+    return auth
+
+
+def test_팔로우와_언팔로우가_프로필에_반영된다(client):
+    유저1 = _유저_등록(client, "user1")
+    _유저_등록(client, "user2")
+
+    팔로우_후 = 유저1.follow("user2").json()["profile"]["following"]
+    조회_1 = 유저1.get_profile("user2").json()["profile"]["following"]
+    유저1.unfollow("user2")
+    조회_2 = 유저1.get_profile("user2").json()["profile"]["following"]
+
+    assert 팔로우_후 is True
+    assert 조회_1 is True
+    assert 조회_2 is False
+
+
+def test_프로필_조회는_follows_테이블을_읽지_않는다(client, query_recorder):
+    유저1 = _유저_등록(client, "user1")
+    _유저_등록(client, "user2")
+    유저1.follow("user2")
+    유저1.get_profile("user2")  # 그래프 적재 (쓰기 경로에서는 읽지 않는다)
+
+    with query_recorder:
+        결과 = 유저1.get_profile("user2")
+
+    assert 결과.json()["profile"]["following"] is True
+    assert not any("follows" in statement for statement, _ in query_recorder.statements)
+
+
+@pytest.mark.parametrize("article_loader", ["batch", "single_query"])
+def test_게시글과_댓글_목록의_팔로우_여부도_그래프에서_읽는다(client, query_recorder, article_loader):
+    app.dependency_overrides[get_settings] = lambda: Settings(
+        follow_graph_enabled=True, article_loader=article_loader
+    )
+    유저1 = _유저_등록(client, "user1")
+    유저2 = _유저_등록(client, "user2")
+    작성자 = ArticleAPI(client, token=유저2.token)
+    작성자.create({"article": {"title": "t", "description": "d", "body": "b"}})
+    작성자.create_comment("t", "c")
+    유저1.follow("user2")
+    독자 = ArticleAPI(client, token=유저1.token)
+    유저1.get_profile("user2")  # 그래프 적재
+
+    with query_recorder:
+        게시글 = 독자.list().json()["articles"][0]
+        댓글 = 독자.list_comments("t").json()["comments"][0]
+
+    assert 게시글["author"]["following"] is True
+    assert 댓글["author"]["following"] is True
+    assert not any("follows" in statement for statement, _ in query_recorder.statements)
+
+
+def test_DB와_어긋난_그래프를_찾아_다시_읽는다(client, session):
+    유저1 = _유저_등록(client, "user1")
+    _유저_등록(client, "user2")
+    유저1.get_profile("user2")  # 그래프 적재
+    session.add(Follow(follower_id=1, followee_id=2))  # 그래프를 거치지 않은 쓰기
+    session.commit()
+
+    첫_검사 = check_follow_graph(session)
+    두번째_검사 = check_follow_graph(session)
+
+    assert 첫_검사 == FollowGraphDiff(missing=1, extra=0)
+    assert 두번째_검사 == FollowGraphDiff(missing=0, extra=0)
+    assert 유저1.get_profile("user2").json()["profile"]["following"] is True
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """커넥션마다 커밋된 데이터만 보이는 파일 DB (유저 1, 2)"""
+    engine = build_engine(Settings(database_url=f"sqlite:///{tmp_path / 'graph.db'}"))
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(User(email="a@example.com", username="a", hashed_password="x"))
+        session.add(User(email="b@example.com", username="b", hashed_password="x"))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def test_롤백된_팔로우는_그래프에_남지_않는다(file_engine):
+    with Session(file_engine) as session:
+        GraphFollowRepository(session).create(1, 2)
+        session.rollback()
+
+    with Session(file_engine) as session:
+        assert GraphFollowRepository(session).is_following(1, 2) is False
+
+
+def test_그래프는_쓰기_트랜잭션의_커밋되지_않은_행을_읽지_않는다(file_engine):
+    with Session(file_engine) as session:
+        with UnitOfWork(session):
+            repo = GraphFollowRepository(session)
+            repo.create(1, 2)
+            커밋_전 = repo.is_following(1, 2)
+        커밋_후 = repo.is_following(1, 2)
+
+    assert 커밋_전 is False
+    assert 커밋_후 is True
+
+
+def test_그래프는_팔로우를_추가하고_제거한다():
+    graph = FollowGraph()
+    graph.load([(1, 2), (3, 2), (1, 3)])
+    graph.remove(3, 2)
+    graph.add(3, 1)
+
+    assert graph.is_following(3, 2) is False
+    assert graph.is_following(3, 1) is True
+    assert graph.followee_ids(1, {2, 3, 4}) == {2, 3}
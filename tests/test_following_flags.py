@@ -0,0 +1,74 @@
+from tests.conftest import ARTICLE_PAYLOAD
+from tests.fixtures.article_fixtures import ArticleAPI
+from tests.fixtures.auth_fixtures import AuthAPI
+
+
+def _유저_등록(client, username):
+    auth = AuthAPI(client)
+    auth.register(email=f"{username}@example.com", username=username)
+    return auth
+
+
+def _작성자_글(client, auth, title):
+    payload = {"article": {**ARTICLE_PAYLOAD["article"], "title": title}}
+    return ArticleAPI(client, token=auth.token).create(payload).json()["article"]["slug"]
+
+
+def _팔로잉_여부(articles):
+    return {article["author"]["username"]: article["author"]["following"] for article in articles}
+
+
+def test_글_목록과_단건에_작성자_팔로우_여부가_포함된다(client):
+    독자 = _유저_등록(client, "reader")
+    팔로잉 = _유저_등록(client, "followed")
+    비팔로잉 = _유저_등록(client, "stranger")
+    slug = _작성자_글(client, 팔로잉, "Followed")
+    _작성자_글(client, 비팔로잉, "Stranger")
+    독자.follow("followed")
+    독자_api = ArticleAPI(client, token=독자.token)
+
+    목록 = 독자_api.list().json()["articles"]
+    단건 = 독자_api.get(slug).json()["article"]
+
+    assert _팔로잉_여부(목록) == {"followed": True, "stranger": False}
+    assert 단건["author"]["following"] is True
+    assert _팔로잉_여부(ArticleAPI(client).list().json()["articles"]) == {
+        "followed": False,
+        "stranger": False,
+    }
+
+
+def test_댓글_목록에_작성자_팔로우_여부가_포함된다(client):
+    독자 = _유저_등록(client, "reader")
+    팔로잉 = _유저_등록(client, "followed")
+    비팔로잉 = _유저_등록(client, "stranger")
+    slug = _작성자_글(client, 팔로잉, "Article")
+    ArticleAPI(client, token=팔로잉.token).create_comment(slug, "from followed")
+    ArticleAPI(client, token=비팔로잉.token).create_comment(slug, "from stranger")
+    독자.follow("followed")
+
+    댓글 = ArticleAPI(client, token=독자.token).list_comments(slug).json()["comments"]
+
+    assert _팔로잉_여부(댓글) == {"followed": True, "stranger": False}
+
+
+def test_팔로우_여부_조회는_작성자_수와_무관하게_쿼리_수가_같다(client, query_recorder):
+    독자 = _유저_등록(client, "reader")
+    독자_api = ArticleAPI(client, token=독자.token)
+    첫_작성자 = _유저_등록(client, "writer0")
+    _작성자_글(client, 첫_작성자, "Article 0")
+    독자.follow("writer0")
+
+    with query_recorder:
+        독자_api.list()
+    작성자_1명 = query_recorder.count
+
+    for n in range(1, 4):
+        작성자 = _유저_등록(client, f"writer{n}")
+        _작성자_글(client, 작성자, f"Article {n}")
+        독자.follow(f"writer{n}")
+
+    with query_recorder:
+        독자_api.list()
+
+    assert query_recorder.count == 작성자_1명
@@ -0,0 +1,151 @@
+import threading
+
+import pytest
+from sqlalchemy import event, inspect
+from sqlmodel import Session, SQLModel, func, select, text
+
+from app.core.config import Settings
+from app.core.database import build_engine, create_db_and_tables
+from app.models.article_model import Article
+from app.models.favorite_model import Favorite
+from app.models.follow_model import Follow
+from app.models.user_model import User
+from app.repositories.favorite_repository import FavoriteRepository
+from app.repositories.follow_repository import FollowRepository
+from tests.fixtures.auth_fixtures import AuthAPI
+
+THREADS = 8
+ROUNDS = 20
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """스레드마다 커넥션을 따로 여는 파일 DB (유저 1, 2와 게시글 1)"""
+    engine = build_engine(Settings(database_url=f"sqlite:///{tmp_path / 'race.db'}"))
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(User(email="a@example.com", username="a", hashed_password="x"))
+        session.add(User(email="b@example.com", username="b", hashed_password="x"))
+        session.add(Article(slug="s", title="t", description="d", body="b", author_id=2))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def _hammer(engine, write):
+    """THREADS개 스레드가 동시에 write(session, n)를 ROUNDS번씩 실행하고 결과를 모은다"""
+    barrier = threading.Barrier(THREADS)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        for n in range(ROUNDS):
+            try:
+                with Session(engine) as session:
+                    results.append(write(session, n))
+                    session.commit()
+            except Exception as e:  # noqa: BLE001 - 스레드 밖으로 넘겨 검증
+                errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_같은_팔로우를_동시에_요청해도_한_행만_생기고_카운터는_1이다(file_engine):
+    results, errors = _hammer(file_engine, lambda s, n: FollowRepository(s).create(1, 2))
+
+    with Session(file_engine) as session:
+        rows = session.exec(select(func.count()).select_from(Follow)).one()
+        followee, follower = session.get(User, 2), session.get(User, 1)
+
+    assert errors == []
+    assert results.count(True) == 1
+    assert rows == 1
+    assert (followee.followers_count, follower.following_count) == (1, 1)
+
+
+def test_팔로우와_언팔로우가_섞여도_카운터는_행_수와_같다(file_engine):
+    def follow_or_unfollow(session, n):
+        repo = FollowRepository(session)
+        return repo.create(1, 2) if n % 2 == 0 else repo.delete(1, 2)
+
+    _, errors = _hammer(file_engine, follow_or_unfollow)
+
+    with Session(file_engine) as session:
+        rows = session.exec(select(func.count()).select_from(Follow)).one()
+        followee = session.get(User, 2)
+
+    assert errors == []
+    assert followee.followers_count == rows
+
+
+def test_같은_좋아요를_동시에_요청해도_카운터는_1이다(file_engine):
+    results, errors = _hammer(file_engine, lambda s, n: FavoriteRepository(s).create(1, 1))
+
+    with Session(file_engine) as session:
+        rows = session.exec(select(func.count()).select_from(Favorite)).one()
+        article = session.get(Article, 1)
+
+    assert errors == []
+    assert results.count(True) == 1
+    assert (rows, article.favorites_count) == (1, 1)
+
+
+def test_팔로우는_확인_조회_없이_INSERT_한번으로_처리한다(client, query_recorder):
+    유저1 = AuthAPI(client)
+    유저1.register(email="user1@example.com", username="user1")
+    AuthAPI(client).register(email="user2@example.com", username="user2")
+    유저1.follow("user2")
+
+    with query_recorder:
+        결과 = 유저1.follow("user2")
+
+    follows_statements = [s for s, _ in query_recorder.statements if "follows" in s]
+    assert 결과.json()["profile"]["followersCount"] == 1
+    assert len(follows_statements) == 1
+    assert follows_statements[0].lstrip().upper().startswith("INSERT")
+
+
+def test_기존_DB의_중복_팔로우는_부트스트랩에서_정리하고_유니크_인덱스를_만든다(tmp_path):
+    engine = build_engine(Settings(database_url=f"sqlite:///{tmp_path / 'legacy.db'}"))
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ux_follows_follower_followee"))
+        conn.execute(
+            text(
+                "INSERT INTO users (email, username, hashed_password) "
+                "VALUES ('a', 'a', 'x'), ('b', 'b', 'x')"
+            )
+        )
+        conn.execute(
+            text("INSERT INTO follows (follower_id, followee_id) VALUES (1, 2), (1, 2), (1, 2)")
+        )
+        conn.execute(text("UPDATE users SET followers_count = 3 WHERE id = 2"))
+
+    create_db_and_tables(engine)
+
+    with Session(engine) as session:
+        rows = session.exec(select(func.count()).select_from(Follow)).one()
+        followers_count = session.get(User, 2).followers_count
+    indexes = {index["name"]: index for index in inspect(engine).get_indexes("follows")}
+    assert (rows, followers_count) == (1, 1)
+    assert indexes["ux_follows_follower_followee"]["unique"]
+    engine.dispose()
+
+
+def test_유니크_인덱스가_있으면_부트스트랩에서_중복_정리를_하지_않는다(tmp_path):
+    engine = build_engine(Settings(database_url=f"sqlite:///{tmp_path / 'current.db'}"))
+    create_db_and_tables(engine)
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda conn, cursor, sql, *args: statements.append(sql)
+    )
+
+    create_db_and_tables(engine)
+
+    assert not any(sql.lstrip().upper().startswith("DELETE") for sql in statements)
+    engine.dispose()
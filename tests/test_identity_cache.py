@@ -0,0 +1,76 @@
+from app.core.identity_cache import IdentityCache
+from app.models.user_model import User
+from tests.conftest import Status
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_같은_토큰의_두번째_요청은_유저를_다시_조회하지_않는다(auth_api, query_recorder):
+    auth_api.register()
+    auth_api.userinfo()
+
+    with query_recorder:
+        결과 = auth_api.userinfo()
+
+    assert Status.of(결과) == Status.SUCCESS
+    assert query_recorder.count == 0
+
+
+def test_정보를_수정하면_같은_토큰으로도_바뀐_정보가_보인다(auth_api):
+    auth_api.register()
+    auth_api.userinfo()
+
+    수정_결과 = auth_api.update(bio="new bio")
+    조회_결과 = auth_api.userinfo()
+
+    assert Status.of(수정_결과) == Status.SUCCESS
+    assert 조회_결과.json()["user"]["bio"] == "new bio"
+
+
+def test_캐시된_유저로도_정보를_수정할_수_있다(auth_api):
+    auth_api.register()
+    auth_api.userinfo()
+
+    auth_api.update(email="changed@example.com")
+    auth_api.update(bio="second")
+    조회_결과 = auth_api.userinfo().json()["user"]
+
+    assert 조회_결과["email"] == "changed@example.com"
+    assert 조회_결과["bio"] == "second"
+
+
+def test_적중_통계를_메트릭으로_노출한다(auth_api, client):
+    auth_api.register()
+    auth_api.userinfo()
+    auth_api.userinfo()
+
+    통계 = client.get("/metrics").json()["identityCache"]
+
+    assert 통계 == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_캐시_항목은_토큰_만료_시각을_넘기지_않는다():
+    clock = FakeClock()
+    cache = IdentityCache(maxsize=10, ttl=60, clock=clock)
+    cache.put("token", User(id=1, email="a@b.c", username="a", hashed_password="x"), clock.now + 5)
+
+    clock.now += 4
+    assert cache.get("token").username == "a"
+    clock.now += 2
+    assert cache.get("token") is None
+
+
+def test_가장_오래_쓰지_않은_항목부터_내보낸다():
+    cache = IdentityCache(maxsize=2, ttl=60)
+    for user_id in (1, 2, 3):
+        user = User(id=user_id, email=f"{user_id}@b.c", username=str(user_id), hashed_password="x")
+        cache.put(f"token{user_id}", user, token_exp=float("inf"))
+
+    assert cache.get("token1") is None
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,98 @@
+import pytest
+
+from app.core.config import Settings
+from app.core.rate_limit import InMemoryRateLimitBackend, TokenBucketRule, build_login_throttle
+from app.main import app
+from tests.conftest import Status
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class DenyAllBackend:
+    def consume(self, key, rule):
+        return 42.0
+
+
+@pytest.fixture
+def verify_calls(monkeypatch):
+    """비밀번호 검증이 실제로 몇 번 호출됐는지 기록"""
+    import app.services.user_service as user_service
+
+    calls = []
+    original = user_service.verify_password
+
+    def spy(password, hashed_password):
+        calls.append(password)
+        return original(password, hashed_password)
+
+    monkeypatch.setattr(user_service, "verify_password", spy)
+    return calls
+
+
+def test_같은_이메일로_한도를_넘게_시도하면_비밀번호를_검증하지_않고_429를_반환한다(
+    auth_api, verify_calls
+):
+    auth_api.register()
+    burst = app.state.settings.login_email_burst
+
+    결과들 = [auth_api.login(password="wrong_password") for _ in range(burst + 1)]
+
+    assert [Status.of(결과) for 결과 in 결과들[:burst]] == [Status.VALIDATION_ERROR] * burst
+    assert Status.of(결과들[-1]) == Status.TOO_MANY_REQUESTS
+    assert int(결과들[-1].headers["Retry-After"]) > 0
+    assert len(verify_calls) == burst
+
+
+def test_다른_이메일의_로그인은_제한되지_않는다(auth_api):
+    auth_api.register()
+    for _ in range(app.state.settings.login_email_burst + 1):
+        auth_api.login(email="attacker-target@example.com")
+
+    결과 = auth_api.login()
+
+    assert Status.of(결과) == Status.SUCCESS
+
+
+def test_같은_IP에서_여러_이메일로_시도해도_IP_한도에_걸린다(auth_api):
+    burst = app.state.settings.login_ip_burst
+
+    결과들 = [auth_api.login(email=f"user{n}@example.com") for n in range(burst + 1)]
+
+    assert Status.of(결과들[-2]) == Status.VALIDATION_ERROR
+    assert Status.of(결과들[-1]) == Status.TOO_MANY_REQUESTS
+
+
+def test_공유_저장소_backend로_바꿔_끼울_수_있다(auth_api):
+    app.state.login_throttle = build_login_throttle(Settings(), DenyAllBackend())
+
+    결과 = auth_api.login()
+
+    assert Status.of(결과) == Status.TOO_MANY_REQUESTS
+    assert 결과.headers["Retry-After"] == "42"
+
+
+def test_토큰은_시간이_지나면_다시_채워진다():
+    clock = FakeClock()
+    backend = InMemoryRateLimitBackend(max_keys=10, clock=clock)
+    rule = TokenBucketRule(capacity=2, refill_per_second=0.5)
+
+    assert [backend.consume("k", rule) for _ in range(2)] == [0, 0]
+    assert backend.consume("k", rule) == pytest.approx(2.0)
+    clock.now += 2
+    assert backend.consume("k", rule) == 0
+
+
+def test_버킷_수는_max_keys를_넘지_않는다():
+    backend = InMemoryRateLimitBackend(max_keys=3)
+    rule = TokenBucketRule(capacity=1, refill_per_second=1)
+
+    for n in range(10):
+        backend.consume(f"key{n}", rule)
+
+    assert len(backend) == 3
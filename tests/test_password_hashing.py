@@ -0,0 +1,89 @@
+import pytest
+
+from app.core import password_hashing
+from app.core.config import Settings, get_settings
+from app.core.exceptions import PasswordHashingBusyException
+from app.core.password_hashing import Argon2Params, calibrate
+from app.repositories.user_repository import UserRepository
+from tests.fixtures.auth_fixtures import AuthAPI
+
+FAST_PARAMS = {"argon2_time_cost": 1, "argon2_memory_cost": 1024, "argon2_parallelism": 1}
+
+
+@pytest.fixture
+def configure_hashing():
+    """해싱 풀 설정을 바꾸고 테스트가 끝나면 기본 설정으로 되돌린다"""
+    yield lambda **overrides: password_hashing.configure(Settings(**overrides))
+    password_hashing.configure(get_settings())
+
+
+def test_해싱_대기열이_가득_차면_503을_반환한다(client, configure_hashing):
+    pool = configure_hashing(password_hash_workers=0, password_hash_max_pending=1, **FAST_PARAMS)
+    pool._slots.acquire()  # 실행 중인 해싱 작업 하나로 대기열을 채운다
+    try:
+        결과 = AuthAPI(client).register()
+    finally:
+        pool._slots.release()
+
+    assert 결과.status_code == 503
+    assert AuthAPI(client).register().status_code == 201
+
+
+def test_Argon2_파라미터가_강해지면_로그인할_때_새_파라미터로_다시_해싱한다(
+    client, session, configure_hashing
+):
+    configure_hashing(password_hash_workers=0, **FAST_PARAMS)
+    auth = AuthAPI(client)
+    auth.register()
+    configure_hashing(password_hash_workers=0, **{**FAST_PARAMS, "argon2_time_cost": 2})
+
+    로그인_결과 = auth.login()
+
+    assert 로그인_결과.status_code == 200
+    hashed = UserRepository(session).get_by_email("test@example.com").hashed_password
+    assert "m=1024,t=2,p=1" in hashed
+    assert auth.login().status_code == 200
+
+
+def test_현재보다_강한_해시는_다시_해싱하지_않는다(configure_hashing):
+    stronger = configure_hashing(password_hash_workers=0, **{**FAST_PARAMS, "argon2_time_cost": 2})
+    hashed = stronger.hash("password")
+    pool = configure_hashing(password_hash_workers=0, **FAST_PARAMS)
+
+    assert pool.needs_rehash(hashed) is False
+    assert pool.needs_rehash(pool.hash("password")) is False
+
+
+def test_parallelism이_낮은_해시는_다시_해싱한다(configure_hashing):
+    hashed = configure_hashing(password_hash_workers=0, **FAST_PARAMS).hash("password")
+    pool = configure_hashing(password_hash_workers=0, **{**FAST_PARAMS, "argon2_parallelism": 2})
+
+    assert pool.needs_rehash(hashed) is True
+
+
+def test_재해싱할_때_해싱_풀이_바쁘면_건너뛰고_로그인은_성공한다(
+    client, session, configure_hashing, monkeypatch
+):
+    import app.services.user_service as user_service
+
+    configure_hashing(password_hash_workers=0, **FAST_PARAMS)
+    auth = AuthAPI(client)
+    auth.register()
+    기존_해시 = UserRepository(session).get_by_email("test@example.com").hashed_password
+    configure_hashing(password_hash_workers=0, **{**FAST_PARAMS, "argon2_time_cost": 2})
+
+    def busy(password):
+        raise PasswordHashingBusyException()
+
+    monkeypatch.setattr(user_service, "hash_password", busy)
+    로그인_결과 = auth.login()
+
+    assert 로그인_결과.status_code == 200
+    assert UserRepository(session).get_by_email("test@example.com").hashed_password == 기존_해시
+
+
+def test_보정하면_목표_시간에_맞는_time_cost를_고른다():
+    params = Argon2Params(time_cost=3, memory_cost=1024, parallelism=1)
+
+    assert calibrate(params, target_ms=0).time_cost == 1
+    assert calibrate(params, target_ms=10**6).time_cost == password_hashing.MAX_CALIBRATED_TIME_COST
@@ -0,0 +1,110 @@
+from tests.conftest import Status
+from tests.fixtures.auth_fixtures import AuthAPI
+
+
+def _유저_등록(client, username):
+    auth = AuthAPI(client)
+    auth.register(email=f"{username}@example.com", username=username)
+    return auth
+
+
+def test_팔로우하면_양쪽_카운트가_바뀐다(client):
+    유저1 = _유저_등록(client, "user1")
+    _유저_등록(client, "user2")
+
+    팔로우_결과 = 유저1.follow("user2").json()["profile"]
+    내_프로필 = 유저1.get_profile("user1").json()["profile"]
+    언팔로우_결과 = 유저1.unfollow("user2").json()["profile"]
+
+    assert 팔로우_결과["followersCount"] == 1
+    assert 내_프로필["followingCount"] == 1
+    assert 언팔로우_결과["followersCount"] == 0
+
+
+def test_이미_팔로우한_유저를_다시_팔로우해도_카운트는_그대로다(client):
+    유저1 = _유저_등록(client, "user1")
+    _유저_등록(client, "user2")
+
+    유저1.follow("user2")
+    결과 = 유저1.follow("user2")
+
+    assert 결과.json()["profile"]["followersCount"] == 1
+
+
+def test_팔로워_목록을_최근_팔로우_순으로_커서로_이어서_조회한다(client):
+    _유저_등록(client, "star")
+    for n in range(5):
+        _유저_등록(client, f"fan{n}").follow("star")
+    게스트 = AuthAPI(client)
+
+    첫_페이지 = 게스트.followers("star", limit=3).json()
+    다음_페이지 = 게스트.followers("star", limit=3, cursor=첫_페이지["nextCursor"]).json()
+
+    assert [p["username"] for p in 첫_페이지["profiles"]] == ["fan4", "fan3", "fan2"]
+    assert [p["username"] for p in 다음_페이지["profiles"]] == ["fan1", "fan0"]
+    assert 다음_페이지["nextCursor"] is None
+
+
+def test_팔로잉_목록에는_요청한_유저의_팔로우_여부가_담긴다(client):
+    유저1 = _유저_등록(client, "user1")
+    유저2 = _유저_등록(client, "user2")
+    _유저_등록(client, "user3")
+    유저2.follow("user1")
+    유저2.follow("user3")
+    유저1.follow("user3")
+
+    결과 = 유저1.following("user2").json()
+
+    assert {p["username"]: p["following"] for p in 결과["profiles"]} == {
+        "user3": True,
+        "user1": False,
+    }
+
+
+def test_잘못된_커서로_팔로워_목록을_조회하면_422를_반환한다(client):
+    _유저_등록(client, "user1")
+
+    결과 = AuthAPI(client).followers("user1", cursor="not-a-cursor")
+
+    assert Status.of(결과) == Status.VALIDATION_ERROR
+
+
+def test_없는_유저의_팔로워_목록은_404를_반환한다(client):
+    결과 = AuthAPI(client).followers("nobody")
+
+    assert Status.of(결과) == Status.NOT_FOUND
+
+
+def test_여러_프로필을_요청한_순서대로_한번에_조회한다(client):
+    유저1 = _유저_등록(client, "user1")
+    _유저_등록(client, "user2")
+    _유저_등록(client, "user3")
+    유저1.follow("user3")
+
+    결과 = 유저1.get_profiles("user3", "nobody", "user2", "user3")
+
+    assert Status.of(결과) == Status.SUCCESS
+    assert [(p["username"], p["following"]) for p in 결과.json()["profiles"]] == [
+        ("user3", True),
+        ("user2", False),
+    ]
+
+
+def test_여러_프로필_조회는_유저_수와_무관하게_쿼리_두번이다(client, query_recorder):
+    유저1 = _유저_등록(client, "user1")
+    names = [f"member{n}" for n in range(5)]
+    for name in names:
+        _유저_등록(client, name)
+    유저1.get_profiles("user1")  # 인증 캐시를 채워 둔다
+
+    with query_recorder:
+        결과 = 유저1.get_profiles(*names)
+
+    assert len(결과.json()["profiles"]) == 5
+    assert query_recorder.count == 2
+
+
+def test_한번에_조회할_수_있는_프로필_수에는_상한이_있다(client):
+    결과 = AuthAPI(client).get_profiles(*(f"user{n}" for n in range(101)))
+
+    assert Status.of(결과) == Status.VALIDATION_ERROR
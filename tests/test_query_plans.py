@@ -0,0 +1,106 @@
+"""리포지토리 쿼리가 풀 테이블 스캔 없이 인덱스를 타는지 EXPLAIN QUERY PLAN으로 검증"""
+
+import re
+
+import pytest
+from sqlalchemy import inspect
+from sqlmodel import SQLModel, create_engine, text
+
+from app.core.database import create_db_and_tables
+from app.core.pagination import decode_cursor
+from app.repositories.article_repository import ArticleRepository, SingleQueryArticleRepository
+from app.repositories.comment_repository import CommentRepository
+from app.repositories.favorite_repository import FavoriteRepository
+from app.repositories.follow_repository import FollowRepository
+from app.repositories.tag_repository import TagRepository
+from app.repositories.timeline_repository import TimelineRepository
+from app.repositories.user_repository import UserRepository
+from tests.conftest import ARTICLE_PAYLOAD
+
+TABLES = {table.name for table in SQLModel.metadata.sorted_tables}
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+REPOSITORY_QUERIES = {
+    "follow.is_following": lambda s: FollowRepository(s).is_following(1, 2),
+    "follow.get_followee_ids": lambda s: FollowRepository(s).get_followee_ids(1, {2, 3}),
+    "follow.followers": lambda s: FollowRepository(s).get_followers(1, limit=20, cursor=100),
+    "follow.following": lambda s: FollowRepository(s).get_following(1, limit=20, cursor=100),
+    "comment.get_by_article_id": lambda s: CommentRepository(s).get_by_article_id(1),
+    "comment.with_relations": lambda s: CommentRepository(s).get_with_relations(1, 1, limit=20),
+    "comment.with_relations_cursor": lambda s: CommentRepository(s).get_with_relations(
+        1, limit=20, cursor=decode_cursor("MjAyNi0wMS0wMVQwMDowMDowMHwx")
+    ),
+    "favorite.is_favorited": lambda s: FavoriteRepository(s).is_favorited(1, 1),
+    "favorite.count_by_article": lambda s: FavoriteRepository(s).count_by_article(1),
+    "tag.get_tags_for_article": lambda s: TagRepository(s).get_tags_for_article(1),
+    "tag.popular": lambda s: TagRepository(s).get_all_tags(limit=10),
+    "user.get_by_username": lambda s: UserRepository(s).get_by_username("user1"),
+    "user.get_by_usernames": lambda s: UserRepository(s).get_by_usernames(["user1", "user2"]),
+    "article.list": lambda s: ArticleRepository(s).get_all_with_relations(
+        current_user_id=1, limit=20
+    ),
+    "article.list_cursor": lambda s: ArticleRepository(s).get_all_with_relations(
+        limit=20, cursor=decode_cursor("MjAyNi0wMS0wMVQwMDowMDowMHwx")
+    ),
+    "article.by_author": lambda s: ArticleRepository(s).get_all_with_relations(
+        author="user1", limit=20
+    ),
+    "article.by_tag": lambda s: ArticleRepository(s).get_all_with_relations(tag="python", limit=20),
+    "article.by_favorited": lambda s: ArticleRepository(s).get_all_with_relations(
+        favorited="user1", limit=20
+    ),
+    "article.feed": lambda s: ArticleRepository(s).get_all_with_relations(followed_by=1, limit=20),
+    "article.count_by_tag": lambda s: ArticleRepository(s).count_all(tag="python"),
+    "article.single_query": lambda s: SingleQueryArticleRepository(s).get_all_with_relations(
+        current_user_id=1, limit=20
+    ),
+    "timeline.feed": lambda s: TimelineRepository(s, 1000, 100).get_feed_article_ids(1, limit=20),
+    "timeline.remove_author": lambda s: TimelineRepository(s, 1000, 100).remove_author(1, 2),
+    "timeline.remove_article": lambda s: TimelineRepository(s, 1000, 100).remove_article(1),
+}
+
+
+def _full_scans(session, statement, parameters):
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [
+        detail
+        for *_, detail in rows
+        if (match := FULL_SCAN.match(detail)) and match.group(1) in TABLES
+    ]
+
+
+@pytest.mark.parametrize("name", REPOSITORY_QUERIES)
+def test_리포지토리_쿼리는_풀_테이블_스캔을_하지_않는다(name, session, query_recorder, 로그인_유저1_api):
+    slug = 로그인_유저1_api.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+    로그인_유저1_api.favorite(slug)
+    로그인_유저1_api.create_comment(slug, "comment")
+
+    with query_recorder:
+        REPOSITORY_QUERIES[name](session)
+
+    # 조회뿐 아니라 조건으로 행을 찾는 DELETE도 검사한다
+    searches = [
+        (statement, parameters)
+        for statement, parameters in query_recorder.statements
+        if statement.lstrip().upper().startswith(("SELECT", "WITH", "DELETE"))
+    ]
+    assert searches
+    for statement, parameters in searches:
+        assert _full_scans(session, statement, parameters) == [], statement
+
+
+def test_기존_DB에_없는_인덱스는_부트스트랩에서_생성한다(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_favorite_article_id"))
+        conn.execute(text("DROP INDEX ux_follows_follower_followee"))
+        conn.execute(text("DROP INDEX ix_timeline_article_id"))
+
+    create_db_and_tables(engine)
+
+    inspector = inspect(engine)
+    assert "ix_favorite_article_id" in {i["name"] for i in inspector.get_indexes("favorite")}
+    assert "ux_follows_follower_followee" in {i["name"] for i in inspector.get_indexes("follows")}
+    assert "ix_timeline_article_id" in {i["name"] for i in inspector.get_indexes("timeline")}
+    engine.dispose()
@@ -0,0 +1,99 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel
+
+from app.core.config import Settings
+from app.core.database import build_engine, build_replica_engine, get_replica_engine, get_session
+from app.core.replica import ReadYourWritesTracker
+from app.jobs.sync_replica import sync_replica
+from app.main import create_app
+from tests.conftest import ARTICLE_PAYLOAD
+from tests.fixtures.article_fixtures import ArticleAPI
+from tests.fixtures.auth_fixtures import AuthAPI
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def replica_env(tmp_path):
+    """primary/replica 두 SQLite 파일을 쓰는 앱"""
+    settings = Settings(
+        database_url=f"sqlite:///{tmp_path / 'primary.db'}",
+        replica_database_url=f"sqlite:///{tmp_path / 'replica.db'}",
+    )
+    primary = build_engine(settings)
+    replica = build_replica_engine(settings)
+    SQLModel.metadata.create_all(primary)
+    sync_replica(primary, replica)
+
+    def get_session_override():
+        with Session(primary) as session:
+            yield session
+
+    app = create_app(settings)
+    clock = FakeClock()
+    app.state.read_your_writes = ReadYourWritesTracker(settings.read_your_writes_seconds, clock)
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_replica_engine] = lambda: replica
+
+    yield TestClient(app), primary, replica, clock
+    primary.dispose()
+    replica.dispose()
+
+
+def _로그인(client, email, username):
+    auth = AuthAPI(client)
+    auth.register(email=email, password="password123", username=username)
+    return ArticleAPI(client, token=auth.token)
+
+
+def test_복제본에_반영되기_전에는_다른_유저에게_보이지_않는다(replica_env):
+    client, primary, replica, _ = replica_env
+    작성자 = _로그인(client, "user1@example.com", "user1")
+    작성자.create(ARTICLE_PAYLOAD)
+
+    assert ArticleAPI(client).list().json()["articlesCount"] == 0
+
+    sync_replica(primary, replica)
+
+    assert ArticleAPI(client).list().json()["articlesCount"] == 1
+
+
+def test_쓰기_직후에는_작성자가_primary에서_읽는다(replica_env):
+    client, _, _, clock = replica_env
+    작성자 = _로그인(client, "user1@example.com", "user1")
+
+    slug = 작성자.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+
+    assert 작성자.list().json()["articlesCount"] == 1
+    assert 작성자.get(slug).status_code == 200
+
+    clock.now += 10  # 고정 시간이 지나면 다시 복제본에서 읽는다
+
+    assert 작성자.list().json()["articlesCount"] == 0
+
+
+def test_실패한_쓰기는_primary에_고정하지_않는다(replica_env):
+    client, _, _, _ = replica_env
+    유저 = _로그인(client, "user1@example.com", "user1")
+
+    assert 유저.delete("missing-slug").status_code == 404
+    assert not client.app.state.read_your_writes.is_pinned(1)
+
+
+def test_태그가_바뀌면_복제본에서_읽은_태그_캐시도_비운다(replica_env):
+    client, primary, replica, _ = replica_env
+    작성자 = _로그인(client, "user1@example.com", "user1")
+    게스트 = ArticleAPI(client)
+    게스트.list_tags()  # 복제본 엔진의 캐시에 빈 목록
+
+    작성자.create({"article": {**ARTICLE_PAYLOAD["article"], "tagList": ["python"]}})
+    sync_replica(primary, replica)
+
+    assert 게스트.list_tags().json()["tags"] == ["python"]
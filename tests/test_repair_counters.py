@@ -0,0 +1,66 @@
+from sqlmodel import Session, SQLModel, create_engine, text
+
+from app.core.database import create_db_and_tables
+from app.jobs.repair_counters import repair_counters
+from app.models.article_model import Article
+from app.models.favorite_model import Favorite
+from app.models.user_model import User
+from tests.conftest import ARTICLE_PAYLOAD
+from tests.fixtures.auth_fixtures import AuthAPI
+
+
+def test_어긋난_좋아요_카운터를_원본_기준으로_복구한다(session, 로그인_유저1_api):
+    slug = 로그인_유저1_api.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+    로그인_유저1_api.favorite(slug)
+    session.exec(text("UPDATE articles SET favorites_count = 42"))
+    session.commit()
+
+    결과 = repair_counters(session)
+
+    assert 결과["articles.favorites_count"] == 1
+    assert 로그인_유저1_api.get(slug).json()["article"]["favoritesCount"] == 1
+
+
+def test_어긋난_댓글_카운터를_원본_기준으로_복구한다(session, 로그인_유저1_api):
+    slug = 로그인_유저1_api.create(ARTICLE_PAYLOAD).json()["article"]["slug"]
+    로그인_유저1_api.create_comment(slug, "comment")
+    session.exec(text("UPDATE articles SET comments_count = 0"))
+    session.commit()
+
+    결과 = repair_counters(session)
+
+    assert 결과["articles.comments_count"] == 1
+    assert 로그인_유저1_api.get(slug).json()["article"]["commentsCount"] == 1
+
+
+def test_어긋난_팔로우_카운터를_원본_기준으로_복구한다(session, client):
+    유저1 = AuthAPI(client)
+    유저1.register(email="user1@example.com", username="user1")
+    AuthAPI(client).register(email="user2@example.com", username="user2")
+    유저1.follow("user2")
+    session.exec(text("UPDATE users SET followers_count = 5, following_count = 0"))
+    session.commit()
+
+    결과 = repair_counters(session)
+
+    assert 결과["users.followers_count"] == 2
+    assert 결과["users.following_count"] == 1
+    assert 유저1.get_profile("user2").json()["profile"]["followersCount"] == 1
+
+
+def test_기존_DB에_카운터_컬럼이_없으면_추가하고_값을_채운다(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(User(email="a@example.com", username="a", hashed_password="x"))
+        session.add(Article(slug="s", title="t", description="d", body="b", author_id=1))
+        session.add(Favorite(user_id=1, article_id=1))
+        session.commit()
+        session.exec(text("ALTER TABLE articles DROP COLUMN favorites_count"))
+        session.commit()
+
+    create_db_and_tables(engine)
+
+    with Session(engine) as session:
+        assert session.get(Article, 1).favorites_count == 1
+    engine.dispose()
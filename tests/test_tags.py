@@ -1,3 +1,8 @@
+import re
+
+import pytest
+
+from app.repositories.tag_repository import TagRepository
 from tests.conftest import Status
 
 
@@ -25,3 +30,76 @@ def test_태그가_없으면_빈_목록을_반환한다(게스트_api):
 
     assert Status.of(결과) == Status.SUCCESS
     assert 결과.json()["tags"] == []
+
+
+def _태그_글(title, tags):
+    return {"article": {"title": title, "description": "Desc", "body": "Body", "tagList": tags}}
+
+
+def test_같은_태그를_중복으로_보내도_한_번만_붙는다(로그인_유저1_api):
+    결과 = 로그인_유저1_api.create(_태그_글("Dup", ["python", "python", "fastapi"]))
+
+    assert Status.of(결과) == Status.CREATED
+    assert sorted(로그인_유저1_api.get("dup").json()["article"]["tagList"]) == ["fastapi", "python"]
+
+
+def test_이미_쓴_태그는_DB_조회_없이_캐시에서_찾는다(로그인_유저1_api, query_recorder):
+    로그인_유저1_api.create(_태그_글("First", ["python", "fastapi"]))
+
+    with query_recorder:
+        로그인_유저1_api.create(_태그_글("Second", ["fastapi", "python"]))
+
+    tag_queries = [s for s, _ in query_recorder.statements if re.search(r"\b(FROM|INTO) tag\b", s)]
+    assert tag_queries == []
+    assert sorted(로그인_유저1_api.list_tags().json()["tags"]) == ["fastapi", "python"]
+
+
+def test_롤백된_태그_id는_캐시에_남지_않는다(로그인_유저1_api, monkeypatch):
+    add_tags = TagRepository.add_tags_to_article
+
+    def add_then_fail(self, article_id, tag_names):
+        add_tags(self, article_id, tag_names)
+        raise RuntimeError("fail after tag insert")
+
+    monkeypatch.setattr(TagRepository, "add_tags_to_article", add_then_fail)
+    with pytest.raises(RuntimeError):
+        로그인_유저1_api.create(_태그_글("First", ["python"]))
+    monkeypatch.undo()
+
+    결과 = 로그인_유저1_api.create(_태그_글("Second", ["python"]))
+
+    assert Status.of(결과) == Status.CREATED
+    assert 로그인_유저1_api.list_tags().json()["tags"] == ["python"]
+
+
+def test_태그는_많이_쓰인_순으로_limit개까지_반환한다(로그인_유저1_api):
+    로그인_유저1_api.create(_태그_글("A", ["python", "fastapi"]))
+    로그인_유저1_api.create(_태그_글("B", ["python", "sqlite"]))
+    로그인_유저1_api.create(_태그_글("C", ["python", "sqlite"]))
+
+    assert 로그인_유저1_api.list_tags().json()["tags"] == ["python", "sqlite", "fastapi"]
+    assert 로그인_유저1_api.list_tags(limit=2).json()["tags"] == ["python", "sqlite"]
+
+
+def test_글을_삭제하면_태그_사용량이_줄고_안_쓰는_태그는_빠진다(로그인_유저1_api):
+    로그인_유저1_api.create(_태그_글("A", ["python", "fastapi"]))
+    로그인_유저1_api.create(_태그_글("B", ["fastapi"]))
+    로그인_유저1_api.list_tags()  # 캐시 채우기
+
+    로그인_유저1_api.delete("a")
+
+    assert 로그인_유저1_api.list_tags().json()["tags"] == ["fastapi"]
+
+
+def test_ETag가_같으면_304를_반환하고_태그가_바뀌면_새로_내려준다(로그인_유저1_api):
+    로그인_유저1_api.create(_태그_글("A", ["python"]))
+    etag = 로그인_유저1_api.list_tags().headers["ETag"]
+
+    재검증 = 로그인_유저1_api.list_tags(etag=etag)
+    로그인_유저1_api.create(_태그_글("B", ["fastapi"]))
+    변경_후 = 로그인_유저1_api.list_tags(etag=etag)
+
+    assert 재검증.status_code == 304
+    assert 변경_후.status_code == 200
+    assert 변경_후.headers["ETag"] != etag
+    assert sorted(변경_후.json()["tags"]) == ["fastapi", "python"]
@@ -0,0 +1,46 @@
+import time
+
+import jwt
+
+from app.core.security import ALGORITHM, SECRET_KEY, issue_access_token, verify_token
+from tests.conftest import Status
+
+
+def test_내_정보_조회는_요청한_토큰을_그대로_돌려준다(auth_api):
+    auth_api.register()
+    가입_토큰 = auth_api.token
+
+    결과 = auth_api.userinfo()
+
+    assert 결과.json()["user"]["token"] == 가입_토큰
+
+
+def test_다시_로그인해도_수명이_충분한_토큰을_재사용한다(auth_api):
+    auth_api.register()
+    가입_토큰 = auth_api.token
+
+    결과 = auth_api.login()
+
+    assert Status.of(결과) == Status.SUCCESS
+    assert 결과.json()["user"]["token"] == 가입_토큰
+
+
+def test_username을_바꾸면_새_토큰을_발급한다(auth_api):
+    auth_api.register()
+    가입_토큰 = auth_api.token
+
+    새_토큰 = auth_api.update(username="renamed").json()["user"]["token"]
+
+    assert 새_토큰 != 가입_토큰
+    assert verify_token(새_토큰)["username"] == "renamed"
+
+
+def test_만료가_가까운_토큰은_새로_서명한다():
+    만료_임박 = jwt.encode(
+        {"user_id": 1, "username": "user1", "exp": int(time.time()) + 60}, SECRET_KEY, ALGORITHM
+    )
+
+    발급된_토큰 = issue_access_token(1, "user1", 만료_임박)
+
+    assert 발급된_토큰 != 만료_임박
+    assert verify_token(발급된_토큰)["exp"] > time.time() + 60
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import event
+
+from app.repositories.tag_repository import TagRepository
+from tests.conftest import Status
+
+TAGGED_PAYLOAD = {
+    "article": {
+        "title": "Tagged",
+        "description": "Desc",
+        "body": "Body",
+        "tagList": ["python", "fastapi", "sqlite"],
+    }
+}
+
+
+@pytest.fixture
+def commit_counter(session):
+    commits = []
+    listener = lambda session: commits.append(session)  # noqa: E731
+    event.listen(session, "after_commit", listener)
+    yield commits
+    event.remove(session, "after_commit", listener)
+
+
+def test_태그가_있는_글_작성은_한_번만_커밋한다(로그인_유저1_api, commit_counter):
+    작성_결과 = 로그인_유저1_api.create(TAGGED_PAYLOAD)
+
+    assert Status.of(작성_결과) == Status.CREATED
+    assert len(commit_counter) == 1
+
+
+def test_작성_도중_실패하면_글과_태그가_모두_롤백된다(로그인_유저1_api, monkeypatch):
+    def fail(self, article_id, tag_names):
+        raise RuntimeError("tag insert failed")
+
+    monkeypatch.setattr(TagRepository, "add_tags_to_article", fail)
+
+    with pytest.raises(RuntimeError):
+        로그인_유저1_api.create(TAGGED_PAYLOAD)
+
+    monkeypatch.undo()
+    assert 로그인_유저1_api.list().json()["articlesCount"] == 0
+    assert 로그인_유저1_api.list_tags().json()["tags"] == []